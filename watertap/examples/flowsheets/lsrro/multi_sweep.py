@@ -20,7 +20,11 @@ from pyomo.environ import (
     Param,
 )
 
-from watertap.tools.parameter_sweep import LinearSample, parameter_sweep
+from watertap.tools.parameter_sweep import (
+    LinearSample,
+    parameter_sweep,
+    batch_parameter_sweep,
+)
 from watertap.examples.flowsheets.lsrro import lsrro
 
 
@@ -46,37 +50,14 @@ def _lsrro_presweep(
     return m
 
 
-def run_case(number_of_stages, nx, output_filename=None):
+def _lsrro_sweep_params(m, nx):
     """
-    Run the parameter sweep tool on the LSRRO flowsheet, sweeping over feed
-    concentration from 5 to 250 kg/m^3 and water recovery from 30% to 90%.
-
-    Arguments
-    ---------
-    number_of_stages (int) : The number of LSRRO Stages (including the initial RO stage).
-    nx (int) : The number of points for both feed concentration and water recovery. The
-               total number of points swept will be nx^2.
-    output_filename (str, optional): The place to write the parameter sweeep results
-               csv file. By default it is
-               ./param_sweep_output/{number_of_stages}_stage/results_LSRRO.csv
-
-    Returns
-    -------
-    global_results (numpy array) : The raw values from the parameter sweep
-    sweep_params (dict) : The dictionary of samples
-    model (Pyomo ConcreteModel) : The LSRRO flowsheet used for parameter sweeps
-
+    Returns the sweep parameters of the LSRRO flowsheet ``m``: ``nx`` feed
+    concentrations from 5 to 250 kg/m^3 and ``nx`` water recoveries from 30%
+    to 90%.
     """
 
-    if output_filename is None:
-        output_filename = (
-            f"param_sweep_output/{number_of_stages}_stage/results_LSRRO.csv"
-        )
-
     sweep_params = {}
-    outputs = {}
-
-    m = _lsrro_presweep(number_of_stages=number_of_stages)
 
     # Sweep parameters ------------------------------------------------------------------------
 
@@ -88,6 +69,16 @@ def run_case(number_of_stages, nx, output_filename=None):
         m.fs.water_recovery, 0.3, 0.9, nx
     )
 
+    return sweep_params
+
+
+def _lsrro_outputs(m):
+    """
+    Returns the outputs of the parameter sweeps of the LSRRO flowsheet ``m``.
+    """
+
+    outputs = {}
+
     # Outputs  -------------------------------------------------------------------------------
     outputs["LCOW"] = m.fs.costing.LCOW
     outputs["LCOW wrt Feed Flow"] = m.fs.costing.LCOW_feed
@@ -360,6 +351,40 @@ def run_case(number_of_stages, nx, output_filename=None):
         }
     )
 
+    return outputs
+
+
+def run_case(number_of_stages, nx, output_filename=None):
+    """
+    Run the parameter sweep tool on the LSRRO flowsheet, sweeping over feed
+    concentration from 5 to 250 kg/m^3 and water recovery from 30% to 90%.
+
+    Arguments
+    ---------
+    number_of_stages (int) : The number of LSRRO Stages (including the initial RO stage).
+    nx (int) : The number of points for both feed concentration and water recovery. The
+               total number of points swept will be nx^2.
+    output_filename (str, optional): The place to write the parameter sweeep results
+               csv file. By default it is
+               ./param_sweep_output/{number_of_stages}_stage/results_LSRRO.csv
+
+    Returns
+    -------
+    global_results (numpy array) : The raw values from the parameter sweep
+    sweep_params (dict) : The dictionary of samples
+    model (Pyomo ConcreteModel) : The LSRRO flowsheet used for parameter sweeps
+
+    """
+
+    if output_filename is None:
+        output_filename = (
+            f"param_sweep_output/{number_of_stages}_stage/results_LSRRO.csv"
+        )
+
+    m = _lsrro_presweep(number_of_stages=number_of_stages)
+    sweep_params = _lsrro_sweep_params(m, nx)
+    outputs = _lsrro_outputs(m)
+
     global_results = parameter_sweep(
         m,
         sweep_params,
@@ -372,7 +397,58 @@ def run_case(number_of_stages, nx, output_filename=None):
     return global_results, sweep_params, m
 
 
+def run_all_cases(
+    nx, stages=range(1, 9), output_dir="param_sweep_output", mpi_comm=None
+):
+    """
+    Run the parameter sweep of ``run_case`` for every number of stages in
+    ``stages`` as a batch, so that the cases run concurrently on the available
+    MPI ranks instead of one after another. The cases with more stages, which
+    take longer to solve, are scheduled first.
+
+    Arguments
+    ---------
+    nx (int) : The number of points for both feed concentration and water recovery. The
+               total number of points swept will be nx^2 per case.
+    stages (iterable of int, optional) : The numbers of LSRRO Stages of the cases. By
+               default all cases from 1 to 8 stages are run.
+    output_dir (str, optional): The directory to write the parameter sweep results csv
+               files to, as {output_dir}/{number_of_stages}_stage/results_LSRRO.csv
+    mpi_comm (optional) : The MPI communicator whose ranks run the cases. By default
+               all ranks are used.
+
+    Returns
+    -------
+    global_results (list of numpy arrays) : On rank 0, the raw values from the parameter
+               sweep of every case, in the order of ``stages``. None on the other ranks.
+
+    """
+
+    jobs = [
+        {
+            "build_model": _lsrro_presweep,
+            "build_model_kwargs": {"number_of_stages": number_of_stages},
+            "build_sweep_params": _lsrro_sweep_params,
+            "build_sweep_params_kwargs": {"nx": nx},
+            "build_outputs": _lsrro_outputs,
+            "sweep_kwargs": {
+                "csv_results_file_name": os.path.join(
+                    output_dir, f"{number_of_stages}_stage", "results_LSRRO.csv"
+                ),
+                "optimize_function": lsrro.solve,
+                "interpolate_nan_outputs": True,
+            },
+            # The flowsheet, and the time to solve it, grows with the stages
+            "cost": number_of_stages * nx**2,
+        }
+        for number_of_stages in stages
+    ]
+
+    return batch_parameter_sweep(jobs, mpi_comm=mpi_comm)
+
+
 if __name__ == "__main__":
-    for n in range(1, 9):
-        global_results, sweep_params, m = run_case(number_of_stages=n, nx=4)
-        print(global_results)
+    global_results = run_all_cases(nx=4)
+    if global_results is not None:
+        for results in global_results:
+            print(results)
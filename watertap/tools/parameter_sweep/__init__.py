@@ -6,19 +6,33 @@ from watertap.tools.parameter_sweep.sampling_types import (
     UniformSample,
     NormalSample,
     LatinHypercubeSample,
+    SobolSample,
+    HaltonSample,
+    AdaptiveSample,
 )
 from watertap.tools.parameter_sweep.parameter_sweep_functions import (
     parameter_sweep,
     recursive_parameter_sweep,
 )
+from watertap.tools.parameter_sweep.parameter_sweep_batch import (
+    batch_parameter_sweep,
+)
 from watertap.tools.parameter_sweep.parameter_sweep_reader import (
     get_sweep_params_from_yaml,
+    get_outputs_from_yaml,
     set_defaults_from_yaml,
+    select_outputs,
+    ComponentNameIndex,
     ParameterSweepReader,
 )
 from watertap.tools.parameter_sweep.parameter_sweep import (
     ParameterSweep,
     RecursiveParameterSweep,
+    DifferentialParameterSweep,
+)
+from watertap.tools.parameter_sweep.parameter_sweep_writer import load_npy_results
+from watertap.tools.parameter_sweep.parameter_sweep_surrogate import (
+    ParameterSweepSurrogate,
 )
 
 # TODO: should this be removed?
@@ -13,7 +13,13 @@
 import numpy as np
 import pyomo.environ as pyo
 import warnings
-import copy, pprint
+import copy, pprint, json, contextlib, inspect
+import threading, time
+import os, re, signal, multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from scipy.linalg import lstsq
+from scipy.spatial import cKDTree
 
 from abc import abstractmethod, ABC
 from idaes.core.solvers import get_solver
@@ -21,12 +27,27 @@ from idaes.core.solvers import get_solver
 from idaes.core.surrogate.pysmo import sampling
 from pyomo.common.collections import ComponentSet, ComponentMap
 from pyomo.common.tee import capture_output
-from pyomo.common.config import ConfigValue
+from pyomo.common.numeric_types import native_numeric_types
+from pyomo.core.expr import numeric_expr, relational_expr
+from pyomo.core.expr.visitor import StreamBasedExpressionVisitor
+from pyomo.common.config import ConfigDict, ConfigValue, In, PositiveInt, PositiveFloat
+from pyomo.opt import TerminationCondition
 
 from watertap.tools.parameter_sweep.parameter_sweep_writer import ParameterSweepWriter
-from watertap.tools.parameter_sweep.sampling_types import SamplingType, LinearSample
+from watertap.tools.parameter_sweep.parameter_sweep_reader import select_outputs
+from watertap.tools.parameter_sweep.parameter_sweep_cache import ParameterSweepCache
+from watertap.tools.parameter_sweep.parameter_sweep_predictor import (
+    ParameterSweepPredictor,
+)
+from watertap.tools.parameter_sweep.sampling_types import (
+    SamplingType,
+    LinearSample,
+    adaptive_refinement_points,
+    low_discrepancy_points,
+)
 
 import watertap.tools.MPI as MPI
+from watertap.tools.MPI.dummy_mpi import DummyCOMM
 
 
 def _default_optimize(model, options=None, tee=False):
@@ -49,6 +70,872 @@ def _default_optimize(model, options=None, tee=False):
     return results
 
 
+# Termination conditions are stored as their position in this tuple
+_TERMINATION_CONDITIONS = tuple(TerminationCondition)
+
+# Per-case solver statistics recorded with solver_telemetry=True
+_SOLVER_STATS = {
+    "wall_time": "s",
+    "optimize_time": "s",
+    "reinitialize_time": "s",
+    "iterations": "None",
+    "termination_condition": "None",
+    "reinitialized": "None",
+}
+
+
+def _get_solver_iterations(results, log):
+    """
+    Returns the iteration count reported by the solver, from the results
+    object if the solver interface fills it in or else from the Ipopt log.
+    """
+
+    try:
+        iterations = results.solver.statistics.black_box.number_of_iterations
+        return float(iterations)
+    except (AttributeError, TypeError, ValueError):
+        pass
+
+    # The log is only available if the solver prints it, see _solver_log_kwargs
+    match = re.findall(r"Number of Iterations\.*:\s*(\d+)", log)
+    if match:
+        return float(match[-1])
+
+    return np.nan
+
+
+def _solver_log_kwargs(optimize_function, optimize_kwargs):
+    """
+    Returns the keyword arguments that make ``optimize_function`` print the
+    solver log, so that the iteration count can be read from it: ``tee=True``
+    if the function takes a ``tee`` argument, like the default optimization
+    function, which the user did not set in ``optimize_kwargs``.
+    """
+
+    if "tee" in optimize_kwargs:
+        return {}
+
+    try:
+        parameters = inspect.signature(optimize_function).parameters
+    except (TypeError, ValueError):
+        return {}
+
+    if "tee" in parameters:
+        return {"tee": True}
+
+    return {}
+
+
+class _CaseTimeout(Exception):
+    """
+    Raised inside a case that exceeded its case_timeout.
+    """
+
+
+class _CaseTimer:
+    """
+    Context manager that interrupts the code it wraps with a _CaseTimeout
+    once ``time_limit`` seconds of wall-clock time have passed.
+
+    The timer is a SIGALRM interval timer, so it works whatever the solver
+    options are. Solvers running as a subprocess are killed by Python's
+    subprocess module when the exception interrupts the wait for them.
+    """
+
+    def __init__(self, time_limit):
+
+        self.time_limit = time_limit
+        self.expired = False
+        self._armed = False
+        self._finished = False
+
+    @staticmethod
+    def is_supported():
+        return (
+            hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+        )
+
+    def _expire(self, signum, frame):
+        # An alarm that goes off after the case finished, before the timer
+        # was cancelled, does not interrupt anything
+        if self._finished:
+            return
+        self.expired = True
+        raise _CaseTimeout(f"The case exceeded its time limit of {self.time_limit} s.")
+
+    def finish(self):
+        """
+        Marks the case as finished, so that the timer no longer expires.
+        """
+
+        self._finished = True
+
+    def __enter__(self):
+
+        self.expired = False
+        self._finished = False
+        if self.time_limit is not None and self.is_supported():
+            self._previous_handler = signal.signal(signal.SIGALRM, self._expire)
+            signal.setitimer(signal.ITIMER_REAL, self.time_limit)
+            self._armed = True
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        if self._armed:
+            self._finished = True
+            try:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+            finally:
+                signal.signal(signal.SIGALRM, self._previous_handler)
+                self._armed = False
+
+        # The timeout is reported by the expired flag
+        return exc_type is not None and issubclass(exc_type, _CaseTimeout)
+
+
+class _DynamicScheduler:
+    """
+    Hands out chunks of global case indices to MPI ranks on demand.
+
+    Rank 0 owns a shared counter of the next unclaimed case. Other ranks
+    request a chunk whenever they run out of work. When the MPI library
+    supports ``MPI_THREAD_MULTIPLE`` the requests are serviced by a
+    lightweight polling thread on rank 0, so rank 0 also solves cases;
+    otherwise rank 0 acts purely as the coordinator.
+    """
+
+    _REQUEST_TAG = 1
+    _ASSIGN_TAG = 2
+
+    def __init__(self, comm, num_cases, chunk_size, poll_interval=1.0e-3):
+
+        self.num_cases = num_cases
+        self.chunk_size = chunk_size
+        self.poll_interval = poll_interval
+
+        self.rank = comm.Get_rank()
+        self.num_procs = comm.Get_size()
+
+        self._next_case = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+        if self.num_procs > 1:
+            # Use a private communicator so the scheduler messages cannot
+            # collide with any other point-to-point traffic
+            self.comm = comm.Dup()
+            self.rank_zero_solves = MPI.Query_thread() == MPI.THREAD_MULTIPLE
+        else:
+            self.comm = comm
+            self.rank_zero_solves = True
+
+    def __enter__(self):
+        if self.num_procs > 1 and self.rank == 0 and self.rank_zero_solves:
+            self._thread = threading.Thread(target=self._serve, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.num_procs > 1:
+            self.comm.Free()
+
+    def _claim(self):
+        with self._lock:
+            start = self._next_case
+            self._next_case += self.chunk_size
+        return start
+
+    def _serve(self):
+        # Every non-zero rank is told once that the work is exhausted
+        num_finished = 0
+        while num_finished < self.num_procs - 1:
+            request = self.comm.irecv(source=MPI.ANY_SOURCE, tag=self._REQUEST_TAG)
+            flag, source = request.test()
+            while not flag:
+                time.sleep(self.poll_interval)
+                flag, source = request.test()
+
+            start = self._claim()
+            self.comm.send(start, dest=source, tag=self._ASSIGN_TAG)
+            if start >= self.num_cases:
+                num_finished += 1
+
+    def chunks(self):
+        """
+        Yields ``(start, stop)`` global case ranges assigned to this rank.
+        """
+        if self.rank == 0 and not self.rank_zero_solves:
+            self._serve()
+            return
+
+        while True:
+            if self.rank == 0:
+                start = self._claim()
+            else:
+                self.comm.send(self.rank, dest=0, tag=self._REQUEST_TAG)
+                start = self.comm.recv(source=0, tag=self._ASSIGN_TAG)
+
+            if start >= self.num_cases:
+                return
+
+            yield start, min(start + self.chunk_size, self.num_cases)
+
+
+class _WarmStartStore:
+    """
+    Keeps the converged variable values of solved cases so that the model
+    can be started from the already-solved case nearest in parameter space.
+    """
+
+    def __init__(self, model, max_points=None):
+
+        self.variables = list(model.component_data_objects(pyo.Var))
+        self.max_points = max_points
+
+        self._points = []
+        self._states = []
+        self._num_added = 0
+
+    def __len__(self):
+        return len(self._points)
+
+    def add(self, point, model):
+
+        state = np.array(
+            [np.nan if v.value is None else v.value for v in self.variables],
+            dtype=np.float64,
+        )
+
+        if self.max_points is None or len(self._points) < self.max_points:
+            self._points.append(np.array(point, dtype=np.float64))
+            self._states.append(state)
+        else:
+            # Replace the oldest stored case
+            slot = self._num_added % self.max_points
+            self._points[slot] = np.array(point, dtype=np.float64)
+            self._states[slot] = state
+
+        self._num_added += 1
+
+    def load_nearest(self, point, model):
+
+        points = np.vstack(self._points)
+        point = np.asarray(point, dtype=np.float64)
+
+        # Measure distances relative to the extent of the stored cases so that
+        # parameters of very different magnitude count equally
+        scale = np.ptp(np.vstack((points, point)), axis=0)
+        scale[scale == 0] = 1.0
+        distance = np.sum(((points - point) / scale) ** 2, axis=1)
+
+        state = self._states[int(np.argmin(distance))]
+        for v, val in zip(self.variables, state):
+            if not v.fixed and not np.isnan(val):
+                v.set_value(val, skip_validation=True)
+
+
+class _OutputCompileError(Exception):
+    """
+    Raised for an output expression that _OutputExtractor cannot compile.
+    """
+
+
+class _OutputExtractor:
+    """
+    Extraction plan of the outputs of a sweep, prepared once so that all of
+    the outputs of a case are evaluated with a single call.
+
+    The outputs are compiled into one Python function of the values of the
+    Vars and mutable Params they depend on, which are read into a list for
+    every case. A named Expression is evaluated once however many outputs
+    contain it. Outputs that cannot be compiled, e.g., external functions,
+    are evaluated with ``pyo.value``, and so is every output of a case whose
+    compiled evaluation fails, so that the errors are the same as before.
+    """
+
+    _operators = {
+        numeric_expr.DivisionExpression: "({0} / {1})",
+        numeric_expr.PowExpression: "({0} ** {1})",
+        numeric_expr.NegationExpression: "(- {0})",
+        numeric_expr.AbsExpression: "abs({0})",
+        relational_expr.EqualityExpression: "({0} == {1})",
+    }
+
+    def __init__(self, components):
+
+        self.components = list(components)
+
+        self._leaves = []
+        self._leaf_names = ComponentMap()
+        self._named_names = ComponentMap()
+        self._namespace = {}
+        self._lines = []
+
+        results = []
+        self._uncompiled = []
+        for j, component in enumerate(self.components):
+            try:
+                results.append(self._compile(component))
+            except _OutputCompileError:
+                results.append("None")
+                self._uncompiled.append(j)
+
+        source = "\n    ".join(
+            ["def _extract(v):"] + self._lines + [f"return [{', '.join(results)}]"]
+        )
+        exec(compile(source, "<parameter sweep outputs>", "exec"), self._namespace)
+        self._extract = self._namespace["_extract"]
+
+    def _constant(self, value):
+        name = f"c{len(self._namespace)}"
+        self._namespace[name] = value
+        return name
+
+    def _leaf(self, component):
+
+        if type(component) in native_numeric_types:
+            return self._constant(component)
+
+        if component.is_variable_type() or component.is_parameter_type():
+            if component not in self._leaf_names:
+                self._leaf_names[component] = f"v[{len(self._leaves)}]"
+                self._leaves.append(component)
+            return self._leaf_names[component]
+
+        if not component.is_potentially_variable():
+            # e.g., units, which are fixed for good
+            return self._constant(pyo.value(component))
+
+        raise _OutputCompileError(f"Cannot compile {component}")
+
+    def _named(self, component):
+
+        if component not in self._named_names:
+            if component.expr is None:
+                raise _OutputCompileError(f"{component.name} has no expression")
+            body = self._walk(component.expr)
+            self._named_names[component] = f"e{len(self._named_names)}"
+            self._lines.append(f"{self._named_names[component]} = {body}")
+
+        return self._named_names[component]
+
+    def _compile(self, component):
+
+        if type(component) not in native_numeric_types:
+            if component.is_named_expression_type():
+                return self._named(component)
+        return self._walk(component)
+
+    def _before_child(self, node, child, child_idx):
+
+        if type(child) in native_numeric_types or not child.is_expression_type():
+            return False, self._leaf(child)
+        if child.is_named_expression_type():
+            return False, self._named(child)
+        return True, None
+
+    def _exit_node(self, node, data):
+
+        if isinstance(node, numeric_expr.SumExpression):
+            return f"({' + '.join(data)})"
+        if isinstance(node, numeric_expr.ProductExpression):
+            return f"({data[0]} * {data[1]})"
+        if isinstance(node, numeric_expr.UnaryFunctionExpression):
+            # The same function as Pyomo evaluates
+            return f"{self._constant(node._fcn)}({data[0]})"
+        if isinstance(node, numeric_expr.MinExpression):
+            return f"min({', '.join(data)})"
+        if isinstance(node, numeric_expr.MaxExpression):
+            return f"max({', '.join(data)})"
+        if isinstance(node, numeric_expr.Expr_ifExpression):
+            return f"({data[1]} if {data[0]} else {data[2]})"
+        if isinstance(node, relational_expr.InequalityExpression):
+            return f"({data[0]} {'<' if node.strict else '<='} {data[1]})"
+        if isinstance(node, relational_expr.RangedExpression):
+            ops = ["<" if strict else "<=" for strict in node.strict]
+            return f"({data[0]} {ops[0]} {data[1]} {ops[1]} {data[2]})"
+        for node_type, operator in self._operators.items():
+            if isinstance(node, node_type):
+                return operator.format(*data)
+
+        raise _OutputCompileError(f"Cannot compile {type(node).__name__}")
+
+    def _walk(self, expr):
+
+        if type(expr) in native_numeric_types or not expr.is_expression_type():
+            return self._leaf(expr)
+
+        return StreamBasedExpressionVisitor(
+            beforeChild=self._before_child, exitNode=self._exit_node
+        ).walk_expression(expr)
+
+    def evaluate(self, row):
+        """
+        Writes the values of the outputs into ``row``.
+        """
+
+        values = [leaf.value for leaf in self._leaves]
+
+        try:
+            if None in values:
+                raise ValueError("Uninitialized value")
+            row[:] = self._extract(values)
+        except Exception:
+            # Let pyo.value report the problem, or evaluate what it can
+            for j, component in enumerate(self.components):
+                row[j] = pyo.value(component)
+            return
+
+        for j in self._uncompiled:
+            row[j] = pyo.value(self.components[j])
+
+
+class _SweepProgress:
+    """
+    Tracks the cases finished by this rank and writes their count, success
+    rate and solve times to a small JSON status file in ``progress_dir``, at
+    most every ``interval`` seconds. The files are written without any
+    communication so that reporting never holds up the solves.
+
+    Whenever rank 0 writes its status, it also combines the latest status
+    files of all ranks into a summary of the whole sweep, with an estimate of
+    its remaining time.
+    """
+
+    summary_file_name = "progress.json"
+
+    def __init__(self, progress_dir, rank, num_procs, num_global_cases, interval):
+
+        os.makedirs(progress_dir, exist_ok=True)
+
+        self.progress_dir = progress_dir
+        self.rank = rank
+        self.num_procs = num_procs
+        self.num_global_cases = num_global_cases
+        self.interval = interval
+
+        # Cases handed to this rank so far, and the ones it finished
+        self.num_cases = 0
+        self.cases_completed = 0
+        self.cases_successful = 0
+        self.solve_times = []
+
+        self._start = time.perf_counter()
+        self._last_write = None
+
+    def _rank_file_name(self, rank):
+        return os.path.join(self.progress_dir, f"progress_{rank:03}.json")
+
+    @staticmethod
+    def _write_json(file_name, data):
+        # Readers never see a partially written file
+        with open(file_name + ".tmp", "w") as f:
+            json.dump(data, f, indent=1)
+        os.replace(file_name + ".tmp", file_name)
+
+    def add_cases(self, num_cases):
+        self.num_cases += num_cases
+
+    def case_done(self, run_successful, solve_time=None):
+        """
+        Records a finished case, and its solve time unless it was restored
+        rather than solved.
+        """
+
+        self.cases_completed += 1
+        self.cases_successful += int(run_successful)
+        if solve_time is not None:
+            self.solve_times.append(solve_time)
+
+        now = time.perf_counter()
+        if self._last_write is None or now - self._last_write >= self.interval:
+            self.write()
+
+    def status(self, finished=False):
+
+        elapsed = time.perf_counter() - self._start
+        # Restored cases took no time and do not count towards the rate
+        rate = len(self.solve_times) / elapsed if elapsed > 0 else 0.0
+        remaining = self.num_cases - self.cases_completed
+
+        return {
+            "rank": self.rank,
+            "num_cases": self.num_cases,
+            "cases_completed": self.cases_completed,
+            "cases_successful": self.cases_successful,
+            "cases_solved": len(self.solve_times),
+            "success_rate": (
+                self.cases_successful / self.cases_completed
+                if self.cases_completed > 0
+                else None
+            ),
+            "mean_solve_time": (
+                float(np.mean(self.solve_times)) if self.solve_times else None
+            ),
+            "p95_solve_time": (
+                float(np.percentile(self.solve_times, 95)) if self.solve_times else None
+            ),
+            "elapsed_time": elapsed,
+            "cases_per_second": rate,
+            "eta": 0.0 if remaining == 0 else (remaining / rate if rate > 0 else None),
+            "finished": finished,
+            "updated": time.time(),
+        }
+
+    def write(self, finished=False):
+
+        self._last_write = time.perf_counter()
+        status = self.status(finished)
+        self._write_json(self._rank_file_name(self.rank), status)
+
+        if self.rank == 0:
+            self.write_summary(status)
+
+    def write_summary(self, status=None):
+        """
+        Combines the status files of all ranks into the summary file. Ranks
+        that have not written a status yet are left out.
+        """
+
+        statuses = []
+        for rank in range(self.num_procs):
+            if rank == self.rank and status is not None:
+                statuses.append(status)
+                continue
+            try:
+                with open(self._rank_file_name(rank), "r") as f:
+                    statuses.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+
+        cases_completed = sum(item["cases_completed"] for item in statuses)
+        cases_successful = sum(item["cases_successful"] for item in statuses)
+        rate = sum(item["cases_per_second"] for item in statuses)
+        timed = [item for item in statuses if item["cases_solved"] > 0]
+
+        # The sweep ends when the slowest rank is done with the cases it has,
+        # and the cases that no rank has yet are shared by all of them
+        remaining = self.num_global_cases - cases_completed
+        if remaining <= 0:
+            eta = 0.0
+        elif rate > 0 and all(item["eta"] is not None for item in statuses):
+            eta = max([remaining / rate] + [item["eta"] for item in statuses])
+        else:
+            eta = None
+
+        self._write_json(
+            os.path.join(self.progress_dir, self.summary_file_name),
+            {
+                "num_cases": self.num_global_cases,
+                "num_ranks": self.num_procs,
+                "ranks_reporting": len(statuses),
+                "cases_completed": cases_completed,
+                "cases_successful": cases_successful,
+                "success_rate": (
+                    cases_successful / cases_completed if cases_completed > 0 else None
+                ),
+                "mean_solve_time": (
+                    float(
+                        np.average(
+                            [item["mean_solve_time"] for item in timed],
+                            weights=[item["cases_solved"] for item in timed],
+                        )
+                    )
+                    if timed
+                    else None
+                ),
+                "p95_solve_time": max(
+                    (item["p95_solve_time"] for item in timed), default=None
+                ),
+                "cases_per_second": rate,
+                "eta": eta,
+                "finished": len(statuses) == self.num_procs
+                and all(item["finished"] for item in statuses),
+                "updated": time.time(),
+                "ranks": statuses,
+            },
+        )
+
+
+def _space_filling_order(values, bits_per_dim=16):
+    """
+    Returns the permutation that visits the rows of ``values`` along a
+    Morton (Z-order) curve through the parameter space.
+    """
+
+    num_cases, num_params = np.shape(values)
+    if num_cases < 2:
+        return np.arange(num_cases)
+
+    bits_per_dim = max(1, min(bits_per_dim, 64 // num_params))
+
+    # Quantize every parameter onto an integer grid
+    lower = np.min(values, axis=0)
+    extent = np.ptp(values, axis=0)
+    extent[extent == 0] = 1.0
+    grid = ((values - lower) / extent * (2**bits_per_dim - 1)).astype(np.uint64)
+
+    # Interleave the bits of the grid coordinates
+    keys = np.zeros(num_cases, dtype=np.uint64)
+    for bit in range(bits_per_dim):
+        for j in range(num_params):
+            keys |= ((grid[:, j] >> np.uint64(bit)) & np.uint64(1)) << np.uint64(
+                bit * num_params + j
+            )
+
+    return np.argsort(keys, kind="stable")
+
+
+def _knn_success_fraction(values, solve_successful, candidates, num_neighbors):
+    """
+    Returns, for every row of ``candidates``, the fraction of successful
+    solves among its ``num_neighbors`` nearest cases in ``values``, measured
+    relative to the range of each parameter.
+    """
+
+    num_neighbors = min(num_neighbors, np.shape(values)[0])
+
+    lower = np.min(values, axis=0)
+    extent = np.ptp(values, axis=0)
+    extent[extent == 0] = 1.0
+
+    tree = cKDTree((values - lower) / extent)
+    _, idx = tree.query((candidates - lower) / extent, k=num_neighbors)
+    idx = np.reshape(idx, (np.shape(candidates)[0], num_neighbors))
+
+    return np.mean(np.asarray(solve_successful, dtype=np.float64)[idx], axis=1)
+
+
+class _RankLocalSampler:
+    """
+    Draws the random samples of any subset of the cases from independent,
+    reproducible streams so that no rank has to sample the whole space.
+
+    The cases are grouped into fixed-size blocks and block ``b`` is sampled
+    from the generator seeded by child ``b`` of the sweep's SeedSequence, so
+    the value of every case only depends on the seed and the case index and
+    not on which rank asks for it.
+    """
+
+    block_size = 1024
+
+    def __init__(self, sweep_params, sampling_type, num_samples, entropy):
+
+        self.sweep_params = sweep_params
+        self.sampling_type = sampling_type
+        self.num_samples = num_samples
+        self.entropy = entropy
+
+        if sampling_type == SamplingType.RANDOM_LHS:
+            # Every rank needs the same assignment of cases to strata
+            self.strata = [
+                self._generator(1, j).permutation(num_samples)
+                for j in range(len(sweep_params))
+            ]
+
+    def _generator(self, stream, index):
+        # Equivalent to child ``index`` of SeedSequence(entropy).spawn() in
+        # namespace ``stream``, without spawning the preceding children
+        return np.random.default_rng(
+            np.random.SeedSequence(self.entropy, spawn_key=(stream, int(index)))
+        )
+
+    def _sample_block(self, block):
+
+        start = block * self.block_size
+        stop = min(start + self.block_size, self.num_samples)
+        generator = self._generator(0, block)
+
+        if self.sampling_type == SamplingType.RANDOM_LHS:
+            columns = [
+                v.sample_strata(self.strata[j][start:stop], self.num_samples, generator)
+                for j, v in enumerate(self.sweep_params.values())
+            ]
+        else:
+            columns = [
+                v.sample(stop - start, generator) for v in self.sweep_params.values()
+            ]
+
+        return np.column_stack(columns)
+
+    def sample(self, case_indices):
+
+        case_indices = np.asarray(case_indices, dtype=np.int64)
+        local_combo_array = np.empty(
+            (len(case_indices), len(self.sweep_params)), dtype=np.float64
+        )
+
+        # The cases of a rank or a chunk are contiguous, so sorting them by
+        # block is cheap and every block is a slice of the sorted cases
+        order = np.argsort(case_indices, kind="stable")
+        sorted_indices = case_indices[order]
+        blocks = sorted_indices // self.block_size
+        starts = np.flatnonzero(np.diff(blocks, prepend=-1))
+        stops = np.append(starts[1:], len(blocks))
+
+        for start, stop in zip(starts, stops):
+            block = int(blocks[start])
+            block_values = self._sample_block(block)
+            local_combo_array[order[start:stop], :] = block_values[
+                sorted_indices[start:stop] - block * self.block_size, :
+            ]
+
+        return local_combo_array
+
+
+class _LowDiscrepancySampler:
+    """
+    Generates any subset of the cases of a Sobol or Halton sweep by
+    skipping ahead in the scrambled sequence, so every rank can produce its
+    own cases.
+    """
+
+    def __init__(self, sweep_params, entropy):
+
+        self.samples = list(sweep_params.values())
+        self.entropy = entropy
+
+    def sample(self, case_indices):
+
+        case_indices = np.asarray(case_indices, dtype=np.int64)
+        if len(case_indices) == 0:
+            return np.zeros((0, len(self.samples)), dtype=np.float64)
+
+        # The cases of a rank or a chunk are contiguous, so generating the
+        # range between the first and the last case wastes little
+        start = int(np.min(case_indices))
+        stop = int(np.max(case_indices)) + 1
+        points = low_discrepancy_points(self.samples, start, stop, self.entropy)
+
+        return points[case_indices - start, :]
+
+
+@contextlib.contextmanager
+def _spawn_process_pool(max_workers, initializer=None, initargs=()):
+    """
+    Yields a process pool of fresh interpreters rather than forks of a
+    process that may already have initialized MPI. The workers only ever use
+    DummyCOMM, so they are stopped from initializing MPI themselves, which
+    fails when this process was started by mpiexec.
+    """
+
+    mpi4py_initialize = os.environ.get("MPI4PY_RC_INITIALIZE")
+    os.environ["MPI4PY_RC_INITIALIZE"] = "false"
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=initializer,
+            initargs=initargs,
+        ) as executor:
+            yield executor
+    finally:
+        if mpi4py_initialize is None:
+            del os.environ["MPI4PY_RC_INITIALIZE"]
+        else:
+            os.environ["MPI4PY_RC_INITIALIZE"] = mpi4py_initialize
+
+
+# State of a multiprocessing worker, populated once per process by
+# _init_multiprocessing_worker and reused for every chunk it solves
+_worker_state = {}
+
+
+def _init_multiprocessing_worker(
+    build_model, build_model_kwargs, sweep_param_names, output_names, options
+):
+    model = build_model(**build_model_kwargs)
+
+    sweep_params = {
+        key: LinearSample(model.find_component(name), None, None, None)
+        for key, name in sweep_param_names.items()
+    }
+
+    if output_names is None:
+        outputs = None
+    else:
+        outputs = {
+            key: model.find_component(name) for key, name in output_names.items()
+        }
+
+    # The worker never writes files, so silence the writer's warning about that
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        ps = ParameterSweep(comm=DummyCOMM, **options)
+
+    _worker_state["model"] = model
+    _worker_state["sweep_params"] = sweep_params
+    _worker_state["outputs"] = outputs
+    _worker_state["sweep"] = ps
+    _worker_state["reinitialize_values"] = ps._get_reinitialize_values(model)
+
+
+def _run_multiprocessing_chunk(local_values):
+    ps = _worker_state["sweep"]
+
+    local_output_dict = ps._do_param_sweep(
+        _worker_state["model"],
+        _worker_state["sweep_params"],
+        _worker_state["outputs"],
+        local_values,
+        _worker_state["reinitialize_values"],
+    )
+
+    # Pyomo objects stay in the worker, only the values are sent back. The
+    # solver_stats and solve_status groups have no Pyomo objects
+    for key, item in local_output_dict.items():
+        if key != "solve_successful":
+            for subitem in item.values():
+                subitem.pop("_pyo_obj", None)
+
+    return local_output_dict
+
+
+def _get_output_block(output_dict):
+    """
+    Returns the (cases x columns) array of which the values of every output
+    in ``output_dict`` are the columns, as allocated by
+    ``_create_local_output_skeleton``, or None if the values are separate.
+    """
+
+    values = [
+        subitem["value"]
+        for key, item in output_dict.items()
+        if key != "solve_successful"
+        for subitem in item.values()
+    ]
+    if len(values) == 0:
+        return None
+
+    block = values[0].base
+    if (
+        not isinstance(block, np.ndarray)
+        or block.ndim != 2
+        or not block.flags.c_contiguous
+        or np.shape(block)[1] != len(values) + 2
+    ):
+        return None
+
+    for j, value in enumerate(values):
+        column = block[:, j]
+        if (
+            value.base is not block
+            or value.shape != column.shape
+            or value.strides != column.strides
+            or value.__array_interface__["data"][0]
+            != column.__array_interface__["data"][0]
+        ):
+            return None
+
+    return block
+
+
 class _ParameterSweepBase(ABC):
 
     CONFIG = ParameterSweepWriter.CONFIG()
@@ -107,6 +994,60 @@ class _ParameterSweepBase(ABC):
         ),
     )
 
+    CONFIG.declare(
+        "case_timeout",
+        ConfigValue(
+            default=None,
+            domain=PositiveFloat,
+            description="Wall-clock time limit in seconds for each case, a case exceeding it is recorded as failed with a timeout status.",
+        ),
+    )
+
+    CONFIG.declare(
+        "case_cache_dir",
+        ConfigValue(
+            default=None,
+            domain=str,
+            description="Directory of an on-disk cache of solved cases that are reused instead of solved again.",
+        ),
+    )
+
+    CONFIG.declare(
+        "solver_telemetry",
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description="Bool to decide whether the wall time, solver iterations, termination condition and reinitialization of every case are saved as well.",
+        ),
+    )
+
+    CONFIG.declare(
+        "warm_start",
+        ConfigValue(
+            default="previous",
+            domain=In(["previous", "nearest", "predictor"]),
+            description="Starting point of each solve: the state left by the previous case, the stored solution of the nearest solved case, or a first-order prediction from the last solved case.",
+        ),
+    )
+
+    CONFIG.declare(
+        "warm_start_max_points",
+        ConfigValue(
+            default=None,
+            domain=PositiveInt,
+            description="Maximum number of solved cases kept for nearest warm starts, the oldest are replaced first. Defaults to all cases.",
+        ),
+    )
+
+    CONFIG.declare(
+        "space_filling_order",
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description="Bool to decide whether each rank solves its cases in the order of a space-filling (Morton) curve.",
+        ),
+    )
+
     def __init__(
         self,
         **options,
@@ -123,13 +1064,62 @@ class _ParameterSweepBase(ABC):
             self.comm,
             csv_results_file_name=self.config.csv_results_file_name,
             h5_results_file_name=self.config.h5_results_file_name,
+            npy_results_dir=self.config.npy_results_dir,
             debugging_data_dir=self.config.debugging_data_dir,
             interpolate_nan_outputs=self.config.interpolate_nan_outputs,
+            interpolation_method=self.config.interpolation_method,
+            interpolation_neighbors=self.config.interpolation_neighbors,
+            h5_streaming=self.config.h5_streaming,
+            h5_streaming_interval=self.config.h5_streaming_interval,
+            h5_parallel=self.config.h5_parallel,
+            h5_dtype=self.config.h5_dtype,
+            h5_compression=self.config.h5_compression,
+            h5_compression_level=self.config.h5_compression_level,
+            h5_store_constant_once=self.config.h5_store_constant_once,
+            h5_output_storage=self.config.h5_output_storage,
+            surrogate_file_name=self.config.surrogate_file_name,
+            surrogate_outputs=self.config.surrogate_outputs,
+            surrogate_method=self.config.surrogate_method,
+            surrogate_options=self.config.surrogate_options,
+            checkpoint_dir=self.config.checkpoint_dir,
+            checkpoint_interval=self.config.checkpoint_interval,
         )
 
+        # Cases restored from a checkpoint, keyed by their global case index
+        self._checkpoint_cases = {}
+
+        if self.config.case_timeout is not None and not hasattr(signal, "setitimer"):
+            warnings.warn(
+                "The case_timeout is not enforced on this platform, it requires signal.setitimer."
+            )
+
+        # Solutions of the cases solved so far for nearest warm starts
+        self._warm_start_store = None
+        self._predictor = None
+        self._output_skeleton = None
+        self._output_extractor = None
+
+        # Solved cases stored on disk, opened by the first sweep that uses them
+        self._case_cache = None
+
+        # Status files of the running sweep, if any
+        self._progress = None
+
+        # Random streams of a sweep sampled independently on every rank
+        self._rank_local_sampler = None
+
     def _build_combinations(self, d, sampling_type, num_samples):
         num_var_params = len(d)
 
+        if (
+            sampling_type == SamplingType.FIXED
+            or sampling_type == SamplingType.ADAPTIVE
+        ):
+            # Every rank decodes the combinations itself, so nothing needs to
+            # be broadcast
+            nx = self._get_num_combinations(d, sampling_type, num_samples)
+            return self._decode_fixed_combinations(d, np.arange(nx))
+
         if self.rank == 0:
             param_values = []
 
@@ -138,16 +1128,19 @@ class _ParameterSweepBase(ABC):
                 p = v.sample(num_samples)
                 param_values.append(p)
 
-            if sampling_type == SamplingType.FIXED:
-                # Form an array with every possible combination of parameter values
-                global_combo_array = np.array(np.meshgrid(*param_values, indexing="ij"))
-                global_combo_array = global_combo_array.reshape(num_var_params, -1).T
-
-            elif sampling_type == SamplingType.RANDOM:
+            if sampling_type == SamplingType.RANDOM:
                 sorting = np.argsort(param_values[0])
                 global_combo_array = np.vstack(param_values).T
                 global_combo_array = global_combo_array[sorting, :]
 
+            elif sampling_type == SamplingType.LOW_DISCREPANCY:
+                global_combo_array = low_discrepancy_points(
+                    list(d.values()),
+                    0,
+                    num_samples,
+                    np.random.randint(np.iinfo(np.int32).max),
+                )
+
             elif sampling_type == SamplingType.RANDOM_LHS:
                 lb = [val[0] for val in param_values]
                 ub = [val[1] for val in param_values]
@@ -167,21 +1160,7 @@ class _ParameterSweepBase(ABC):
                 global_combo_array = np.ascontiguousarray(global_combo_array)
 
         else:
-            if sampling_type == SamplingType.FIXED:
-                nx = 1
-                for k, v in d.items():
-                    nx *= v.num_samples
-            elif (
-                sampling_type == SamplingType.RANDOM
-                or sampling_type == SamplingType.RANDOM_LHS
-            ):
-                nx = num_samples
-            else:
-                raise ValueError(f"Unknown sampling type: {sampling_type}")
-
-            if not float(nx).is_integer():
-                raise RuntimeError(f"Total number of samples must be integer valued")
-            nx = int(nx)
+            nx = self._get_num_combinations(d, sampling_type, num_samples)
 
             # Allocate memory to hold the Bcast array
             global_combo_array = np.zeros((nx, num_var_params), dtype=np.float64)
@@ -192,43 +1171,176 @@ class _ParameterSweepBase(ABC):
 
         return global_combo_array
 
-    def _divide_combinations(self, global_combo_array):
+    def _get_num_combinations(self, d, sampling_type, num_samples):
 
-        # Split the total list of combinations into NUM_PROCS chunks,
-        # one per each of the MPI ranks
-        # divided_combo_array = np.array_split(global_combo_array, num_procs, axis=0)
-        divided_combo_array = np.array_split(global_combo_array, self.num_procs)
+        if (
+            sampling_type == SamplingType.FIXED
+            or sampling_type == SamplingType.ADAPTIVE
+        ):
+            # Adaptive sweeps start from a grid
+            nx = 1
+            for k, v in d.items():
+                nx *= v.num_samples
+        elif (
+            sampling_type == SamplingType.RANDOM
+            or sampling_type == SamplingType.RANDOM_LHS
+            or sampling_type == SamplingType.LOW_DISCREPANCY
+        ):
+            nx = num_samples
+        else:
+            raise ValueError(f"Unknown sampling type: {sampling_type}")
 
-        # Return only this rank's portion of the total workload
-        local_combo_array = divided_combo_array[self.rank]
+        if not float(nx).is_integer():
+            raise RuntimeError(f"Total number of samples must be integer valued")
 
-        return local_combo_array
+        return int(nx)
 
-    def _update_model_values(self, m, param_dict, values):
+    def _decode_fixed_combinations(self, d, case_indices):
 
-        for k, item in enumerate(param_dict.values()):
+        # Build the short vector of discrete values for each parameter
+        param_values = [v.sample(None) for v in d.values()]
 
-            param = item.pyomo_object
+        # Case k is entry k of the row-major grid of every combination, the
+        # same order as np.meshgrid(..., indexing="ij") flattened, so its
+        # position along each parameter can be computed directly
+        sample_indices = np.unravel_index(
+            np.asarray(case_indices, dtype=np.int64),
+            [len(p) for p in param_values],
+        )
 
-            if param.is_variable_type():
-                # Fix the single value to values[k]
-                param.fix(values[k])
+        local_combo_array = np.empty(
+            (len(sample_indices[0]), len(param_values)), dtype=np.float64
+        )
+        for j, (p, idx) in enumerate(zip(param_values, sample_indices)):
+            local_combo_array[:, j] = p[idx]
 
-            elif param.is_parameter_type():
-                # Fix the single value to values[k]
-                param.set_value(values[k])
+        return local_combo_array
+
+    def _get_case_values(self, sweep_params, global_values, case_indices):
+
+        # Without a global array each rank generates only the cases it needs,
+        # either from its own random streams or by decoding a FIXED grid
+        if global_values is None:
+            if self._rank_local_sampler is not None:
+                return self._rank_local_sampler.sample(case_indices)
+            return self._decode_fixed_combinations(sweep_params, case_indices)
+
+        return global_values[case_indices, :]
+
+    def _gather_case_values(self, local_values, local_case_indices, num_cases):
+        """
+        Collects the values of the cases solved by every rank into the global
+        array of all cases on every rank, so that the values generated by the
+        ranks themselves are not generated again. The cases of the ranks are
+        contiguous blocks in rank order unless ``local_case_indices`` is given.
+        """
+
+        local_values = np.ascontiguousarray(local_values, dtype=np.float64)
+        num_params = np.shape(local_values)[1]
+        global_values = np.empty((num_cases, num_params), dtype=np.float64)
+
+        if self.num_procs == 1:
+            if local_case_indices is None:
+                global_values[:, :] = local_values
+            else:
+                global_values[local_case_indices, :] = local_values
+            return global_values
+
+        sample_split_arr = self.comm.allgather(len(local_values))
+
+        if local_case_indices is None:
+            # The blocks of the ranks follow each other in the global array
+            recvbuf = None
+            if self.rank == 0:
+                recvbuf = (
+                    global_values.reshape(-1),
+                    [n * num_params for n in sample_split_arr],
+                )
+            self.comm.Gatherv(sendbuf=local_values.reshape(-1), recvbuf=recvbuf, root=0)
+        else:
+            local_case_indices = np.ascontiguousarray(
+                local_case_indices, dtype=np.int64
+            )
+            gathered_indices = None
+            gathered_values = None
+            if self.rank == 0:
+                gathered_indices = np.empty(num_cases, dtype=np.int64)
+                gathered_values = np.empty((num_cases, num_params), dtype=np.float64)
+            self.comm.Gatherv(
+                sendbuf=local_case_indices,
+                recvbuf=(
+                    None
+                    if gathered_indices is None
+                    else (gathered_indices, sample_split_arr)
+                ),
+                root=0,
+            )
+            self.comm.Gatherv(
+                sendbuf=local_values.reshape(-1),
+                recvbuf=(
+                    None
+                    if gathered_values is None
+                    else (
+                        gathered_values.reshape(-1),
+                        [n * num_params for n in sample_split_arr],
+                    )
+                ),
+                root=0,
+            )
+            if self.rank == 0:
+                global_values[gathered_indices, :] = gathered_values
+
+        self.comm.Bcast(global_values, root=0)
+
+        return global_values
+
+    def _divide_combinations(self, global_combo_array):
+
+        # Split the total list of combinations into NUM_PROCS chunks,
+        # one per each of the MPI ranks
+        # divided_combo_array = np.array_split(global_combo_array, num_procs, axis=0)
+        divided_combo_array = np.array_split(global_combo_array, self.num_procs)
+
+        # Return only this rank's portion of the total workload
+        local_combo_array = divided_combo_array[self.rank]
+
+        return local_combo_array
+
+    def _divide_case_indices(self, num_cases):
+
+        # The same contiguous blocks as _divide_combinations, computed without
+        # building the full array of case indices
+        block_size, remainder = divmod(num_cases, self.num_procs)
+        start = self.rank * block_size + min(self.rank, remainder)
+        stop = start + block_size + (1 if self.rank < remainder else 0)
+
+        return np.arange(start, stop, dtype=np.int64)
+
+    def _update_model_values(self, m, param_dict, values):
+
+        for k, item in enumerate(param_dict.values()):
+
+            param = item.pyomo_object
+
+            if param.is_variable_type():
+                # Fix the single value to values[k]
+                param.fix(values[k])
+
+            elif param.is_parameter_type():
+                # Fix the single value to values[k]
+                param.set_value(values[k])
 
             else:
                 raise RuntimeError(f"Unrecognized Pyomo object {param}")
 
     def _aggregate_results_arr(self, global_results_dict, num_cases):
 
-        global_results = np.zeros(
-            (num_cases, len(global_results_dict["outputs"])), dtype=np.float64
-        )
+        # The solver statistics and solve status, if recorded, follow the outputs
+        result_columns = self.writer._get_result_columns(global_results_dict)
+        global_results = np.zeros((num_cases, len(result_columns)), dtype=np.float64)
 
         if self.rank == 0:
-            for i, (key, item) in enumerate(global_results_dict["outputs"].items()):
+            for i, (key, item) in enumerate(result_columns):
                 global_results[:, i] = item["value"][:num_cases]
 
         if self.num_procs > 1:  # pragma: no cover
@@ -258,8 +1370,44 @@ class _ParameterSweepBase(ABC):
 
         return sweep_params, sampling_type
 
+    def _process_outputs(self, model, outputs):
+
+        # Patterns of output names are resolved once, before the sweep
+        if outputs is None or (
+            isinstance(outputs, dict)
+            and not any(isinstance(item, str) for item in outputs.values())
+        ):
+            return outputs
+
+        return select_outputs(model, outputs)
+
     def _create_local_output_skeleton(self, model, sweep_params, outputs, num_samples):
 
+        # Walking the model for the outputs and their units is expensive, e.g.,
+        # for every chunk of the dynamic scheduler, so the metadata is only
+        # collected once for the same model, sweep parameters and outputs
+        key = [model, outputs] + [item.pyomo_object for item in sweep_params.values()]
+        if self._output_skeleton is None or not (
+            len(key) == len(self._output_skeleton[0])
+            and all(a is b for a, b in zip(key, self._output_skeleton[0]))
+        ):
+            self._output_skeleton = (
+                key,
+                self._collect_output_metadata(model, sweep_params, outputs),
+            )
+            # The outputs are compiled again for the new skeleton
+            self._output_extractor = None
+
+        output_dict = {
+            group: {name: dict(subitem) for name, subitem in item.items()}
+            for group, item in self._output_skeleton[1].items()
+        }
+        self._allocate_output_values(output_dict, num_samples)
+
+        return output_dict
+
+    def _collect_output_metadata(self, model, sweep_params, outputs):
+
         output_dict = {}
         output_dict["sweep_params"] = {}
         output_dict["outputs"] = {}
@@ -272,7 +1420,7 @@ class _ParameterSweepBase(ABC):
             sweep_param_objs.add(var)
             output_dict["sweep_params"][
                 var.name
-            ] = self._create_component_output_skeleton(var, num_samples)
+            ] = self._create_component_output_skeleton(var)
 
         if outputs is None:
             # No outputs are specified, so every Var, Expression, and Objective on the model should be saved
@@ -283,21 +1431,55 @@ class _ParameterSweepBase(ABC):
                 if pyo_obj not in sweep_param_objs:
                     output_dict["outputs"][
                         pyo_obj.name
-                    ] = self._create_component_output_skeleton(pyo_obj, num_samples)
+                    ] = self._create_component_output_skeleton(pyo_obj)
 
         else:
             # Save only the outputs specified in the outputs dictionary
             for short_name, pyo_obj in outputs.items():
                 output_dict["outputs"][
                     short_name
-                ] = self._create_component_output_skeleton(pyo_obj, num_samples)
+                ] = self._create_component_output_skeleton(pyo_obj)
+
+        if self.config.solver_telemetry:
+            output_dict["solver_stats"] = {}
+            for stat, units in _SOLVER_STATS.items():
+                output_dict["solver_stats"][stat] = {"value": None, "units": units}
+            output_dict["solver_stats"]["termination_condition"]["codes"] = ", ".join(
+                f"{code}: {tc.value}" for code, tc in enumerate(_TERMINATION_CONDITIONS)
+            )
+
+        if self.config.case_timeout is not None:
+            output_dict["solve_status"] = {
+                "timed_out": {"value": None, "units": "None"}
+            }
 
         return output_dict
 
-    def _create_component_output_skeleton(self, component, num_samples):
+    def _allocate_output_values(self, output_dict, num_samples):
+
+        # The values of every output are the columns of a single (cases x
+        # columns) array, followed by a column for the solve status and one
+        # for the global case index, so that _create_global_output can gather
+        # the array as it is. The values are therefore strided views
+        subitems = [
+            subitem
+            for key, item in output_dict.items()
+            if key != "solve_successful"
+            for subitem in item.values()
+        ]
+        block = np.zeros((num_samples, len(subitems) + 2), dtype=np.float64)
+        for j, subitem in enumerate(subitems):
+            subitem["value"] = block[:, j]
+
+        # The solver statistics of cases that never reach the solver are unknown
+        for subitem in output_dict.get("solver_stats", {}).values():
+            subitem["value"][:] = np.nan
+
+    def _create_component_output_skeleton(self, component):
 
         comp_dict = {}
-        comp_dict["value"] = np.zeros(num_samples, dtype=np.float64)
+        # The values are allocated for all of the outputs together
+        comp_dict["value"] = None
         if hasattr(component, "lb"):
             comp_dict["lower bound"] = component.lb
         if hasattr(component, "ub"):
@@ -316,7 +1498,14 @@ class _ParameterSweepBase(ABC):
         return comp_dict
 
     def _update_local_output_dict(
-        self, model, sweep_params, case_number, sweep_vals, run_successful, output_dict
+        self,
+        model,
+        sweep_params,
+        case_number,
+        sweep_vals,
+        run_successful,
+        output_dict,
+        output_block=None,
     ):
 
         # Get the inputs
@@ -325,8 +1514,15 @@ class _ParameterSweepBase(ABC):
             var_name = item.pyomo_object.name
             op_ps_dict[var_name]["value"][case_number] = item.pyomo_object.value
 
-        # Get the outputs from model
-        if run_successful:
+        # Get the outputs from model, all at once if they are the columns of
+        # output_block
+        if output_block is not None:
+            if run_successful:
+                self._output_extractor.evaluate(output_block[case_number, :])
+            else:
+                output_block[case_number, :] = np.nan
+
+        elif run_successful:
             for label, val in output_dict["outputs"].items():
                 output_dict["outputs"][label]["value"][case_number] = pyo.value(
                     val["_pyo_obj"]
@@ -336,7 +1532,100 @@ class _ParameterSweepBase(ABC):
             for label in output_dict["outputs"].keys():
                 output_dict["outputs"][label]["value"][case_number] = np.nan
 
-    def _create_global_output(self, local_output_dict, req_num_samples):
+    def _update_solver_stats(self, output_dict, case_number, solver_stats):
+
+        stats_dict = output_dict["solver_stats"]
+        stats_dict["wall_time"]["value"][case_number] = solver_stats["wall_time"]
+
+        # Cases rejected by the probe_function never reach the solver
+        for stat in ("optimize_time", "reinitialize_time", "reinitialized"):
+            if stat in solver_stats:
+                stats_dict[stat]["value"][case_number] = solver_stats[stat]
+
+        results = solver_stats.get("results")
+        if results is not None:
+            stats_dict["iterations"]["value"][case_number] = _get_solver_iterations(
+                results, solver_stats.get("log", "")
+            )
+            try:
+                code = _TERMINATION_CONDITIONS.index(
+                    results.solver.termination_condition
+                )
+            except (AttributeError, ValueError):
+                code = np.nan
+            stats_dict["termination_condition"]["value"][case_number] = code
+
+        if solver_stats.get("timed_out", False):
+            stats_dict["termination_condition"]["value"][
+                case_number
+            ] = _TERMINATION_CONDITIONS.index(TerminationCondition.maxTimeLimit)
+
+    def _get_output_column_names(self, output_dict):
+
+        return [
+            f"{key}/{subkey}"
+            for key, item in output_dict.items()
+            if key != "solve_successful"
+            for subkey in item
+        ]
+
+    def _get_output_row(self, output_dict, case_number):
+
+        return np.array(
+            [
+                subitem["value"][case_number]
+                for key, item in output_dict.items()
+                if key != "solve_successful"
+                for subitem in item.values()
+            ],
+            dtype=np.float64,
+        )
+
+    def _set_output_row(self, output_dict, case_number, row):
+
+        subitems = (
+            subitem
+            for key, item in output_dict.items()
+            if key != "solve_successful"
+            for subitem in item.values()
+        )
+        for subitem, value in zip(subitems, row):
+            subitem["value"][case_number] = value
+
+    def _start_checkpoint(
+        self, model, sweep_params, outputs, global_values, num_global_cases, resume
+    ):
+
+        column_names = self._get_output_column_names(
+            self._create_local_output_skeleton(model, sweep_params, outputs, 0)
+        )
+
+        checkpoint_data = self.writer.start_checkpoint(column_names, resume)
+
+        self._checkpoint_cases = {}
+        if checkpoint_data is None:
+            return
+
+        # The sweep parameter values are stored in the first columns, so we
+        # can make sure the checkpoint belongs to this sweep
+        case_index = checkpoint_data["case_index"]
+        num_params = len(sweep_params)
+        if np.any(case_index >= num_global_cases) or not np.allclose(
+            checkpoint_data["values"][:, :num_params],
+            self._get_case_values(sweep_params, global_values, case_index),
+        ):
+            raise ValueError(
+                f"The checkpoints in {self.writer.config['checkpoint_dir']} do not match the sweep being resumed."
+            )
+
+        for idx, row, success in zip(
+            case_index, checkpoint_data["values"], checkpoint_data["solve_successful"]
+        ):
+            self._checkpoint_cases[int(idx)] = (row, bool(success))
+
+    def _create_global_output(
+        self, local_output_dict, req_num_samples, local_case_indices=None
+    ):
 
         # Before we can create the global dictionary, we need to delete the pyomo
         # object contained within the dictionary
@@ -351,71 +1640,121 @@ class _ParameterSweepBase(ABC):
         # local_output_dict remains the same across all mpi_ranks
         local_num_cases = len(local_output_dict["solve_successful"])
 
+        # The values of the outputs are the columns of a single array, which
+        # is gathered as it is after the solve status and, if the cases were
+        # not divided into contiguous blocks, the global case index
+        local_buffer = _get_output_block(local_output_dict)
+        if local_buffer is None:
+            # The values were not allocated by _create_local_output_skeleton,
+            # so they are packed into a copy
+            output_dict = {
+                key: {subkey: dict(subitem) for subkey, subitem in item.items()}
+                for key, item in local_output_dict.items()
+                if key != "solve_successful"
+            }
+            self._allocate_output_values(output_dict, local_num_cases)
+            for key, item in output_dict.items():
+                for subkey, subitem in item.items():
+                    subitem["value"][:] = local_output_dict[key][subkey]["value"]
+            local_buffer = _get_output_block(output_dict)
+
+        num_columns = np.shape(local_buffer)[1]
+        status_column = num_columns - 2
+        local_buffer[:, status_column] = local_output_dict["solve_successful"]
+        if local_case_indices is not None:
+            local_buffer[:, -1] = local_case_indices
+
         # Gather the size of the value array on each MPI rank
         sample_split_arr = self.comm.allgather(local_num_cases)
         num_total_samples = sum(sample_split_arr)
 
-        # Create the global value array on rank 0
+        # The rows of every rank follow each other in the flattened global array
         if self.rank == 0:
-            global_output_dict = copy.deepcopy(local_output_dict)
-            # Create a global value array of inputs in the dictionary
-            for key, item in global_output_dict.items():
-                if key != "solve_successful":
-                    for subkey, subitem in item.items():
-                        subitem["value"] = np.zeros(num_total_samples, dtype=np.float64)
-
+            global_buffer = np.empty((num_total_samples, num_columns), dtype=np.float64)
+            recvbuf = global_buffer.reshape(-1)
         else:
-            global_output_dict = local_output_dict
+            global_buffer = None
+            recvbuf = None
 
-        # Finally collect the values
+        self.comm.Gatherv(
+            sendbuf=local_buffer.reshape(-1),
+            recvbuf=(recvbuf, [n * num_columns for n in sample_split_arr]),
+            root=0,
+        )
+
+        if self.rank != 0:
+            return local_output_dict
+
+        # Put the gathered values back into global case order, if needed. The
+        # columns are permuted one at a time, so only a single column is
+        # copied at once rather than the whole gathered array
+        if local_case_indices is not None:
+            sorting = np.argsort(global_buffer[:, -1], kind="stable")
+            for j in range(status_column + 1):
+                global_buffer[:, j] = global_buffer[sorting, j]
+
+        # Trim to the exact number
+        global_buffer = global_buffer[0:req_num_samples]
+
+        # Create the global dictionary on rank 0. The metadata of each output is
+        # shared with the local dictionary and the values are (strided) views
+        # of the columns of the gathered array
+        global_output_dict = {}
+        column = 0
         for key, item in local_output_dict.items():
-            if key != "solve_successful":
+            if key == "solve_successful":
+                global_output_dict[key] = global_buffer[:, status_column].astype(bool)
+            else:
+                global_output_dict[key] = {}
                 for subkey, subitem in item.items():
-                    self.comm.Gatherv(
-                        sendbuf=subitem["value"],
-                        recvbuf=(
-                            global_output_dict[key][subkey]["value"],
-                            sample_split_arr,
-                        ),
-                        root=0,
+                    global_output_dict[key][subkey] = dict(
+                        subitem, value=global_buffer[:, column]
                     )
-
-                    # Trim to the exact number
-                    global_output_dict[key][subkey]["value"] = global_output_dict[key][
-                        subkey
-                    ]["value"][0:req_num_samples]
-
-            elif key == "solve_successful":
-                local_solve_successful = np.fromiter(
-                    item, dtype=np.bool, count=len(item)
-                )
-
-                if self.rank == 0:
-                    global_solve_successful = np.empty(num_total_samples, dtype=np.bool)
-                else:
-                    global_solve_successful = None
-
-                self.comm.Gatherv(
-                    sendbuf=local_solve_successful,
-                    recvbuf=(global_solve_successful, sample_split_arr),
-                    root=0,
-                )
-
-                if self.rank == 0:
-                    global_output_dict[key] = global_solve_successful[0:req_num_samples]
+                    column += 1
 
         return global_output_dict
 
-    def _param_sweep_kernel(self, model, reinitialize_values):
+    def _param_sweep_kernel(self, model, reinitialize_values, solver_stats=None):
 
         optimize_function = self.config.optimize_function
         optimize_kwargs = self.config.optimize_kwargs
+        if self.config.solver_telemetry:
+            # The solver log is captured below, it is never displayed
+            optimize_kwargs = dict(
+                optimize_kwargs,
+                **_solver_log_kwargs(optimize_function, optimize_kwargs),
+            )
         reinitialize_before_sweep = self.config.reinitialize_before_sweep
         reinitialize_function = self.config.reinitialize_function
         reinitialize_kwargs = self.config.reinitialize_kwargs
 
         run_successful = False  # until proven otherwise
 
+        # Timings and results of the solver calls for solver_telemetry
+        if solver_stats is None:
+            solver_stats = {}
+        solver_stats.update(optimize_time=0.0, reinitialize_time=0.0, reinitialized=0.0)
+        results = None
+
+        def _optimize():
+            nonlocal results
+            results = None
+            start = time.perf_counter()
+            try:
+                with capture_output() as log:
+                    results = optimize_function(model, **optimize_kwargs)
+            finally:
+                solver_stats["optimize_time"] += time.perf_counter() - start
+                solver_stats["log"] = log.getvalue()
+            pyo.assert_optimal_termination(results)
+
+        def _reinitialize():
+            start = time.perf_counter()
+            try:
+                reinitialize_function(model, **reinitialize_kwargs)
+            finally:
+                solver_stats["reinitialize_time"] += time.perf_counter() - start
+
         # Forced reinitialization of the flowsheet if enabled
         if reinitialize_before_sweep:
             if reinitialize_function is None:
@@ -426,25 +1765,29 @@ class _ParameterSweepBase(ABC):
                 for v, val in reinitialize_values.items():
                     if not v.fixed:
                         v.set_value(val, skip_validation=True)
-                reinitialize_function(model, **reinitialize_kwargs)
+                _reinitialize()
 
         try:
             # Simulate/optimize with this set of parameter
-            with capture_output():
-                results = optimize_function(model, **optimize_kwargs)
-            pyo.assert_optimal_termination(results)
+            _optimize()
+
+        except _CaseTimeout:
+            # Out of time, there is no point in reinitializing
+            raise
 
         except:
             # run_successful remains false. We try to reinitialize and solve again
             if reinitialize_function is not None:
+                solver_stats["reinitialized"] = 1.0
                 for v, val in reinitialize_values.items():
                     if not v.fixed:
                         v.set_value(val, skip_validation=True)
                 try:
-                    reinitialize_function(model, **reinitialize_kwargs)
-                    with capture_output():
-                        results = optimize_function(model, **optimize_kwargs)
-                    pyo.assert_optimal_termination(results)
+                    _reinitialize()
+                    _optimize()
+
+                except _CaseTimeout:
+                    raise
 
                 except:
                     pass  # run_successful is still False
@@ -455,9 +1798,60 @@ class _ParameterSweepBase(ABC):
             # If the simulation suceeds, report stats
             run_successful = True
 
+        solver_stats["results"] = results
+
         return run_successful
 
-    def _do_param_sweep(self, model, sweep_params, outputs, local_values):
+    def _get_reinitialize_values(self, model):
+
+        if self.config["reinitialize_function"] is not None:
+            reinitialize_values = ComponentMap()
+            for v in model.component_data_objects(pyo.Var):
+                reinitialize_values[v] = v.value
+        else:
+            reinitialize_values = None
+
+        return reinitialize_values
+
+    @contextlib.contextmanager
+    def _case_cache_session(self):
+        """
+        Closes the case cache opened by the cases solved in this context,
+        whether or not they all succeeded.
+        """
+
+        try:
+            yield
+        finally:
+            if self._case_cache is not None:
+                self._case_cache.close()
+                self._case_cache = None
+
+    def _start_case(self, model, case_number):
+        """
+        Called before case ``case_number`` of the local values is solved, with
+        the sweep parameters already set. Returns False if the case is not to
+        be solved.
+        """
+
+        return True
+
+    def _finish_case(self, model, case_number, run_successful):
+        """
+        Called after case ``case_number`` of the local values was solved.
+        """
+
+        pass
+
+    def _do_param_sweep(
+        self,
+        model,
+        sweep_params,
+        outputs,
+        local_values,
+        reinitialize_values=None,
+        local_case_indices=None,
+    ):
 
         # Create easy to read variables for configurations
         probe_function = self.config["probe_function"]
@@ -470,72 +1864,597 @@ class _ParameterSweepBase(ABC):
             model, sweep_params, outputs, local_num_cases
         )
 
-        local_results = np.zeros((local_num_cases, len(local_output_dict["outputs"])))
+        # The outputs of a case are written as one row of the columns of the
+        # outputs, which follow the sweep parameters
+        first_output = len(local_output_dict["sweep_params"])
+        local_results = _get_output_block(local_output_dict)[
+            :, first_output : first_output + len(local_output_dict["outputs"])
+        ]
+
+        # The outputs are compiled once for the skeleton they belong to
+        if self._output_extractor is None:
+            self._output_extractor = _OutputExtractor(
+                [item["_pyo_obj"] for item in local_output_dict["outputs"].values()]
+            )
+
+        local_solve_successful_list = [False] * local_num_cases
 
-        local_solve_successful_list = []
+        if self._progress is not None:
+            self._progress.add_cases(local_num_cases)
 
-        if self.config["reinitialize_function"] is not None:
-            reinitialize_values = ComponentMap()
-            for v in model.component_data_objects(pyo.Var):
-                reinitialize_values[v] = v.value
+        # Store the state of the model before the sweep unless the caller
+        # already took a snapshot of it
+        if reinitialize_values is None:
+            reinitialize_values = self._get_reinitialize_values(model)
+
+        if self.config.warm_start == "nearest" and self._warm_start_store is None:
+            self._warm_start_store = _WarmStartStore(
+                model, self.config.warm_start_max_points
+            )
+
+        if self.config.warm_start == "predictor" and self._predictor is None:
+            self._predictor = ParameterSweepPredictor(model, sweep_params)
+
+        if self.config.case_cache_dir is not None and self._case_cache is None:
+            self._case_cache = ParameterSweepCache(
+                self.config.case_cache_dir,
+                model,
+                sweep_params,
+                self.config.optimize_function,
+                self.config.optimize_kwargs,
+            )
+
+        if self.config.space_filling_order:
+            case_order = _space_filling_order(local_values)
         else:
-            reinitialize_values = None
+            case_order = range(local_num_cases)
+
+        # ================================================================
+        # Run all optimization cases
+        # ================================================================
+
+        # Checkpoints and streamed results are keyed by the global case index
+        checkpointing = (
+            local_case_indices is not None
+            and self.writer.config["checkpoint_dir"] is not None
+        )
+        streaming = (
+            local_case_indices is not None and self.writer.config["h5_streaming"]
+        )
+
+        for k in case_order:
+            if checkpointing and int(local_case_indices[k]) in self._checkpoint_cases:
+                # This case was solved before the sweep was interrupted
+                row, run_successful = self._checkpoint_cases[int(local_case_indices[k])]
+                self._set_output_row(local_output_dict, k, row)
+                local_solve_successful_list[k] = run_successful
+                if streaming:
+                    self.writer.stream_case(local_case_indices[k], row, run_successful)
+                if self._progress is not None:
+                    self._progress.case_done(run_successful)
+                continue
+
+            # Update the model values with a single combination from the parameter space
+            self._update_model_values(model, sweep_params, local_values[k, :])
+
+            # Start from the solution of the closest case solved so far
+            if self._warm_start_store:
+                self._warm_start_store.load_nearest(local_values[k, :], model)
+
+            # Step from the last solved case along the sensitivity of its solution
+            if self._predictor is not None:
+                self._predictor.predict(local_values[k, :], model)
+
+            solve_case = self._start_case(model, k)
+
+            solver_stats = {}
+            start = time.perf_counter()
+            run_successful = False
+
+            with _CaseTimer(self.config.case_timeout) as case_timer:
+                # A case rejected by the probe_function is not taken from the
+                # cache either
+                if solve_case and (probe_function is None or probe_function(model)):
+                    if self._case_cache is not None and self._case_cache.load(
+                        local_values[k, :], model
+                    ):
+                        # This case was solved by an earlier sweep, whose
+                        # solution is loaded into the model as if it had just
+                        # been solved, for the warm start of the next case
+                        run_successful = True
+                        solver_stats["cached"] = True
+                    else:
+                        run_successful = self._param_sweep_kernel(
+                            model,
+                            reinitialize_values,
+                            solver_stats,
+                        )
+                case_timer.finish()
+
+            solver_stats["wall_time"] = time.perf_counter() - start
+
+            if case_timer.expired:
+                # Even if the optimize_function caught the timeout, the
+                # case ran out of time and its solution is not trusted
+                run_successful = False
+                solver_stats["timed_out"] = True
+                if reinitialize_values is not None:
+                    # Do not start the next case from an abandoned solve
+                    for v, val in reinitialize_values.items():
+                        if not v.fixed:
+                            v.set_value(val, skip_validation=True)
+
+            self._finish_case(model, k, run_successful)
+
+            if run_successful and self._warm_start_store is not None:
+                self._warm_start_store.add(local_values[k, :], model)
+            if run_successful and self._predictor is not None:
+                self._predictor.add(local_values[k, :], model)
+
+            if (
+                run_successful
+                and self._case_cache is not None
+                and not solver_stats.get("cached", False)
+            ):
+                self._case_cache.store(local_values[k, :], model)
+
+            # Update the loop based on the reinitialization
+            self._update_local_output_dict(
+                model,
+                sweep_params,
+                k,
+                local_values[k, :],
+                run_successful,
+                local_output_dict,
+                local_results,
+            )
+
+            if "solver_stats" in local_output_dict:
+                self._update_solver_stats(local_output_dict, k, solver_stats)
+            if "solve_status" in local_output_dict:
+                local_output_dict["solve_status"]["timed_out"]["value"][k] = float(
+                    solver_stats.get("timed_out", False)
+                )
+
+            local_solve_successful_list[k] = run_successful
+
+            if checkpointing or streaming:
+                row = self._get_output_row(local_output_dict, k)
+                if checkpointing:
+                    self.writer.checkpoint_case(
+                        local_case_indices[k], row, run_successful
+                    )
+                if streaming:
+                    self.writer.stream_case(local_case_indices[k], row, run_successful)
+
+            if self._progress is not None:
+                self._progress.case_done(run_successful, solver_stats["wall_time"])
+
+        local_output_dict["solve_successful"] = local_solve_successful_list
+
+        return local_output_dict
+
+    @abstractmethod
+    def parameter_sweep(self, *args, **kwargs):
+        pass
+
+
+class ParameterSweep(_ParameterSweepBase):
+
+    CONFIG = _ParameterSweepBase.CONFIG()
+
+    CONFIG.declare(
+        "rank_local_sampling",
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description="Bool to decide whether random and LHS samples are drawn by every rank from independent numpy Generator streams instead of on rank 0.",
+        ),
+    )
+
+    CONFIG.declare(
+        "refinement_rounds",
+        ConfigValue(
+            default=3,
+            domain=PositiveInt,
+            description="Number of rounds of new points added after the initial grid of an adaptive sweep.",
+        ),
+    )
+
+    CONFIG.declare(
+        "scheduler",
+        ConfigValue(
+            default="static",
+            domain=In(["static", "dynamic"]),
+            description="Work distribution between MPI ranks: contiguous blocks (static) or chunks handed out on demand (dynamic).",
+        ),
+    )
+
+    CONFIG.declare(
+        "dynamic_chunk_size",
+        ConfigValue(
+            default=1,
+            domain=PositiveInt,
+            description="Number of cases handed out per request by the dynamic scheduler or to a multiprocessing worker.",
+        ),
+    )
+
+    CONFIG.declare(
+        "parallel_back_end",
+        ConfigValue(
+            default="MPI",
+            domain=In(["MPI", "multiprocessing"]),
+            description="Backend used to run the cases of each MPI rank (or of the single process when mpi4py is not installed).",
+        ),
+    )
+
+    CONFIG.declare(
+        "number_of_subprocesses",
+        ConfigValue(
+            default=None,
+            domain=PositiveInt,
+            description="Number of worker processes used by the multiprocessing backend. Defaults to the number of CPUs.",
+        ),
+    )
+
+    CONFIG.declare(
+        "progress_dir",
+        ConfigValue(
+            default=None,
+            domain=str,
+            description="directory path for the JSON status files reporting the progress of every rank and of the whole sweep.",
+        ),
+    )
+
+    CONFIG.declare(
+        "progress_interval",
+        ConfigValue(
+            default=10.0,
+            domain=PositiveFloat,
+            description="Minimum number of seconds between two updates of the progress status file of a rank.",
+        ),
+    )
+
+    CONFIG.declare(
+        "build_model",
+        ConfigValue(
+            default=None,
+            # domain=function,
+            description="Function returning a ready-to-solve copy of the model, called once in each multiprocessing worker.",
+        ),
+    )
+
+    CONFIG.declare(
+        "build_model_kwargs",
+        ConfigValue(
+            default=dict(),
+            domain=dict,
+            description="Keyword arguments for the build_model function.",
+        ),
+    )
+
+    def _do_param_sweep_multiprocessing(
+        self, model, sweep_params, outputs, local_values
+    ):
+
+        if self.config.build_model is None:
+            raise ValueError(
+                "The multiprocessing backend requires a build_model function to create the model in each worker process."
+            )
+
+        # Workers look up their own copies of the components by name
+        sweep_param_names = {
+            key: item.pyomo_object.name for key, item in sweep_params.items()
+        }
+        if outputs is None:
+            output_names = None
+        else:
+            output_names = {key: pyo_obj.name for key, pyo_obj in outputs.items()}
+
+        options = {
+            key: self.config[key]
+            for key in (
+                "optimize_function",
+                "optimize_kwargs",
+                "reinitialize_function",
+                "reinitialize_kwargs",
+                "reinitialize_before_sweep",
+                "probe_function",
+                "case_timeout",
+                "case_cache_dir",
+                "solver_telemetry",
+                "warm_start",
+                "warm_start_max_points",
+                "space_filling_order",
+            )
+        }
+
+        num_workers = self.config.number_of_subprocesses
+        if num_workers is None:
+            num_workers = os.cpu_count()
+
+        chunk_size = self.config.dynamic_chunk_size
+        local_num_cases = np.shape(local_values)[0]
+        chunks = [
+            local_values[start : start + chunk_size, :]
+            for start in range(0, local_num_cases, chunk_size)
+        ]
+
+        with _spawn_process_pool(
+            num_workers,
+            initializer=_init_multiprocessing_worker,
+            initargs=(
+                self.config.build_model,
+                self.config.build_model_kwargs,
+                sweep_param_names,
+                output_names,
+                options,
+            ),
+        ) as executor:
+            # map hands chunks to whichever worker is free and returns the
+            # results in submission order
+            local_output_collection = list(
+                executor.map(_run_multiprocessing_chunk, chunks)
+            )
+
+        return self._concatenate_output_dicts(
+            model, sweep_params, outputs, local_output_collection
+        )
+
+    def _do_param_sweep_dynamic(
+        self, model, sweep_params, outputs, global_values, num_global_cases
+    ):
+
+        # Take a single snapshot of the model for reinitialization so that
+        # every chunk starts from the same state as a static sweep would
+        reinitialize_values = self._get_reinitialize_values(model)
+
+        local_output_collection = []
+        local_case_indices = []
+
+        with _DynamicScheduler(
+            self.comm, num_global_cases, self.config.dynamic_chunk_size
+        ) as scheduler:
+            for start, stop in scheduler.chunks():
+                local_output_collection.append(
+                    self._do_param_sweep(
+                        model,
+                        sweep_params,
+                        outputs,
+                        self._get_case_values(
+                            sweep_params, global_values, np.arange(start, stop)
+                        ),
+                        reinitialize_values,
+                        np.arange(start, stop),
+                    )
+                )
+                local_case_indices.extend(range(start, stop))
+
+        local_output_dict = self._concatenate_output_dicts(
+            model, sweep_params, outputs, local_output_collection
+        )
+
+        return local_output_dict, np.array(local_case_indices, dtype=np.int64)
+
+    def _concatenate_output_dicts(
+        self, model, sweep_params, outputs, local_output_collection
+    ):
+
+        local_num_cases = sum(
+            len(content["solve_successful"]) for content in local_output_collection
+        )
+
+        local_output_dict = self._create_local_output_skeleton(
+            model, sweep_params, outputs, local_num_cases
+        )
+        local_output_dict["solve_successful"] = []
+
+        offset = 0
+        for content in local_output_collection:
+            stop = offset + len(content["solve_successful"])
+
+            for key, item in content.items():
+                if key != "solve_successful":
+                    for subkey, subitem in item.items():
+                        local_output_dict[key][subkey]["value"][offset:stop] = subitem[
+                            "value"
+                        ]
+
+            local_output_dict["solve_successful"].extend(content["solve_successful"])
+
+            offset = stop
+
+        return local_output_dict
+
+    def _aggregate_local_results(
+        self,
+        num_global_samples,
+        local_output_dict,
+        num_samples,
+        local_num_cases,
+        local_case_indices=None,
+    ):
+
+        # Create the dictionary
+        global_results_dict = self._create_global_output(
+            local_output_dict, num_samples, local_case_indices
+        )
+
+        # Create the array
+        global_results_arr = self._aggregate_results_arr(
+            global_results_dict, num_global_samples
+        )
 
-        # ================================================================
-        # Run all optimization cases
-        # ================================================================
+        return global_results_dict, global_results_arr
 
-        for k in range(local_num_cases):
-            # Update the model values with a single combination from the parameter space
-            self._update_model_values(model, sweep_params, local_values[k, :])
+    def _run_cases(self, model, sweep_params, outputs, global_values, num_global_cases):
 
-            if probe_function is None or probe_function(model):
-                run_successful = self._param_sweep_kernel(
-                    model,
-                    reinitialize_values,
-                )
-            else:
-                run_successful = False
+        if self.config.parallel_back_end == "multiprocessing":
+            # divide the workload between processors, then between the
+            # worker processes of each processor
+            local_values = self._get_case_values(
+                sweep_params,
+                global_values,
+                self._divide_case_indices(num_global_cases),
+            )
+            local_num_cases = np.shape(local_values)[0]
+            local_case_indices = None
 
-            # Update the loop based on the reinitialization
-            self._update_local_output_dict(
+            local_results_dict = self._do_param_sweep_multiprocessing(
                 model,
                 sweep_params,
-                k,
-                local_values[k, :],
-                run_successful,
-                local_output_dict,
+                outputs,
+                local_values,
             )
 
-            local_solve_successful_list.append(run_successful)
+        elif self.config.scheduler == "dynamic":
+            # Do the Loop, requesting work from rank 0 as this rank becomes idle
+            local_results_dict, local_case_indices = self._do_param_sweep_dynamic(
+                model,
+                sweep_params,
+                outputs,
+                global_values,
+                num_global_cases,
+            )
+            local_values = self._get_case_values(
+                sweep_params, global_values, local_case_indices
+            )
+            local_num_cases = np.shape(local_values)[0]
 
-        local_output_dict["solve_successful"] = local_solve_successful_list
+        else:
+            # divide the workload between processors
+            divided_case_indices = self._divide_case_indices(num_global_cases)
+            local_values = self._get_case_values(
+                sweep_params, global_values, divided_case_indices
+            )
+            local_num_cases = np.shape(local_values)[0]
+            local_case_indices = None
 
-        return local_output_dict
+            # Do the Loop
+            local_results_dict = self._do_param_sweep(
+                model,
+                sweep_params,
+                outputs,
+                local_values,
+                local_case_indices=divided_case_indices,
+            )
 
-    @abstractmethod
-    def parameter_sweep(self, *args, **kwargs):
-        pass
+        return local_values, local_results_dict, local_num_cases, local_case_indices
 
+    def _adaptive_parameter_sweep(self, model, sweep_params, outputs, num_samples):
 
-class ParameterSweep(_ParameterSweepBase):
+        if self.writer.config["checkpoint_dir"] is not None:
+            raise ValueError("Checkpointing is not supported with adaptive sampling.")
+        if self.writer.config["h5_streaming"]:
+            raise ValueError(
+                "Streaming the results is not supported with adaptive sampling."
+            )
+        if self.writer.config["h5_parallel"]:
+            raise ValueError(
+                "Writing the results in parallel is not supported with adaptive sampling."
+            )
+        if self.config.progress_dir is not None:
+            raise ValueError(
+                "Progress reporting is not supported with adaptive sampling."
+            )
 
-    CONFIG = _ParameterSweepBase.CONFIG()
+        lower_limits = [item.lower_limit for item in sweep_params.values()]
+        upper_limits = [item.upper_limit for item in sweep_params.values()]
 
-    def _aggregate_local_results(
-        self, global_values, local_output_dict, num_samples, local_num_cases
-    ):
+        # The first round is the grid of every combination
+        num_round_cases = self._get_num_combinations(
+            sweep_params, SamplingType.ADAPTIVE, None
+        )
+        round_values = self._decode_fixed_combinations(
+            sweep_params, np.arange(num_round_cases)
+        )
+        if num_samples is None:
+            num_samples = num_round_cases
+
+        local_values_collection = []
+        local_output_collection = []
+        global_output_collection = []
+        global_values = np.zeros((0, len(sweep_params)), dtype=np.float64)
+        global_results_arr = None
+        global_solve_successful = np.zeros(0, dtype=bool)
+
+        for refinement_round in range(self.config.refinement_rounds + 1):
+            if refinement_round > 0:
+                # Every rank holds all results so far and picks the same points.
+                # Only the outputs steer the refinement, not the solver
+                # statistics or solve status that follow them
+                round_values = adaptive_refinement_points(
+                    global_values,
+                    global_results_arr[:, :num_outputs],
+                    global_solve_successful,
+                    lower_limits,
+                    upper_limits,
+                    num_samples,
+                )
+                if len(round_values) == 0:
+                    break
+
+            num_round_cases = np.shape(round_values)[0]
+
+            with self._case_cache_session():
+                (
+                    local_values,
+                    local_results_dict,
+                    local_num_cases,
+                    local_case_indices,
+                ) = self._run_cases(
+                    model, sweep_params, outputs, round_values, num_round_cases
+                )
 
-        # Create the dictionary
-        global_results_dict = self._create_global_output(local_output_dict, num_samples)
+            round_results_dict, round_results_arr = self._aggregate_local_results(
+                num_round_cases,
+                local_results_dict,
+                None,
+                local_num_cases,
+                local_case_indices,
+            )
 
-        # Create the array
-        num_global_samples = np.shape(global_values)[0]
-        global_results_arr = self._aggregate_results_arr(
-            global_results_dict, num_global_samples
+            if self.rank == 0:
+                round_solve_successful = np.asarray(
+                    round_results_dict["solve_successful"], dtype=bool
+                )
+            else:
+                round_solve_successful = np.zeros(num_round_cases, dtype=bool)
+            if self.num_procs > 1:
+                self.comm.Bcast(round_solve_successful, root=0)
+
+            num_outputs = len(local_results_dict["outputs"])
+            local_values_collection.append(local_values)
+            local_output_collection.append(local_results_dict)
+            global_output_collection.append(round_results_dict)
+
+            global_values = np.vstack((global_values, round_values))
+            if global_results_arr is None:
+                global_results_arr = round_results_arr
+            else:
+                global_results_arr = np.vstack((global_results_arr, round_results_arr))
+            global_solve_successful = np.concatenate(
+                (global_solve_successful, round_solve_successful)
+            )
+
+        # The cases of all rounds are reported in the order they were added
+        global_results_dict = self._concatenate_output_dicts(
+            model, sweep_params, outputs, global_output_collection
+        )
+        local_results_dict = self._concatenate_output_dicts(
+            model, sweep_params, outputs, local_output_collection
         )
 
-        return global_results_dict, global_results_arr
+        global_save_data = self.writer.save_results(
+            sweep_params,
+            np.vstack(local_values_collection),
+            global_values,
+            local_results_dict,
+            global_results_dict,
+            global_results_arr,
+        )
+
+        return global_save_data
 
     def parameter_sweep(
         self,
@@ -544,36 +2463,131 @@ class ParameterSweep(_ParameterSweepBase):
         outputs=None,
         num_samples=None,
         seed=None,
+        resume=False,
     ):
 
         # Convert sweep_params to LinearSamples
         sweep_params, sampling_type = self._process_sweep_params(sweep_params)
+        outputs = self._process_outputs(model, outputs)
+
+        # Solutions from a previous sweep do not carry over
+        self._warm_start_store = None
+        self._predictor = None
+        self._output_skeleton = None
+        self._output_extractor = None
+        self._case_cache = None
+        self._progress = None
+
+        if sampling_type == SamplingType.ADAPTIVE:
+            if resume:
+                raise ValueError("Resuming is not supported with adaptive sampling.")
+            return self._adaptive_parameter_sweep(
+                model, sweep_params, outputs, num_samples
+            )
 
-        # Set the seed before sampling
-        np.random.seed(seed)
-
-        # Enumerate/Sample the parameter space
-        global_values = self._build_combinations(
+        num_global_cases = self._get_num_combinations(
             sweep_params, sampling_type, num_samples
         )
 
-        # divide the workload between processors
-        local_values = self._divide_combinations(global_values)
-        local_num_cases = np.shape(local_values)[0]
+        self._rank_local_sampler = None
+        if sampling_type == SamplingType.LOW_DISCREPANCY or (
+            sampling_type != SamplingType.FIXED and self.config.rank_local_sampling
+        ):
+            # Only the root entropy is shared, each rank draws its own cases
+            entropy = np.random.SeedSequence(seed).entropy
+            if self.num_procs > 1:
+                entropy = self.comm.bcast(entropy, root=0)
+            if sampling_type == SamplingType.LOW_DISCREPANCY:
+                self._rank_local_sampler = _LowDiscrepancySampler(sweep_params, entropy)
+            else:
+                self._rank_local_sampler = _RankLocalSampler(
+                    sweep_params, sampling_type, num_global_cases, entropy
+                )
+        else:
+            # Set the seed before sampling
+            np.random.seed(seed)
 
-        # Do the Loop
-        local_results_dict = self._do_param_sweep(
-            model,
-            sweep_params,
-            outputs,
-            local_values,
-        )
+        # Enumerate/Sample the parameter space. The combinations of a FIXED
+        # grid are instead decoded by each rank from the case indices it works on
+        if sampling_type == SamplingType.FIXED or self._rank_local_sampler is not None:
+            global_values = None
+        else:
+            global_values = self._build_combinations(
+                sweep_params, sampling_type, num_samples
+            )
+
+        if self.writer.config["checkpoint_dir"] is not None:
+            if self.config.parallel_back_end == "multiprocessing":
+                raise ValueError(
+                    "Checkpointing is not supported with the multiprocessing backend."
+                )
+            # Pick up the cases solved by a previous, interrupted sweep
+            self._start_checkpoint(
+                model, sweep_params, outputs, global_values, num_global_cases, resume
+            )
+        elif resume:
+            raise ValueError("Resuming a parameter sweep requires a checkpoint_dir.")
+
+        if self.config.progress_dir is not None:
+            if self.config.parallel_back_end == "multiprocessing":
+                raise ValueError(
+                    "Progress reporting is not supported with the multiprocessing backend."
+                )
+            self._progress = _SweepProgress(
+                self.config.progress_dir,
+                self.rank,
+                self.num_procs,
+                num_global_cases,
+                self.config.progress_interval,
+            )
+
+        if self.writer.config["h5_streaming"]:
+            if self.config.parallel_back_end == "multiprocessing":
+                raise ValueError(
+                    "Streaming the results is not supported with the multiprocessing backend."
+                )
+            self.writer.start_stream(
+                self._create_local_output_skeleton(model, sweep_params, outputs, 0)
+            )
+
+        with self._case_cache_session():
+            (
+                local_values,
+                local_results_dict,
+                local_num_cases,
+                local_case_indices,
+            ) = self._run_cases(
+                model, sweep_params, outputs, global_values, num_global_cases
+            )
+
+        if self.writer.config["checkpoint_dir"] is not None:
+            self.writer.flush_checkpoint()
+        if self.writer.config["h5_streaming"]:
+            self.writer.flush_stream()
+        if self._progress is not None:
+            self._progress.write(finished=True)
 
         # Aggregate results on Master
         global_results_dict, global_results_arr = self._aggregate_local_results(
-            global_values, local_results_dict, num_samples, local_num_cases
+            num_global_cases,
+            local_results_dict,
+            num_samples,
+            local_num_cases,
+            local_case_indices,
         )
 
+        # Every rank wrote its final status before the results were gathered
+        if self._progress is not None and self.rank == 0:
+            self._progress.write_summary()
+
+        # The combined results are reported next to every combination. The
+        # ranks generated their own cases, which are collected rather than
+        # generated again
+        if global_values is None:
+            global_values = self._gather_case_values(
+                local_values, local_case_indices, num_global_cases
+            )
+
         # Save to file
         global_save_data = self.writer.save_results(
             sweep_params,
@@ -582,6 +2596,7 @@ class ParameterSweep(_ParameterSweepBase):
             local_results_dict,
             global_results_dict,
             global_results_arr,
+            local_case_indices,
         )
 
         return global_save_data
@@ -591,6 +2606,33 @@ class RecursiveParameterSweep(_ParameterSweepBase):
 
     CONFIG = _ParameterSweepBase.CONFIG()
 
+    CONFIG.declare(
+        "failure_screening",
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description="Bool to decide whether new samples whose nearest solved samples mostly failed are skipped instead of solved.",
+        ),
+    )
+
+    CONFIG.declare(
+        "screening_neighbors",
+        ConfigValue(
+            default=5,
+            domain=PositiveInt,
+            description="Number of nearest solved samples used to screen a new sample.",
+        ),
+    )
+
+    CONFIG.declare(
+        "screening_threshold",
+        ConfigValue(
+            default=0.1,
+            domain=float,
+            description="New samples with a smaller fraction of successful solves among their nearest solved samples are skipped.",
+        ),
+    )
+
     def _filter_recursive_solves(
         self, model, sweep_params, outputs, recursive_local_dict
     ):
@@ -635,6 +2677,26 @@ class RecursiveParameterSweep(_ParameterSweepBase):
 
         return local_filtered_dict, filter_counter
 
+    def _screen_samples(self, global_values, solved_values, solved_successful):
+        """
+        Drops the samples for which too few of the nearest solved samples
+        succeeded, and returns the remaining samples and the fraction kept.
+        """
+
+        success_fraction = _knn_success_fraction(
+            solved_values,
+            solved_successful,
+            global_values,
+            self.config.screening_neighbors,
+        )
+        keep = success_fraction >= self.config.screening_threshold
+
+        if not np.any(keep):
+            # Rather solve every sample than none of them
+            return global_values, 1.0
+
+        return global_values[keep, :], max(np.mean(keep), 0.1)
+
     def _aggregate_filtered_input_arr(self, global_filtered_dict, req_num_samples):
 
         global_filtered_values = np.zeros(
@@ -676,8 +2738,28 @@ class RecursiveParameterSweep(_ParameterSweepBase):
         seed=None,
     ):
 
+        # The samples of every iteration depend on the solves of the previous
+        # ones, so they have no fixed global case index to checkpoint or
+        # stream the results by
+        if self.writer.config["checkpoint_dir"] is not None:
+            raise ValueError(
+                "Checkpointing is not supported by the recursive parameter sweep."
+            )
+        if self.writer.config["h5_streaming"]:
+            raise ValueError(
+                "Streaming the results is not supported by the recursive parameter sweep."
+            )
+
         # Convert sweep_params to LinearSamples
         sweep_params, sampling_type = self._process_sweep_params(sweep_params)
+        outputs = self._process_outputs(model, outputs)
+
+        # Solutions from a previous sweep do not carry over
+        self._warm_start_store = None
+        self._predictor = None
+        self._output_skeleton = None
+        self._output_extractor = None
+        self._case_cache = None
 
         # Set the seed before sampling
         np.random.seed(seed)
@@ -687,24 +2769,55 @@ class RecursiveParameterSweep(_ParameterSweepBase):
 
         local_output_collection = {}
         loop_ctr = 0
+
+        # The samples solved so far and their solve status, known on every
+        # rank, to screen the samples of later iterations
+        solved_values = []
+        solved_successful = []
+        kept_fraction = 1.0
+
         while n_samples_remaining > 0 and loop_ctr < 10:
-            # Enumerate/Sample the parameter space
+            # Enumerate/Sample the parameter space. When screening, enough
+            # samples are drawn that about num_total_samples of them are kept
             global_values = self._build_combinations(
-                sweep_params, sampling_type, num_total_samples
+                sweep_params,
+                sampling_type,
+                int(np.ceil(num_total_samples / kept_fraction)),
             )
 
+            if self.config.failure_screening and loop_ctr > 0:
+                global_values, kept_fraction = self._screen_samples(
+                    global_values,
+                    np.vstack(solved_values),
+                    np.concatenate(solved_successful),
+                )
+
             # divide the workload between processors
             local_values = self._divide_combinations(global_values)
             local_num_cases = np.shape(local_values)[0]
             if loop_ctr == 0:
                 true_local_num_cases = local_num_cases
 
-            local_output_collection[loop_ctr] = self._do_param_sweep(
-                model,
-                sweep_params,
-                outputs,
-                local_values,
-            )
+            with self._case_cache_session():
+                local_output_collection[loop_ctr] = self._do_param_sweep(
+                    model,
+                    sweep_params,
+                    outputs,
+                    local_values,
+                )
+
+            if self.config.failure_screening:
+                solved_values.append(global_values)
+                solved_successful.append(
+                    np.concatenate(
+                        self.comm.allgather(
+                            np.asarray(
+                                local_output_collection[loop_ctr]["solve_successful"],
+                                dtype=bool,
+                            )
+                        )
+                    )
+                )
 
             # Get the number of successful solves on this proc (sum of boolean flags)
             success_count = sum(local_output_collection[loop_ctr]["solve_successful"])
@@ -781,3 +2894,321 @@ class RecursiveParameterSweep(_ParameterSweepBase):
         )
 
         return global_save_data
+
+
+# The perturbation of a single parameter of a differential sweep, see
+# DifferentialParameterSweep.CONFIG.differential_sweep_specs
+_DIFFERENTIAL_SPEC = ConfigDict()
+_DIFFERENTIAL_SPEC.declare("pyomo_object", ConfigValue(default=None))
+_DIFFERENTIAL_SPEC.declare("step", ConfigValue(default=None, domain=PositiveFloat))
+_DIFFERENTIAL_SPEC.declare("relative", ConfigValue(default=True, domain=bool))
+
+
+class DifferentialParameterSweep(_ParameterSweepBase):
+    """
+    Solves every nominal case of a sweep together with small perturbations of
+    selected parameters, each started from the solution of its nominal case,
+    and fits the local sensitivities of the outputs to these parameters at
+    every nominal case.
+    """
+
+    CONFIG = _ParameterSweepBase.CONFIG()
+
+    CONFIG.declare(
+        "differential_sweep_specs",
+        ConfigValue(
+            default=dict(),
+            domain=dict,
+            description="Parameters perturbed around every nominal case, keyed by the name of a sweep parameter or of another parameter, with their step, whether the step is relative to the nominal value (absolute where the nominal value is zero), and the pyomo_object of parameters that are not swept, e.g., {'fs.input[a]': {'step': 0.01}}.",
+        ),
+    )
+
+    CONFIG.declare(
+        "differential_sampling",
+        ConfigValue(
+            default="central",
+            domain=In(["central", "uniform"]),
+            description="Perturbations of every nominal case: one step up and one step down in every perturbed parameter (central), or num_diff_samples points drawn uniformly within one step of the nominal case (uniform).",
+        ),
+    )
+
+    CONFIG.declare(
+        "num_diff_samples",
+        ConfigValue(
+            default=None,
+            domain=PositiveInt,
+            description="Number of uniform perturbations of every nominal case, by default twice the number of perturbed parameters.",
+        ),
+    )
+
+    def __init__(
+        self,
+        **options,
+    ):
+
+        super().__init__(**options)
+
+        # Every nominal case is followed by its perturbations in the cases of
+        # a rank, and the perturbations start from the solution of the
+        # nominal case, if it was solved
+        self._group_size = 1
+        self._variables = []
+        self._nominal_state = None
+
+        # Local sensitivities of the outputs fitted by the last sweep
+        self.differential_params = []
+        self.nominal_values = None
+        self.sensitivities = {}
+
+    def _process_differential_specs(self, sweep_params):
+
+        specs = {}
+        for name, spec in self.config.differential_sweep_specs.items():
+            spec = _DIFFERENTIAL_SPEC(spec)
+            if name in sweep_params:
+                pyomo_object = sweep_params[name].pyomo_object
+            elif spec.pyomo_object is not None:
+                pyomo_object = spec.pyomo_object
+            else:
+                raise ValueError(
+                    f"The differential parameter {name} is not a sweep parameter and has no pyomo_object."
+                )
+            if spec.step is None:
+                raise ValueError(f"The differential parameter {name} has no step.")
+            specs[name] = (pyomo_object, spec.step, spec.relative)
+
+        if not specs:
+            raise ValueError("A differential sweep requires differential_sweep_specs.")
+
+        return specs
+
+    def _build_differential_values(self, sweep_params, specs, nominal_values, seed):
+        """
+        Returns the values of the sweep parameters, followed by the perturbed
+        parameters that are not swept, of every nominal case followed by its
+        perturbations, and the columns of the perturbed parameters.
+        """
+
+        names = list(sweep_params)
+        names.extend(name for name in specs if name not in sweep_params)
+        columns = [names.index(name) for name in specs]
+
+        # The parameters that are not swept are perturbed around their value
+        # in the model
+        num_nominal = np.shape(nominal_values)[0]
+        nominal_values = np.hstack(
+            (
+                nominal_values,
+                np.tile(
+                    [
+                        pyo.value(pyomo_object)
+                        for name, (pyomo_object, step, relative) in specs.items()
+                        if name not in sweep_params
+                    ],
+                    (num_nominal, 1),
+                ),
+            )
+        )
+
+        # Offsets of the perturbations in units of the steps
+        num_params = len(specs)
+        if self.config.differential_sampling == "central":
+            offsets = np.repeat(np.eye(num_params), 2, axis=0)
+            offsets[1::2, :] *= -1.0
+            offsets = np.broadcast_to(offsets, (num_nominal,) + offsets.shape)
+        else:
+            num_diff_samples = self.config.num_diff_samples
+            if num_diff_samples is None:
+                num_diff_samples = 2 * num_params
+            offsets = None
+            if self.rank == 0:
+                offsets = np.random.default_rng(seed).uniform(
+                    -1.0, 1.0, (num_nominal, num_diff_samples, num_params)
+                )
+            offsets = self.comm.bcast(offsets, root=0)
+
+        steps = np.array([step for pyomo_object, step, relative in specs.values()])
+        relative = np.array(
+            [relative for pyomo_object, step, relative in specs.values()]
+        )
+        # A relative step of a zero nominal value is taken as an absolute step,
+        # or the perturbations would all be the nominal case
+        nominal_scale = np.abs(nominal_values[:, columns])
+        scale = np.where(relative & (nominal_scale > 0.0), steps * nominal_scale, steps)
+
+        self._group_size = 1 + offsets.shape[1]
+        values = np.repeat(nominal_values[:, np.newaxis, :], self._group_size, axis=1)
+        values[:, 1:, columns] += offsets * scale[:, np.newaxis, :]
+
+        return values.reshape(num_nominal * self._group_size, -1), columns
+
+    def _start_case(self, model, case_number):
+
+        if case_number % self._group_size == 0:
+            return True
+
+        # The perturbations of a failed nominal case are not solved
+        if self._nominal_state is None:
+            return False
+
+        for v, val in zip(self._variables, self._nominal_state):
+            if not v.fixed and not np.isnan(val):
+                v.set_value(val, skip_validation=True)
+
+        return True
+
+    def _finish_case(self, model, case_number, run_successful):
+
+        if case_number % self._group_size != 0:
+            return
+
+        if run_successful:
+            self._nominal_state = np.array(
+                [np.nan if v.value is None else v.value for v in self._variables],
+                dtype=np.float64,
+            )
+        else:
+            self._nominal_state = None
+
+    def _fit_sensitivities(self, global_values, output_values, columns):
+        """
+        Returns the least-squares derivatives of the outputs with respect to
+        the perturbed parameters at every nominal case, as a (nominal cases x
+        outputs x perturbed parameters) array, from the perturbations that
+        were solved. The derivatives are NaN at the nominal cases that failed
+        or whose solved perturbations do not determine them, i.e., that have
+        fewer linearly independent solved perturbations than perturbed
+        parameters.
+        """
+
+        num_nominal = np.shape(global_values)[0] // self._group_size
+        values = global_values[:, columns].reshape(
+            num_nominal, self._group_size, len(columns)
+        )
+        results = output_values.reshape(num_nominal, self._group_size, -1)
+
+        sensitivities = np.full((num_nominal, results.shape[2], len(columns)), np.nan)
+        for n in range(num_nominal):
+            d_values = values[n, 1:, :] - values[n, 0, :]
+            d_results = results[n, 1:, :] - results[n, 0, :]
+            solved = np.all(np.isfinite(d_results), axis=1)
+            if np.sum(solved) < len(columns):
+                continue
+            solution, _, rank, _ = lstsq(d_values[solved], d_results[solved])
+            if rank == len(columns):
+                sensitivities[n, :, :] = solution.T
+
+        return sensitivities
+
+    def parameter_sweep(
+        self,
+        model,
+        sweep_params,
+        outputs=None,
+        num_samples=None,
+        seed=None,
+    ):
+
+        # Convert sweep_params to LinearSamples
+        sweep_params, sampling_type = self._process_sweep_params(sweep_params)
+        outputs = self._process_outputs(model, outputs)
+
+        if sampling_type == SamplingType.ADAPTIVE:
+            raise ValueError(
+                "Adaptive sampling is not supported by the differential sweep."
+            )
+        # Every perturbation has to be solved right after its nominal case
+        if self.config.space_filling_order:
+            raise ValueError(
+                "The space_filling_order is not supported by the differential sweep."
+            )
+        if (
+            self.writer.config["checkpoint_dir"] is not None
+            or self.writer.config["h5_streaming"]
+        ):
+            raise ValueError(
+                "Checkpointing and streaming the results are not supported by the differential sweep."
+            )
+
+        specs = self._process_differential_specs(sweep_params)
+
+        # Solutions from a previous sweep do not carry over
+        self._warm_start_store = None
+        self._predictor = None
+        self._output_skeleton = None
+        self._output_extractor = None
+        self._case_cache = None
+        self._variables = list(model.component_data_objects(pyo.Var))
+        self._nominal_state = None
+
+        # Set the seed before sampling
+        np.random.seed(seed)
+
+        nominal_values = self._build_combinations(
+            sweep_params, sampling_type, num_samples
+        )
+        global_values, columns = self._build_differential_values(
+            sweep_params, specs, nominal_values, seed
+        )
+        num_global_cases = np.shape(global_values)[0]
+
+        # The perturbed parameters that are not swept are set like the sweep
+        # parameters, and restored after the sweep
+        all_params = dict(sweep_params)
+        unswept_values = ComponentMap()
+        for name, (pyomo_object, step, relative) in specs.items():
+            if name not in all_params:
+                all_params[name] = LinearSample(pyomo_object, None, None, None)
+                unswept_values[pyomo_object] = pyo.value(pyomo_object)
+
+        # Every rank solves whole nominal cases with their perturbations
+        nominal_indices = self._divide_case_indices(np.shape(nominal_values)[0])
+        local_rows = (
+            nominal_indices[:, np.newaxis] * self._group_size
+            + np.arange(self._group_size)
+        ).reshape(-1)
+        local_values = global_values[local_rows, :]
+
+        with self._case_cache_session():
+            local_results_dict = self._do_param_sweep(
+                model, all_params, outputs, local_values
+            )
+        self._nominal_state = None
+
+        for pyomo_object, val in unswept_values.items():
+            if pyomo_object.is_variable_type():
+                pyomo_object.fix(val)
+            else:
+                pyomo_object.set_value(val)
+
+        # Aggregate results on Master
+        global_results_dict = self._create_global_output(
+            local_results_dict, num_global_cases
+        )
+        global_results_arr = self._aggregate_results_arr(
+            global_results_dict, num_global_cases
+        )
+
+        # Save to file
+        global_save_data = self.writer.save_results(
+            all_params,
+            local_values,
+            global_values,
+            local_results_dict,
+            global_results_dict,
+            global_results_arr,
+        )
+
+        # The outputs are the first result columns on every rank
+        output_names = list(global_results_dict["outputs"])
+        sensitivities = self._fit_sensitivities(
+            global_values, global_results_arr[:, : len(output_names)], columns
+        )
+
+        self.differential_params = list(specs)
+        self.nominal_values = global_values[:: self._group_size, :]
+        self.sensitivities = {
+            name: sensitivities[:, j, :] for j, name in enumerate(output_names)
+        }
+
+        return global_save_data
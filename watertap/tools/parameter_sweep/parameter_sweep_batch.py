@@ -0,0 +1,270 @@
+###############################################################################
+# WaterTAP Copyright (c) 2021, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National
+# Laboratory, National Renewable Energy Laboratory, and National Energy
+# Technology Laboratory (subject to receipt of any required approvals from
+# the U.S. Dept. of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#
+###############################################################################
+import os
+import numpy as np
+
+from pyomo.common.config import ConfigDict, ConfigValue, PositiveFloat
+
+from watertap.tools.parameter_sweep.parameter_sweep import _spawn_process_pool
+from watertap.tools.parameter_sweep.parameter_sweep_functions import parameter_sweep
+
+import watertap.tools.MPI as MPI
+from watertap.tools.MPI.dummy_mpi import DummyCOMM
+
+# A job of a batch of parameter sweeps, see batch_parameter_sweep
+_JOB = ConfigDict()
+_JOB.declare(
+    "build_model",
+    ConfigValue(
+        default=None,
+        description="Function that builds and returns the model of the job.",
+    ),
+)
+_JOB.declare(
+    "build_model_kwargs",
+    ConfigValue(
+        default=dict(),
+        domain=dict,
+        description="Keyword arguments for the build_model function.",
+    ),
+)
+_JOB.declare(
+    "build_sweep_params",
+    ConfigValue(
+        default=None,
+        description="Function of the model that returns the sweep parameters of the job.",
+    ),
+)
+_JOB.declare(
+    "build_sweep_params_kwargs",
+    ConfigValue(
+        default=dict(),
+        domain=dict,
+        description="Keyword arguments for the build_sweep_params function.",
+    ),
+)
+_JOB.declare(
+    "build_outputs",
+    ConfigValue(
+        default=None,
+        description="Function of the model that returns the outputs of the job, by default all of the variables of the model are outputs.",
+    ),
+)
+_JOB.declare(
+    "build_outputs_kwargs",
+    ConfigValue(
+        default=dict(),
+        domain=dict,
+        description="Keyword arguments for the build_outputs function.",
+    ),
+)
+_JOB.declare(
+    "sweep_kwargs",
+    ConfigValue(
+        default=dict(),
+        domain=dict,
+        description="Keyword arguments of parameter_sweep for the job, e.g., its optimize_function and result file names.",
+    ),
+)
+_JOB.declare(
+    "cost",
+    ConfigValue(
+        default=1.0,
+        domain=PositiveFloat,
+        description="Estimated cost of the job relative to the other jobs, e.g., its number of cases times the relative time to solve a case.",
+    ),
+)
+
+
+def _lpt_schedule(costs, group_sizes):
+    """
+    Assigns jobs of the given ``costs`` to groups of ``group_sizes`` ranks by
+    the longest processing time first rule: every job, from the most to the
+    least expensive, goes to the group on which it would finish first, with
+    the cost of a job divided among the ranks of its group. Returns the group
+    of every job.
+    """
+
+    costs = np.asarray(costs, dtype=np.float64)
+    group_sizes = np.asarray(group_sizes, dtype=np.float64)
+
+    loads = np.zeros(len(group_sizes))
+    job_groups = np.empty(len(costs), dtype=np.int64)
+    for j in np.argsort(-costs, kind="stable"):
+        group = int(np.argmin((loads + costs[j]) / group_sizes))
+        job_groups[j] = group
+        loads[group] += costs[j]
+
+    return job_groups
+
+
+def _run_job(job, mpi_comm):
+    model = job["build_model"](**job["build_model_kwargs"])
+    sweep_params = job["build_sweep_params"](model, **job["build_sweep_params_kwargs"])
+    if job["build_outputs"] is None:
+        outputs = None
+    else:
+        outputs = job["build_outputs"](model, **job["build_outputs_kwargs"])
+
+    return parameter_sweep(
+        model, sweep_params, outputs=outputs, mpi_comm=mpi_comm, **job["sweep_kwargs"]
+    )
+
+
+def batch_parameter_sweep(
+    jobs,
+    mpi_comm=None,
+    num_groups=None,
+    parallel_back_end="MPI",
+    number_of_subprocesses=None,
+):
+    """
+    This function runs a batch of independent parameter sweeps, e.g., of
+    several variants of a flowsheet, concurrently instead of one after
+    another. The ranks are split into groups, the jobs are assigned to the
+    groups by their estimated cost, from the most expensive job to the least
+    expensive one, so that the groups finish at about the same time, and
+    every group runs the sweeps of its jobs one after another with all of its
+    ranks. Every job writes its results as ``parameter_sweep`` does, so every
+    job should be given its own result file names.
+
+    Arguments:
+
+        jobs : A list of dictionaries, one per parameter sweep, with the keys
+
+               * ``"build_model"``: a function that builds and returns the model,
+               * ``"build_model_kwargs"`` (optional): its keyword arguments,
+               * ``"build_sweep_params"``: a function of the model that returns the
+                 sweep parameters, in the format of ``parameter_sweep``,
+               * ``"build_sweep_params_kwargs"`` (optional): its keyword arguments,
+               * ``"build_outputs"`` (optional): a function of the model that returns
+                 the outputs, in the format of ``parameter_sweep``. By default all of
+                 the variables of the model are outputs,
+               * ``"build_outputs_kwargs"`` (optional): its keyword arguments,
+               * ``"sweep_kwargs"`` (optional): the other keyword arguments of
+                 ``parameter_sweep``, e.g., ``optimize_function`` and
+                 ``csv_results_file_name``,
+               * ``"cost"`` (optional): the estimated cost of the job relative to
+                 the other jobs, e.g., its number of cases times the relative time
+                 to solve a case. The default is 1.
+
+               With the multiprocessing backend, the functions must be importable,
+               i.e., defined at the top level of a module.
+
+        mpi_comm (optional) : User-provided MPI communicator whose ranks run the jobs. The
+                              default is ``MPI.COMM_WORLD``.
+
+        num_groups (optional) : Number of groups of ranks that run jobs concurrently. The
+                                default is one rank per job, as far as there are ranks.
+
+        parallel_back_end (optional) : With ``"MPI"``, the default, every group of ranks
+                                       runs its jobs as MPI parallel sweeps. With
+                                       ``"multiprocessing"``, every rank is a group on its
+                                       own and runs its jobs as serial sweeps in a pool of
+                                       subprocesses, which hands the next job to the first
+                                       subprocess that is free.
+
+        number_of_subprocesses (optional) : Number of subprocesses of every rank with the
+                                            multiprocessing backend. The default is the
+                                            number of CPUs.
+
+    Returns:
+
+        results : On rank 0 of ``mpi_comm``, a list of the results returned by
+                  ``parameter_sweep`` for every job, in the order of ``jobs``. None on
+                  the other ranks.
+    """
+
+    comm = MPI.COMM_WORLD if mpi_comm is None else mpi_comm
+    rank = comm.Get_rank()
+    num_procs = comm.Get_size()
+
+    if parallel_back_end not in ("MPI", "multiprocessing"):
+        raise ValueError(
+            f"Unknown parallel_back_end {parallel_back_end}, expected MPI or multiprocessing."
+        )
+
+    jobs = [_JOB(job).value() for job in jobs]
+    for j, job in enumerate(jobs):
+        if job["build_model"] is None or job["build_sweep_params"] is None:
+            raise ValueError(
+                f"Job {j} requires a build_model and a build_sweep_params function."
+            )
+        if "mpi_comm" in job["sweep_kwargs"]:
+            raise ValueError(
+                f"The sweep_kwargs of job {j} cannot set mpi_comm, the communicator of a job is the group of ranks that runs it."
+            )
+
+    if parallel_back_end == "multiprocessing":
+        num_groups = num_procs
+    elif num_groups is None:
+        num_groups = max(min(len(jobs), num_procs), 1)
+    elif num_groups > num_procs:
+        raise ValueError(
+            f"Cannot split {num_procs} ranks into {num_groups} groups of ranks."
+        )
+
+    # Every group is a contiguous block of ranks
+    rank_groups = np.arange(num_procs) * num_groups // num_procs
+    group_sizes = np.bincount(rank_groups, minlength=num_groups)
+    job_groups = _lpt_schedule([job["cost"] for job in jobs], group_sizes)
+
+    group = rank_groups[rank]
+    if num_groups == 1:
+        group_comm = comm
+    else:
+        group_comm = comm.Split(int(group), rank)
+
+    # The jobs of the group, the most expensive first
+    group_jobs = [
+        j
+        for j in np.argsort([-job["cost"] for job in jobs], kind="stable")
+        if job_groups[j] == group
+    ]
+
+    local_results = {}
+    if parallel_back_end == "multiprocessing":
+        num_workers = number_of_subprocesses
+        if num_workers is None:
+            num_workers = os.cpu_count()
+
+        if group_jobs:
+            with _spawn_process_pool(num_workers) as executor:
+                futures = {
+                    j: executor.submit(_run_job, jobs[j], DummyCOMM) for j in group_jobs
+                }
+                local_results = {j: future.result() for j, future in futures.items()}
+    else:
+        for j in group_jobs:
+            result = _run_job(jobs[j], group_comm)
+            if group_comm.Get_rank() == 0:
+                local_results[j] = result
+
+    if group_comm is not comm:
+        group_comm.Free()
+
+    # Only the results of the jobs are collected on rank 0
+    if num_procs == 1:
+        all_results = [local_results]
+    else:
+        all_results = comm.gather(local_results, root=0)
+
+    if rank != 0:
+        return None
+
+    results = [None] * len(jobs)
+    for group_results in all_results:
+        for j, result in group_results.items():
+            results[j] = result
+
+    return results
@@ -0,0 +1,244 @@
+###############################################################################
+# WaterTAP Copyright (c) 2021, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National
+# Laboratory, National Renewable Energy Laboratory, and National Energy
+# Technology Laboratory (subject to receipt of any required approvals from
+# the U.S. Dept. of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#
+###############################################################################
+import os
+import enum
+import types
+import hashlib
+import sqlite3
+import functools
+import numpy as np
+import pyomo.environ as pyo
+
+from collections.abc import Mapping
+from pyomo.common.collections import ComponentSet
+
+
+class ParameterSweepCache:
+    """
+    On-disk cache of the converged variable values of solved cases.
+
+    The cases are stored in an SQLite database in ``cache_dir`` that can be
+    shared between sweeps, ranks and processes. An entry is keyed by a
+    fingerprint of the model, a fingerprint of the optimization function and
+    its options, and the values of the sweep parameters, so a case is only
+    reused for the same flowsheet solved the same way.
+    """
+
+    file_name = "case_cache.sqlite"
+
+    def __init__(
+        self,
+        cache_dir,
+        model,
+        sweep_params,
+        optimize_function=None,
+        optimize_kwargs=None,
+    ):
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_file = os.path.join(cache_dir, self.file_name)
+
+        sweep_param_objs = ComponentSet(
+            item.pyomo_object for item in sweep_params.values()
+        )
+
+        # The state of a case is the value of every variable, in name order
+        self.variables = sorted(
+            model.component_data_objects(pyo.Var), key=lambda v: v.name
+        )
+
+        self.model_key = self.model_fingerprint(model, sweep_param_objs)
+        self.solver_key = self.solver_fingerprint(optimize_function, optimize_kwargs)
+
+        # Wait for other ranks writing to the database rather than failing
+        self._connection = sqlite3.connect(self.cache_file, timeout=600.0)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cases ("
+                "model_key TEXT, solver_key TEXT, point BLOB, state BLOB, "
+                "PRIMARY KEY (model_key, solver_key, point))"
+            )
+
+    @staticmethod
+    def model_fingerprint(model, exclude=()):
+        """
+        Hashes the structure of ``model``: the names and fixed values of its
+        variables, the values of its mutable parameters, and its active
+        constraints and objectives. Components in ``exclude``, e.g., the
+        sweep parameters, only contribute their names.
+        """
+
+        exclude = ComponentSet(exclude)
+        digest = hashlib.sha256()
+
+        def _update(*items):
+            digest.update(repr(items).encode())
+
+        for v in model.component_data_objects(pyo.Var, sort=True):
+            if v in exclude or not v.fixed:
+                _update("var", v.name)
+            else:
+                _update("var", v.name, v.value)
+
+        for p in model.component_data_objects(pyo.Param, sort=True):
+            if p in exclude:
+                _update("param", p.name)
+            else:
+                _update("param", p.name, pyo.value(p, exception=False))
+
+        for c in model.component_data_objects(pyo.Constraint, active=True, sort=True):
+            _update("constraint", c.name, str(c.expr))
+
+        for o in model.component_data_objects(pyo.Objective, active=True, sort=True):
+            _update("objective", o.name, o.sense, str(o.expr))
+
+        return digest.hexdigest()
+
+    @classmethod
+    def solver_fingerprint(cls, optimize_function, optimize_kwargs):
+        """
+        Hashes the optimization function and the options it is called with.
+        Raises a ValueError if an option has no representation that is the
+        same in every run, e.g., an arbitrary object, as its cached cases
+        could never be found again.
+        """
+
+        name = cls._option_key(optimize_function, "optimize_function")
+        options = sorted(
+            (key, cls._option_key(value, f"optimize_kwargs[{key!r}]"))
+            for key, value in (optimize_kwargs or {}).items()
+        )
+
+        return hashlib.sha256(repr((name, options)).encode()).hexdigest()
+
+    @classmethod
+    def _option_key(cls, value, name):
+        """
+        Returns a representation of the option ``name`` that is the same in
+        every run.
+        """
+
+        if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+            return value
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, np.ndarray):
+            return ("ndarray", value.dtype.str, value.shape, value.tolist())
+        if isinstance(value, enum.Enum):
+            return (type(value).__module__, type(value).__qualname__, value.name)
+        if isinstance(value, (list, tuple)):
+            return (
+                type(value).__name__,
+                tuple(cls._option_key(item, name) for item in value),
+            )
+        if isinstance(value, (set, frozenset)):
+            return (
+                "set",
+                tuple(sorted(repr(cls._option_key(item, name)) for item in value)),
+            )
+        if isinstance(value, Mapping):
+            return (
+                "dict",
+                tuple(
+                    sorted(
+                        (
+                            (cls._option_key(key, name), cls._option_key(item, name))
+                            for key, item in value.items()
+                        ),
+                        key=repr,
+                    )
+                ),
+            )
+
+        # Solvers, e.g., from SolverFactory or get_solver, by their name and
+        # options
+        if isinstance(getattr(value, "name", None), str) and isinstance(
+            getattr(value, "options", None), Mapping
+        ):
+            return (
+                "solver",
+                type(value).__module__,
+                type(value).__qualname__,
+                value.name,
+                cls._option_key(value.options, name),
+            )
+
+        # Functions and classes by where they are defined
+        if isinstance(value, functools.partial):
+            return (
+                "partial",
+                cls._option_key(value.func, name),
+                cls._option_key(value.args, name),
+                cls._option_key(value.keywords, name),
+            )
+        if isinstance(
+            value,
+            (types.FunctionType, types.BuiltinFunctionType, types.MethodType, type),
+        ):
+            return (value.__module__, value.__qualname__)
+
+        raise ValueError(
+            f"{name} of type {type(value).__name__} has no representation that is "
+            "the same in every run, so the solved cases cannot be cached."
+        )
+
+    @staticmethod
+    def _point_key(point):
+        return np.asarray(point, dtype=np.float64).tobytes()
+
+    def load(self, point, model):
+        """
+        Sets the unfixed variables of ``model`` to the stored solution of the
+        case at ``point`` and returns True, or returns False if the case has
+        not been solved before.
+        """
+
+        row = self._connection.execute(
+            "SELECT state FROM cases WHERE model_key=? AND solver_key=? AND point=?",
+            (self.model_key, self.solver_key, self._point_key(point)),
+        ).fetchone()
+
+        if row is None:
+            return False
+
+        state = np.frombuffer(row[0], dtype=np.float64)
+        for v, val in zip(self.variables, state):
+            if not v.fixed and not np.isnan(val):
+                v.set_value(val, skip_validation=True)
+
+        return True
+
+    def store(self, point, model):
+        """
+        Stores the variable values of ``model`` as the solution of the case
+        at ``point``.
+        """
+
+        state = np.array(
+            [np.nan if v.value is None else v.value for v in self.variables],
+            dtype=np.float64,
+        )
+
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cases VALUES (?, ?, ?, ?)",
+                (
+                    self.model_key,
+                    self.solver_key,
+                    self._point_key(point),
+                    state.tobytes(),
+                ),
+            )
+
+    def close(self):
+        self._connection.close()
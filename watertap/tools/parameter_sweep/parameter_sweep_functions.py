@@ -34,6 +34,40 @@ def parameter_sweep(
     interpolate_nan_outputs=False,
     num_samples=None,
     seed=None,
+    scheduler="static",
+    dynamic_chunk_size=1,
+    parallel_back_end="MPI",
+    number_of_subprocesses=None,
+    build_model=None,
+    build_model_kwargs=None,
+    checkpoint_dir=None,
+    checkpoint_interval=10,
+    resume=False,
+    h5_streaming=False,
+    h5_streaming_interval=1,
+    h5_parallel=False,
+    h5_dtype="float64",
+    h5_compression=None,
+    h5_compression_level=4,
+    h5_store_constant_once=False,
+    h5_output_storage=None,
+    npy_results_dir=None,
+    warm_start="previous",
+    warm_start_max_points=None,
+    space_filling_order=False,
+    rank_local_sampling=False,
+    solver_telemetry=False,
+    case_timeout=None,
+    case_cache_dir=None,
+    refinement_rounds=3,
+    interpolation_method="linear",
+    interpolation_neighbors=None,
+    surrogate_file_name=None,
+    surrogate_outputs=None,
+    surrogate_method="polynomial",
+    surrogate_options=None,
+    progress_dir=None,
+    progress_interval=10.0,
 ):
 
     """
@@ -59,7 +93,11 @@ def parameter_sweep(
                   ``outputs['Short/Pretty-print Name'] = model.fs.variable_or_expression_to_report``.
                   If not provided, i.e., outputs = None, the default behavior is to save all model
                   variables, parameters, and expressions which provides very thorough results
-                  at the cost of large file sizes.
+                  at the cost of large file sizes. Instead of Pyomo objects, the values can be
+                  name patterns such as ``"fs.*.costing.capital_cost"`` or
+                  ``"fs.RO.flux_mass_phase_comp_avg[*]"``, or regular expressions prefixed with
+                  ``"re:"``, and a list of patterns can be given instead of the dictionary, see
+                  ``select_outputs``.
 
         csv_results_file_name (optional) : The path and file name to write a csv file. The default `None`
                                            does not write a csv file.
@@ -113,11 +151,187 @@ def parameter_sweep(
                                              If true, a second output file with the extension "_clean"
                                              will be saved alongside the raw (un-interpolated) values.
 
+        interpolation_method (optional) : How ``interpolate_nan_outputs`` fills in the values.
+                                          ``"linear"`` (the default) interpolates linearly on a
+                                          triangulation of the parameter space, ``"idw"`` weights
+                                          the nearest solved cases by their inverse squared
+                                          distance, which scales to many sweep parameters.
+
+        interpolation_neighbors (optional) : Number of nearest solved cases used by
+                                             ``interpolation_method="idw"``. The default is twice
+                                             the number of sweep parameters.
+
         num_samples (optional) : If the user is using sampling techniques rather than a linear grid
-                                 of values, they need to set the number of samples
+                                 of values, they need to set the number of samples. For an adaptive
+                                 sweep this is the number of points added per refinement round
 
         seed (optional) : If the user is using a random sampling technique, this sets the seed
 
+        scheduler (optional) : How the cases are distributed between MPI ranks. The default "static"
+                               gives each rank one contiguous block of cases up front. With "dynamic"
+                               each rank requests a new chunk of cases from rank 0 whenever it becomes
+                               idle, which keeps all ranks busy when solve times vary strongly across
+                               the parameter space. Results are returned in the same order either way.
+
+        dynamic_chunk_size (optional) : Number of cases handed to a rank per request when
+                                        ``scheduler="dynamic"``, or to a worker process when
+                                        ``parallel_back_end="multiprocessing"``. The default is 1.
+
+        parallel_back_end (optional) : "MPI" (the default) solves the cases of each rank in the
+                                       calling process. "multiprocessing" solves them in a pool of
+                                       local worker processes instead, which uses every core of a
+                                       machine without mpi4py. Each worker builds its own model by
+                                       calling ``build_model``.
+
+        number_of_subprocesses (optional) : Number of worker processes for the "multiprocessing"
+                                            backend. The default is the number of CPUs.
+
+        build_model (optional) : Function returning a copy of ``model`` that is ready to be swept,
+                                 required by the "multiprocessing" backend. It is called once in
+                                 each worker as ``build_model(**build_model_kwargs)``. The sweep
+                                 parameters and outputs are looked up on the copy by name, and
+                                 this function as well as ``optimize_function`` and friends must be
+                                 importable (module-level) so that they can be sent to the workers.
+
+        build_model_kwargs (optional) : Dictionary of kwargs to pass to ``build_model``.
+
+        checkpoint_dir (optional) : Directory in which every rank periodically saves the cases it
+                                    has solved so far. If None (the default) no checkpoints are written.
+
+        checkpoint_interval (optional) : Number of solved cases between two checkpoint writes.
+                                         The default is 10.
+
+        resume (optional) : If True, the cases found in ``checkpoint_dir`` are not solved again,
+                            so a sweep that was interrupted can be restarted where it stopped. The
+                            sweep parameters and outputs must be the same as in the interrupted
+                            sweep, but the number of ranks and the scheduler may differ. The default
+                            is False, which clears any existing checkpoints.
+
+        h5_streaming (optional) : If True, every rank appends its finished cases to its own H5 file
+                                  ``{h5_results_file_name without .h5}_rank{rank:03}.h5`` while the
+                                  sweep is running. These files have the same layout as the final H5
+                                  file plus a ``case_index`` dataset with the global case numbers, and
+                                  can be read while the sweep is still running. Requires
+                                  ``h5_results_file_name``. The default is False.
+
+        h5_streaming_interval (optional) : Number of finished cases buffered before they are appended
+                                           to the streaming H5 file. The default is 1.
+
+        h5_parallel (optional) : If True, every rank writes its own cases to the H5 results file
+                                 instead of sending them to rank 0. With parallel h5py the ranks
+                                 write to the shared file through MPI-IO, otherwise every rank
+                                 writes ``{h5_results_file_name without .h5}_part{rank:03}.h5``
+                                 and the results file holds virtual datasets that read from these
+                                 files, which must be kept next to it. Requires
+                                 ``h5_results_file_name``. The default is False.
+
+        h5_dtype (optional) : Floating point type of the values stored in the H5 files, ``"float64"``
+                              or ``"float32"``, which halves their size. The sweep itself is always
+                              evaluated in double precision. The default is ``"float64"``.
+
+        h5_compression (optional) : Compression filter of the value datasets of the H5 files,
+                                    ``"gzip"`` or ``"lzf"``, which are stored in chunks. Not applied
+                                    to the shared file written through MPI-IO with ``h5_parallel``.
+                                    The default `None` does not compress the values.
+
+        h5_compression_level (optional) : Level of the gzip compression, from 0 (fastest) to 9
+                                          (smallest). The default is 4.
+
+        h5_store_constant_once (optional) : If True, a sweep parameter or output with the same value
+                                            in every case, e.g., a fixed design variable captured by
+                                            ``outputs=None``, is stored once as the fill value of an
+                                            unallocated dataset. It still reads as one value per case.
+                                            Only applies when rank 0 writes the whole H5 file, i.e.,
+                                            without ``h5_parallel``. The default is False.
+
+        h5_output_storage (optional) : A dictionary of per-output overrides of the options above,
+                                       keyed by the name of the sweep parameter or output, with
+                                       the keys ``"dtype"``, ``"compression"`` and
+                                       ``"store_constant_once"``, e.g.,
+                                       ``{"fs.costing.LCOW": {"dtype": "float64"}}``. The default
+                                       `None` stores every value with the options above.
+
+        npy_results_dir (optional) : The path of a directory to write the results to as one binary
+                                     ``.npy`` file per sweep parameter and output, plus a
+                                     ``metadata.json`` file with their names, units and bounds.
+                                     Unlike the csv file, this keeps the full precision and the
+                                     columns can be memory mapped one by one with
+                                     ``load_npy_results``. The default `None` does not write
+                                     these files.
+
+        progress_dir (optional) : The path of a directory in which every rank keeps a
+                                  ``progress_{rank:03}.json`` file with its number of finished
+                                  cases, success rate, mean and 95th percentile solve time, and
+                                  estimated remaining time, and rank 0 keeps a ``progress.json``
+                                  summary of the whole sweep. The files are written without any
+                                  communication between the ranks. Not supported with adaptive
+                                  sampling or the multiprocessing backend. The default `None`
+                                  does not report the progress.
+
+        progress_interval (optional) : Minimum number of seconds between two updates of the
+                                       progress files of a rank. The default is 10.
+
+        surrogate_file_name (optional) : The path of a ``.npz`` file to save a surrogate model of
+                                         the outputs as functions of the sweep parameters to,
+                                         fitted to the successful cases. It can be loaded with
+                                         ``ParameterSweepSurrogate.load`` and evaluated at many
+                                         points at once with its ``predict`` method. The default
+                                         `None` does not fit a surrogate.
+
+        surrogate_outputs (optional) : Names of the outputs fitted by the surrogate model. The
+                                       default is all of the outputs.
+
+        surrogate_method (optional) : ``"polynomial"`` (the default) fits a polynomial by least
+                                      squares, ``"rbf"`` interpolates with radial basis functions.
+
+        surrogate_options (optional) : Dictionary of options of the surrogate model, e.g., the
+                                       polynomial ``degree``, the RBF ``kernel``, or the
+                                       ``validation_fraction`` of the cases held out to estimate
+                                       its error.
+
+        warm_start (optional) : Starting point of each solve. With ``"previous"`` (the default) a
+                                solve starts from the state left by the previous case, with
+                                ``"nearest"`` the variables are first set to the stored solution
+                                of the closest case solved so far on the same rank, and with
+                                ``"predictor"`` they are set to a first-order prediction from the
+                                last solved case, using the sensitivities of its KKT system or, if
+                                PyNumero is not available, a secant through the last solved cases.
+
+        warm_start_max_points (optional) : Maximum number of solved cases stored for
+                                           ``warm_start="nearest"``. The oldest cases are replaced
+                                           first. The default is to keep every solved case.
+
+        space_filling_order (optional) : If True, every rank solves its cases in the order of a
+                                         Morton (Z-order) curve through the parameter space so
+                                         that consecutive cases are close to each other. The
+                                         results keep their original order. The default is False.
+
+        rank_local_sampling (optional) : If True, random and LHS samples are drawn from independent
+                                         numpy Generator streams derived from ``seed``, so every
+                                         rank only generates its own cases and the samples do not
+                                         depend on the number of ranks. The default is False.
+
+        solver_telemetry (optional) : If True, the wall time, the time spent in ``optimize_function``
+                                      and in ``reinitialize_function``, the solver iteration count,
+                                      the termination condition and whether the reinitialization
+                                      fallback was used are saved for every case as additional
+                                      ``solver_stats`` columns. The default is False.
+
+        case_timeout (optional) : Wall-clock time limit in seconds for each case, independent of the
+                                  solver options. A case that runs out of time is stopped, recorded
+                                  as failed and flagged in an additional ``timed_out`` column, and the
+                                  sweep moves on to the next case. The default is no limit.
+
+        case_cache_dir (optional) : Directory of an on-disk cache of solved cases. The converged variable
+                                    values of every successful case are stored there, keyed by the
+                                    model, the optimization function and its options, and the sweep
+                                    parameter values. Cases found in the cache are not solved again.
+                                    The default is no cache.
+
+        refinement_rounds (optional) : Number of rounds of ``num_samples`` new points added after the
+                                       initial grid when the sweep parameters are ``AdaptiveSample``
+                                       objects. The default is 3.
+
     Returns:
 
         save_data : A list were the first N columns are the values of the parameters passed
@@ -147,11 +361,63 @@ def parameter_sweep(
         kwargs["debugging_data_dir"] = debugging_data_dir
     if interpolate_nan_outputs is not None:
         kwargs["interpolate_nan_outputs"] = interpolate_nan_outputs
+    kwargs["scheduler"] = scheduler
+    kwargs["dynamic_chunk_size"] = dynamic_chunk_size
+    kwargs["parallel_back_end"] = parallel_back_end
+    if number_of_subprocesses is not None:
+        kwargs["number_of_subprocesses"] = number_of_subprocesses
+    if build_model is not None:
+        kwargs["build_model"] = build_model
+    if build_model_kwargs is not None:
+        kwargs["build_model_kwargs"] = build_model_kwargs
+    if checkpoint_dir is not None:
+        kwargs["checkpoint_dir"] = checkpoint_dir
+    kwargs["checkpoint_interval"] = checkpoint_interval
+    kwargs["h5_streaming"] = h5_streaming
+    kwargs["h5_streaming_interval"] = h5_streaming_interval
+    kwargs["h5_parallel"] = h5_parallel
+    kwargs["h5_dtype"] = h5_dtype
+    kwargs["h5_compression"] = h5_compression
+    kwargs["h5_compression_level"] = h5_compression_level
+    kwargs["h5_store_constant_once"] = h5_store_constant_once
+    if h5_output_storage is not None:
+        kwargs["h5_output_storage"] = h5_output_storage
+    if npy_results_dir is not None:
+        kwargs["npy_results_dir"] = npy_results_dir
+    kwargs["warm_start"] = warm_start
+    if warm_start_max_points is not None:
+        kwargs["warm_start_max_points"] = warm_start_max_points
+    kwargs["space_filling_order"] = space_filling_order
+    kwargs["rank_local_sampling"] = rank_local_sampling
+    kwargs["solver_telemetry"] = solver_telemetry
+    if case_timeout is not None:
+        kwargs["case_timeout"] = case_timeout
+    if case_cache_dir is not None:
+        kwargs["case_cache_dir"] = case_cache_dir
+    kwargs["refinement_rounds"] = refinement_rounds
+    kwargs["interpolation_method"] = interpolation_method
+    if interpolation_neighbors is not None:
+        kwargs["interpolation_neighbors"] = interpolation_neighbors
+    if surrogate_file_name is not None:
+        kwargs["surrogate_file_name"] = surrogate_file_name
+    if surrogate_outputs is not None:
+        kwargs["surrogate_outputs"] = surrogate_outputs
+    kwargs["surrogate_method"] = surrogate_method
+    if surrogate_options is not None:
+        kwargs["surrogate_options"] = surrogate_options
+    if progress_dir is not None:
+        kwargs["progress_dir"] = progress_dir
+    kwargs["progress_interval"] = progress_interval
 
     ps = ParameterSweep(**kwargs)
 
     return ps.parameter_sweep(
-        model, sweep_params, outputs=outputs, num_samples=num_samples, seed=seed
+        model,
+        sweep_params,
+        outputs=outputs,
+        num_samples=num_samples,
+        seed=seed,
+        resume=resume,
     )
 
 
@@ -172,6 +438,9 @@ def recursive_parameter_sweep(
     interpolate_nan_outputs=False,
     req_num_samples=None,
     seed=None,
+    failure_screening=False,
+    screening_neighbors=5,
+    screening_threshold=0.1,
 ):
 
     kwargs = {}
@@ -196,6 +465,9 @@ def recursive_parameter_sweep(
         kwargs["debugging_data_dir"] = debugging_data_dir
     if interpolate_nan_outputs is not None:
         kwargs["interpolate_nan_outputs"] = interpolate_nan_outputs
+    kwargs["failure_screening"] = failure_screening
+    kwargs["screening_neighbors"] = screening_neighbors
+    kwargs["screening_threshold"] = screening_threshold
 
     rps = RecursiveParameterSweep(**kwargs)
 
@@ -0,0 +1,330 @@
+###############################################################################
+# WaterTAP Copyright (c) 2021, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National
+# Laboratory, National Renewable Energy Laboratory, and National Energy
+# Technology Laboratory (subject to receipt of any required approvals from
+# the U.S. Dept. of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#
+###############################################################################
+import collections
+import warnings
+import numpy as np
+import pyomo.environ as pyo
+
+from scipy.sparse import bmat, csc_matrix, tril, triu
+from scipy.sparse.linalg import splu
+from pyomo.common.collections import ComponentMap, ComponentSet
+
+
+def kkt_sensitivity_available():
+    """
+    Returns True if PyNumero can evaluate the derivatives of a Pyomo model,
+    which requires the PyNumero ASL library.
+    """
+
+    try:
+        from pyomo.contrib.pynumero.asl import AmplInterface
+    except ImportError:
+        return False
+
+    return AmplInterface.available()
+
+
+class MissingDualsError(ValueError):
+    """
+    Raised if the KKT sensitivity needs the constraint duals but the model
+    has none.
+    """
+
+
+class ParameterSweepPredictor:
+    """
+    Predicts the solution of the next case of a sweep with a first-order step
+    in the sweep parameters from the last solved case.
+
+    The sensitivity of the variables to the sweep parameters is taken from the
+    KKT system at the solution of the last case if PyNumero is available.
+    Otherwise, or if the KKT system is singular, it is estimated by a secant,
+    a least-squares fit to the differences between the last solved cases.
+    The KKT system needs the constraint duals, so an imported ``dual`` suffix
+    is declared on the model if it has none; the secant is also used, with a
+    warning, if the constraints are curved and the solver loaded no duals, or
+    if the KKT sensitivity fails for any other reason.
+
+    The KKT sensitivity differentiates with respect to the sweep parameters as
+    variables of the NLP, so it requires them to be Vars rather than mutable
+    Params. The NLP is built once, from the model as it is at the first solved
+    case, and is evaluated at the solution of every later case.
+    """
+
+    # Bounds on the distance of a variable from its bounds, and of an
+    # inequality from its limits, to be considered active
+    active_tol = 1e-6
+
+    def __init__(self, model, sweep_params, use_kkt=None, max_points=None):
+
+        self.parameters = [item.pyomo_object for item in sweep_params.values()]
+        parameter_set = ComponentSet(self.parameters)
+
+        self.variables = [
+            v for v in model.component_data_objects(pyo.Var) if v not in parameter_set
+        ]
+
+        # PyNumero has no derivatives with respect to mutable Params
+        params_are_vars = all(p.is_variable_type() for p in self.parameters)
+        if use_kkt and not params_are_vars:
+            raise ValueError(
+                "The KKT sensitivity requires every sweep parameter to be a Var, "
+                "use use_kkt=False for the secant predictor of Param sweep parameters."
+            )
+        if use_kkt is None:
+            use_kkt = kkt_sensitivity_available()
+            if use_kkt and not params_are_vars:
+                warnings.warn(
+                    "Some sweep parameters are Params, for which the KKT sensitivity "
+                    "is not available, so the secant predictor is used."
+                )
+                use_kkt = False
+        self.use_kkt = use_kkt
+
+        # Have the solver load the duals for the Hessian of the Lagrangian
+        if self.use_kkt and model.component("dual") is None:
+            model.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT)
+
+        # A secant in d parameters needs d + 1 cases
+        if max_points is None:
+            max_points = len(self.parameters) + 1
+        self._points = collections.deque(maxlen=max_points)
+        self._states = collections.deque(maxlen=max_points)
+
+        # Sensitivity of the variables to the parameters at the last case
+        self._sensitivity = None
+
+        # The NLP of the model for the KKT sensitivity, built at the first case
+        self._nlp = None
+
+    def __len__(self):
+        return len(self._points)
+
+    def add(self, point, model):
+        """
+        Records the solution of ``model`` as the solved case at ``point``.
+        """
+
+        state = np.array(
+            [np.nan if v.value is None else v.value for v in self.variables],
+            dtype=np.float64,
+        )
+        self._points.append(np.array(point, dtype=np.float64))
+        self._states.append(state)
+
+        self._sensitivity = None
+        if self.use_kkt:
+            try:
+                self._sensitivity = self.kkt_sensitivity(model)
+            except np.linalg.LinAlgError:
+                # A singular KKT matrix, e.g., at a degenerate solution, for
+                # which the secant is used
+                pass
+            except MissingDualsError as err:
+                warnings.warn(f"{err} Falling back to the secant predictor.")
+            except Exception as err:
+                warnings.warn(
+                    f"The KKT sensitivity failed: {err} Falling back to the secant predictor."
+                )
+
+    def predict(self, point, model):
+        """
+        Sets the unfixed variables of ``model`` to the first-order prediction
+        of the solution at ``point``, projected onto their bounds. Returns
+        False, leaving the model as is, if no case was solved yet or the step
+        is too long for the secant.
+        """
+
+        if len(self._points) == 0:
+            return False
+
+        point = np.asarray(point, dtype=np.float64)
+        step = point - self._points[-1]
+
+        if self._sensitivity is not None:
+            change = self._sensitivity @ step
+        else:
+            change = self.secant_step(step)
+            if change is None:
+                return False
+
+        state = self._states[-1] + change
+        for v, val in zip(self.variables, state):
+            if v.fixed or np.isnan(val):
+                continue
+            if v.lb is not None:
+                val = max(val, v.lb)
+            if v.ub is not None:
+                val = min(val, v.ub)
+            v.set_value(val, skip_validation=True)
+
+        return True
+
+    def secant_step(self, step):
+        """
+        Returns the change of the variables for a parameter ``step`` from the
+        last solved case, from a least-squares fit of the changes between the
+        stored cases, or None if the step reaches much further than the
+        stored cases.
+        """
+
+        if len(self._points) < 2:
+            return np.zeros(len(self.variables))
+
+        points = np.vstack(self._points)
+        states = np.vstack(self._states)
+        d_points = points[:-1] - points[-1]
+        d_states = states[:-1] - states[-1]
+
+        # A linear model is only trusted close to the cases it was fitted to,
+        # e.g., not when a grid sweep jumps back to the start of the next row
+        reach = np.max(np.linalg.norm(d_points, axis=1))
+        if np.linalg.norm(step) > 2.0 * reach:
+            return None
+
+        known = np.all(np.isfinite(d_states), axis=0)
+        gradient = np.zeros((len(self.parameters), len(self.variables)))
+        fit = np.linalg.lstsq(d_points, d_states[:, known], rcond=None)
+        gradient[:, known] = fit[0]
+
+        return step @ gradient
+
+    def kkt_sensitivity(self, model):
+        """
+        Returns the derivatives of the variables with respect to the sweep
+        parameters at the solution of ``model`` as a (variables x parameters)
+        array, from the KKT system of the equality constraints and the active
+        inequalities and bounds. The duals are read from the ``dual`` suffix of
+        the model for the Hessian of the Lagrangian. Raises a
+        MissingDualsError if there are none and an active constraint is curved,
+        and a LinAlgError if the KKT matrix is singular.
+        """
+
+        if self._nlp is None:
+            self._nlp = self._build_nlp(model)
+        nlp = self._nlp
+
+        # The NLP is evaluated at the solution of this case
+        nlp_variables = nlp.get_pyomo_variables()
+        if any(v.value is None for v in nlp_variables):
+            raise ValueError("The model has variables without a value.")
+        primals = np.array([v.value for v in nlp_variables], dtype=np.float64)
+        nlp.set_primals(primals)
+
+        parameter_columns = nlp.get_primal_indices(self.parameters)
+        is_parameter = np.zeros(len(nlp_variables), dtype=bool)
+        is_parameter[parameter_columns] = True
+
+        # Variables at their bounds stay there for a small step
+        at_bound = (primals - nlp.primals_lb() <= self.active_tol) | (
+            nlp.primals_ub() - primals <= self.active_tol
+        )
+        free = np.flatnonzero(~is_parameter & ~at_bound)
+
+        # Equalities and the inequalities at one of their limits hold
+        body = nlp.evaluate_constraints()
+        active = np.flatnonzero(
+            (nlp.constraints_lb() == nlp.constraints_ub())
+            | (body - nlp.constraints_lb() <= self.active_tol)
+            | (nlp.constraints_ub() - body <= self.active_tol)
+        )
+
+        # The duals as loaded by the solver; the ASL interface already accounts
+        # for the sense of the objective
+        duals = getattr(model, "dual", None)
+        if isinstance(duals, pyo.Suffix) and len(duals) > 0:
+            nlp.set_duals(
+                np.array(
+                    [duals.get(c, 0.0) for c in nlp.get_pyomo_constraints()],
+                    dtype=np.float64,
+                )
+            )
+        else:
+            # Without the duals, only the curvature of the constraints is lost,
+            # which does not matter if none of the active ones are curved
+            curvature_duals = np.zeros(nlp.n_constraints())
+            curvature_duals[active] = 1.0
+            nlp.set_duals(curvature_duals)
+            nlp.set_obj_factor(0.0)
+            curvature = nlp.evaluate_hessian_lag()
+            nlp.set_duals(np.zeros(nlp.n_constraints()))
+            nlp.set_obj_factor(1.0)
+            if np.any(curvature.data != 0.0):
+                raise MissingDualsError(
+                    "The model has curved constraints but the solver loaded no "
+                    "duals into its dual suffix, which the KKT sensitivity needs."
+                )
+
+        jacobian = csc_matrix(nlp.evaluate_jacobian())[active, :]
+        hessian = csc_matrix(nlp.evaluate_hessian_lag())
+        if triu(hessian, k=1).nnz == 0:
+            # Only the lower triangle is stored
+            hessian = hessian + tril(hessian, k=-1).T
+
+        kkt = bmat(
+            [
+                [hessian[free, :][:, free], jacobian[:, free].T],
+                [jacobian[:, free], None],
+            ],
+            format="csc",
+        )
+        rhs = -np.vstack(
+            (
+                hessian[free, :][:, parameter_columns].toarray(),
+                jacobian[:, parameter_columns].toarray(),
+            )
+        )
+        try:
+            solution = splu(kkt).solve(rhs)
+        except RuntimeError as err:
+            raise np.linalg.LinAlgError(f"The KKT matrix is singular: {err}")
+        if not np.all(np.isfinite(solution)):
+            raise np.linalg.LinAlgError("The KKT matrix is singular.")
+
+        # Variables that are fixed, at a bound, or not in any active
+        # constraint do not change
+        column = ComponentMap((nlp_variables[i], j) for j, i in enumerate(free))
+        sensitivity = np.zeros((len(self.variables), len(self.parameters)))
+        for i, v in enumerate(self.variables):
+            if v in column:
+                sensitivity[i, :] = solution[column[v], :]
+
+        return sensitivity
+
+    def _build_nlp(self, model):
+        """
+        Returns the PyNumero NLP of ``model`` in which the sweep parameters are
+        variables. Writing the NLP is expensive, so it is only done once.
+        """
+
+        from pyomo.contrib.pynumero.interfaces.pyomo_nlp import PyomoNLP
+
+        # The parameters are unfixed so that the NLP has their derivatives, and
+        # a square model is given a constant objective while the NLP is written
+        fixed_parameters = [p for p in self.parameters if p.fixed]
+        objective_name = None
+        if next(model.component_data_objects(pyo.Objective, active=True), None) is None:
+            objective_name = "_parameter_sweep_predictor_objective"
+            model.add_component(objective_name, pyo.Objective(expr=0.0))
+
+        try:
+            for p in fixed_parameters:
+                p.unfix()
+            nlp = PyomoNLP(model)
+        finally:
+            for p in fixed_parameters:
+                p.fix()
+            if objective_name is not None:
+                model.del_component(objective_name)
+
+        return nlp
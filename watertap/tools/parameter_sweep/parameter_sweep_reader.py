@@ -18,13 +18,151 @@ from watertap.tools.parameter_sweep.sampling_types import (
     UniformSample,
     NormalSample,
     LatinHypercubeSample,
+    SobolSample,
+    HaltonSample,
+    AdaptiveSample,
 )
+import bisect
+import re
 import yaml
+import pyomo.environ as pyo
 import idaes.logger as idaeslog
 
 _log = idaeslog.getLogger(__name__)
 
 
+class ComponentNameIndex:
+    """Index of the names of the components of a model that can be outputs
+
+    The index is built once, so that any number of name patterns can be
+    resolved without walking the model again. A pattern is either a glob,
+    in which ``*`` matches any characters, including dots and indices, and
+    ``?`` matches a single character, while square brackets are matched
+    literally, e.g., ``fs.*.costing.capital_cost`` or
+    ``fs.RO.flux_mass_phase_comp_avg[*]``; or a regular expression for the
+    whole name prefixed with ``re:``. Globs are only matched against the
+    names that start with their literal prefix.
+
+    Args:
+        m (pyomo model):
+            The model to index.
+        ctype (tuple):
+            The types of components to index, by default the same as the
+            outputs saved with ``outputs=None``.
+
+    """
+
+    def __init__(self, m, ctype=(pyo.Var, pyo.Expression, pyo.Objective)):
+
+        self.components = list(m.component_data_objects(ctype, active=True))
+        self.names = [c.name for c in self.components]
+
+        # Positions of the components in name order, for the prefix search
+        self._sorted = sorted(range(len(self.names)), key=self.names.__getitem__)
+        self._sorted_names = [self.names[i] for i in self._sorted]
+
+    @staticmethod
+    def _translate(pattern):
+        """Returns the regular expression and the literal prefix of a pattern"""
+
+        if pattern.startswith("re:"):
+            return re.compile(pattern[3:]), ""
+
+        parts = re.split(r"([*?])", pattern)
+        regex = "".join(
+            ".*" if part == "*" else "." if part == "?" else re.escape(part)
+            for part in parts
+        )
+        return re.compile(regex), parts[0]
+
+    def select(self, pattern):
+        """Returns the components whose names match a pattern, in model order
+
+        Args:
+            pattern (str):
+                A glob or a regular expression prefixed with ``re:``.
+
+        Returns:
+            components (list):
+                The (name, component) pairs of the matching components.
+
+        """
+
+        regex, prefix = self._translate(pattern)
+
+        start = bisect.bisect_left(self._sorted_names, prefix)
+        stop = len(self._sorted_names)
+        if prefix:
+            # The names starting with the prefix come before prefix + max char
+            stop = bisect.bisect_left(self._sorted_names, prefix + "\U0010ffff")
+
+        positions = sorted(
+            self._sorted[k]
+            for k in range(start, stop)
+            if regex.fullmatch(self._sorted_names[k])
+        )
+        return [(self.names[i], self.components[i]) for i in positions]
+
+
+def select_outputs(m, patterns, index=None):
+    """Creates a dictionary of sweep outputs from name patterns
+
+    The ``patterns`` can be a single pattern, a list of patterns, or a
+    dictionary of short names and patterns, see ``ComponentNameIndex`` for
+    their syntax. Every component matched by a pattern of a list is keyed by
+    its full name. A pattern of a dictionary that matches a single component
+    is keyed by its short name, otherwise its components are keyed by their
+    full names. Pyomo components can be given instead of patterns, and are
+    keyed by their short or full name in the same way.
+
+    Args:
+        m (pyomo model):
+            The model to select the outputs from.
+        patterns (str, list or dict):
+            The patterns of the outputs.
+        index (ComponentNameIndex, optional):
+            A prebuilt index of the model, to resolve several sets of
+            patterns without walking the model again.
+
+    Returns:
+        outputs (dict):
+            A dictionary of output names and components for the parameter
+            sweep.
+
+    """
+
+    if isinstance(patterns, str):
+        patterns = [patterns]
+
+    if isinstance(patterns, dict):
+        items = list(patterns.items())
+    else:
+        items = [(None, pattern) for pattern in patterns]
+
+    outputs = {}
+    for key, pattern in items:
+        if not isinstance(pattern, str):
+            outputs[pattern.name if key is None else key] = pattern
+            continue
+
+        if index is None:
+            index = ComponentNameIndex(m)
+
+        matches = index.select(pattern)
+        if len(matches) == 0:
+            raise ValueError(
+                f"The output pattern {pattern} does not match any component"
+            )
+
+        if key is not None and len(matches) == 1:
+            outputs[key] = matches[0][1]
+        else:
+            for name, component in matches:
+                outputs.setdefault(name, component)
+
+    return outputs
+
+
 class ParameterSweepReader:
     @staticmethod
     def _yaml_to_dict(yaml_filename):
@@ -67,7 +205,8 @@ class ParameterSweepReader:
 
         where the top-level keyword can be any short, easily understood identifier
         for the parameter.  ``type`` must be one of ``LinearSample``, ``UniformSample``,
-        ``NormalSample``, or ``LatinHypercubeSample``.  ``param`` must be a valid
+        ``NormalSample``, ``LatinHypercubeSample``, ``SobolSample``, ``HaltonSample``,
+        or ``AdaptiveSample``.  ``param`` must be a valid
         dot-sperated string path to the object attribute (in this case, an RO attribute
         on the flowsheet ``m``) that you wish to vary.  The remaining arguments are
         dependent on the sample type selected.  For ``NormalSample`` information about
@@ -151,8 +290,59 @@ class ParameterSweepReader:
                     component, values["lower_limit"], values["upper_limit"]
                 )
 
+            elif values["type"] == "SobolSample":
+                sweep_params[param] = SobolSample(
+                    component, values["lower_limit"], values["upper_limit"]
+                )
+
+            elif values["type"] == "HaltonSample":
+                sweep_params[param] = HaltonSample(
+                    component, values["lower_limit"], values["upper_limit"]
+                )
+
+            elif values["type"] == "AdaptiveSample":
+                sweep_params[param] = AdaptiveSample(
+                    component,
+                    values["lower_limit"],
+                    values["upper_limit"],
+                    values["num_samples"],
+                )
+
         return sweep_params
 
+    def get_outputs_from_yaml(self, m, yaml_filename):
+        r"""Creates a dictionary of sweep outputs from patterns in a yaml file
+
+        This function reads a yaml file with either a list of name patterns::
+
+            - fs.*.costing.capital_cost
+            - fs.RO.flux_mass_phase_comp_avg[*]
+            - re:fs\.costing\.(LCOW|SEC)
+
+        or short names and patterns::
+
+            LCOW: fs.costing.LCOW
+            capital_cost: fs.*.costing.capital_cost
+
+        and resolves the patterns against an index of the names of the model,
+        see ``select_outputs`` for how the outputs are named.
+
+        Args:
+            m (pyomo model):
+                The flowsheet containing the outputs.
+            yaml_filename (str):
+                The path to the yaml file.
+
+        Returns:
+            outputs (dict):
+                A dictionary of output names and components for the parameter
+                sweep.
+
+        """
+
+        input_dict = self._yaml_to_dict(yaml_filename)
+        return select_outputs(m, input_dict)
+
     @staticmethod
     def _set_value(component, key, default_value):
         _log.debug(f"Property: {key}")
@@ -229,7 +419,8 @@ def get_sweep_params_from_yaml(m, yaml_filename):
 
     where the top-level keyword can be any short, easily understood identifier
     for the parameter.  ``type`` must be one of ``LinearSample``, ``UniformSample``,
-    ``NormalSample``, or ``LatinHypercubeSample``.  ``param`` must be a valid
+    ``NormalSample``, ``LatinHypercubeSample``, ``SobolSample``, ``HaltonSample``,
+    or ``AdaptiveSample``.  ``param`` must be a valid
     dot-sperated string path to the object attribute (in this case, an RO attribute
     on the flowsheet ``m``) that you wish to vary.  The remaining arguments are
     dependent on the sample type selected.  For ``NormalSample`` information about
@@ -251,6 +442,36 @@ def get_sweep_params_from_yaml(m, yaml_filename):
     return ParameterSweepReader().get_sweep_params_from_yaml(m, yaml_filename)
 
 
+def get_outputs_from_yaml(m, yaml_filename):
+    """Creates a dictionary of sweep outputs from patterns in a yaml file
+
+    This function reads a yaml file with either a list of name patterns::
+
+        - fs.*.costing.capital_cost
+        - fs.RO.flux_mass_phase_comp_avg[*]
+
+    or short names and patterns::
+
+        LCOW: fs.costing.LCOW
+        capital_cost: fs.*.costing.capital_cost
+
+    and resolves the patterns against an index of the names of the model.
+
+    Args:
+        m (pyomo model):
+            The flowsheet containing the outputs.
+        yaml_filename (str):
+            The path to the yaml file.
+
+    Returns:
+        outputs (dict):
+            A dictionary of output names and components for the parameter
+            sweep.
+
+    """
+    return ParameterSweepReader().get_outputs_from_yaml(m, yaml_filename)
+
+
 def set_defaults_from_yaml(m, yaml_filename, verbose=False):
     """Sets default model values using values stored in a yaml file
 
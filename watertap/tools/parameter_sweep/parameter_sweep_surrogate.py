@@ -0,0 +1,337 @@
+###############################################################################
+# WaterTAP Copyright (c) 2021, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National
+# Laboratory, National Renewable Energy Laboratory, and National Energy
+# Technology Laboratory (subject to receipt of any required approvals from
+# the U.S. Dept. of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#
+###############################################################################
+import itertools
+import json
+import numpy as np
+import idaes.logger as idaeslog
+
+from scipy.linalg import lstsq
+from scipy.spatial.distance import cdist
+from scipy.special import xlogy
+
+_log = idaeslog.getLogger(__name__)
+
+
+class ParameterSweepSurrogate:
+    """
+    Surrogate model of outputs of a parameter sweep as functions of the sweep
+    parameters, for evaluating many points without solving the flowsheet.
+
+    The parameters are scaled to [-1, 1] by the range of the fitted cases.
+    With ``method="polynomial"``, every output is a least-squares fit of the
+    monomials of the scaled parameters up to a total ``degree``. With
+    ``method="rbf"``, every output is interpolated, or smoothed by
+    ``smoothing``, with radial basis functions centered on the fitted cases
+    plus a linear polynomial.
+    """
+
+    methods = ("polynomial", "rbf")
+
+    # The kernels are evaluated on squared distances, avoiding square roots
+    # where possible
+    kernels = {
+        "linear": lambda r2, epsilon: -np.sqrt(r2),
+        "cubic": lambda r2, epsilon: r2 * np.sqrt(r2),
+        "thin_plate_spline": lambda r2, epsilon: 0.5 * xlogy(r2, r2),
+        "gaussian": lambda r2, epsilon: np.exp(-(epsilon**2) * r2),
+        "multiquadric": lambda r2, epsilon: -np.sqrt(1.0 + epsilon**2 * r2),
+    }
+
+    def __init__(
+        self,
+        method="polynomial",
+        degree=2,
+        kernel="thin_plate_spline",
+        epsilon=1.0,
+        smoothing=0.0,
+    ):
+
+        if method not in self.methods:
+            raise ValueError(
+                f"Unknown surrogate method {method}, expected one of {self.methods}."
+            )
+        if kernel not in self.kernels:
+            raise ValueError(
+                f"Unknown RBF kernel {kernel}, expected one of {tuple(self.kernels)}."
+            )
+
+        self.method = method
+        self.degree = int(degree)
+        self.kernel = kernel
+        self.epsilon = float(epsilon)
+        self.smoothing = float(smoothing)
+
+        self.input_names = []
+        self.output_names = []
+        self.validation_error = {}
+
+        self._lower = None
+        self._span = None
+        self._exponents = None
+        self._centers = None
+        self._coefficients = None
+
+    @classmethod
+    def from_results(
+        cls,
+        results_dict,
+        outputs=None,
+        validation_fraction=0.2,
+        seed=None,
+        **options,
+    ):
+        """
+        Fits a surrogate to the ``outputs`` (by default all of them) of a
+        parameter sweep results dictionary, as returned on rank 0, using the
+        cases that solved successfully.
+        """
+
+        input_names = list(results_dict["sweep_params"])
+        if outputs is None:
+            outputs = list(results_dict["outputs"])
+        for name in outputs:
+            if name not in results_dict["outputs"]:
+                raise KeyError(f"{name} is not an output of the parameter sweep.")
+
+        inputs = np.column_stack(
+            [results_dict["sweep_params"][name]["value"] for name in input_names]
+        )
+        values = np.column_stack(
+            [results_dict["outputs"][name]["value"] for name in outputs]
+        )
+
+        keep = np.asarray(results_dict["solve_successful"], dtype=bool)
+        keep &= np.all(np.isfinite(values), axis=1)
+
+        return cls(**options).fit(
+            inputs[keep, :],
+            values[keep, :],
+            input_names=input_names,
+            output_names=outputs,
+            validation_fraction=validation_fraction,
+            seed=seed,
+        )
+
+    def fit(
+        self,
+        inputs,
+        outputs,
+        input_names=None,
+        output_names=None,
+        validation_fraction=0.2,
+        seed=None,
+    ):
+        """
+        Fits the surrogate to the rows of ``outputs`` at the rows of
+        ``inputs``. A random ``validation_fraction`` of the cases is first
+        held out to estimate the error of the surrogate, stored in
+        ``validation_error``, after which the surrogate is refitted to all of
+        the cases. Returns the surrogate.
+        """
+
+        # A one-dimensional array is a single column
+        inputs = np.asarray(inputs, dtype=np.float64)
+        if inputs.ndim == 1:
+            inputs = inputs[:, np.newaxis]
+        outputs = np.asarray(outputs, dtype=np.float64)
+        if outputs.ndim == 1:
+            outputs = outputs[:, np.newaxis]
+        num_cases, num_inputs = inputs.shape
+
+        self.input_names = (
+            [f"x{i}" for i in range(num_inputs)]
+            if input_names is None
+            else list(input_names)
+        )
+        self.output_names = (
+            [f"y{i}" for i in range(outputs.shape[1])]
+            if output_names is None
+            else list(output_names)
+        )
+
+        num_validation = int(round(validation_fraction * num_cases))
+        order = np.random.default_rng(seed).permutation(num_cases)
+        validation, training = order[:num_validation], order[num_validation:]
+
+        self._fit(inputs[training, :], outputs[training, :])
+
+        self.validation_error = {}
+        if num_validation > 0:
+            error = self.predict(inputs[validation, :]) - outputs[validation, :]
+            variance = np.var(outputs[validation, :], axis=0)
+            for j, name in enumerate(self.output_names):
+                mse = np.mean(error[:, j] ** 2)
+                self.validation_error[name] = {
+                    "rmse": float(np.sqrt(mse)),
+                    "max_abs_error": float(np.max(np.abs(error[:, j]))),
+                    "r2": float(1.0 - mse / variance[j]) if variance[j] > 0 else np.nan,
+                }
+                _log.info(
+                    f"Surrogate of {name}: validation RMSE "
+                    f"{self.validation_error[name]['rmse']:.6g}, R2 "
+                    f"{self.validation_error[name]['r2']:.6g} "
+                    f"({num_validation} cases)"
+                )
+
+            self._fit(inputs, outputs)
+
+        return self
+
+    def _fit(self, inputs, outputs):
+
+        self._lower = np.min(inputs, axis=0)
+        self._span = np.max(inputs, axis=0) - self._lower
+        self._span[self._span == 0] = 1.0
+
+        z = self._scale(inputs)
+        num_inputs = z.shape[1]
+
+        if self.method == "polynomial":
+            # The exponents of every monomial up to the total degree
+            exponents = []
+            for order in range(self.degree + 1):
+                for combination in itertools.combinations_with_replacement(
+                    range(num_inputs), order
+                ):
+                    exponents.append(np.bincount(combination, minlength=num_inputs))
+            self._exponents = np.array(exponents, dtype=np.int64)
+            self._centers = np.zeros((0, num_inputs))
+
+            if len(z) < len(self._exponents):
+                raise ValueError(
+                    f"A polynomial of degree {self.degree} in {num_inputs} parameters "
+                    f"needs at least {len(self._exponents)} cases, got {len(z)}."
+                )
+            self._coefficients = lstsq(self._polynomial_basis(z), outputs)[0]
+
+        else:
+            # A linear polynomial keeps the interpolation system well posed
+            self._exponents = np.vstack(
+                (
+                    np.zeros(num_inputs, dtype=np.int64),
+                    np.eye(num_inputs, dtype=np.int64),
+                )
+            )
+            self._centers = z
+
+            if len(z) < len(self._exponents):
+                raise ValueError(
+                    f"An RBF surrogate in {num_inputs} parameters needs at least "
+                    f"{len(self._exponents)} cases, got {len(z)}."
+                )
+
+            kernel = self._kernel_basis(z)
+            kernel[np.diag_indices_from(kernel)] += self.smoothing
+            poly = self._polynomial_basis(z)
+            lhs = np.block(
+                [[kernel, poly], [poly.T, np.zeros((poly.shape[1], poly.shape[1]))]]
+            )
+            rhs = np.vstack((outputs, np.zeros((poly.shape[1], outputs.shape[1]))))
+            self._coefficients = lstsq(lhs, rhs)[0]
+
+    def _scale(self, inputs):
+        return 2.0 * (inputs - self._lower) / self._span - 1.0
+
+    def _polynomial_basis(self, z):
+        basis = np.ones((z.shape[0], len(self._exponents)))
+        for term, exponents in enumerate(self._exponents):
+            for i in np.flatnonzero(exponents):
+                basis[:, term] *= z[:, i] ** exponents[i]
+        return basis
+
+    def _kernel_basis(self, z):
+        return self.kernels[self.kernel](
+            cdist(z, self._centers, "sqeuclidean"), self.epsilon
+        )
+
+    def predict(self, inputs, chunk_size=10000):
+        """
+        Evaluates the surrogate at the rows of ``inputs``, one column per
+        sweep parameter, and returns a (points x outputs) array. The points
+        are evaluated ``chunk_size`` at a time to bound the memory use.
+        """
+
+        if self._coefficients is None:
+            raise RuntimeError("The surrogate has not been fitted.")
+
+        inputs = np.asarray(inputs, dtype=np.float64)
+        if inputs.ndim > 2 or np.shape(inputs)[-1] != len(self.input_names):
+            raise ValueError(
+                f"Expected points with {len(self.input_names)} sweep parameters, got an array of shape {np.shape(inputs)}."
+            )
+        inputs = np.reshape(inputs, (-1, len(self.input_names)))
+
+        result = np.empty((inputs.shape[0], len(self.output_names)))
+        for start in range(0, inputs.shape[0], chunk_size):
+            z = self._scale(inputs[start : start + chunk_size, :])
+            basis = self._polynomial_basis(z)
+            if self.method == "rbf":
+                basis = np.hstack((self._kernel_basis(z), basis))
+            result[start : start + chunk_size, :] = basis @ self._coefficients
+
+        return result
+
+    def save(self, file_name):
+        """
+        Saves the fitted surrogate to the NumPy ``.npz`` file ``file_name``.
+        """
+
+        metadata = {
+            "method": self.method,
+            "degree": self.degree,
+            "kernel": self.kernel,
+            "epsilon": self.epsilon,
+            "smoothing": self.smoothing,
+            "input_names": self.input_names,
+            "output_names": self.output_names,
+            "validation_error": self.validation_error,
+        }
+
+        with open(file_name, "wb") as f:
+            np.savez(
+                f,
+                metadata=np.array(json.dumps(metadata)),
+                lower=self._lower,
+                span=self._span,
+                exponents=self._exponents,
+                centers=self._centers,
+                coefficients=self._coefficients,
+            )
+
+    @classmethod
+    def load(cls, file_name):
+        """
+        Loads a surrogate saved by ``save``.
+        """
+
+        with np.load(file_name, allow_pickle=False) as data:
+            metadata = json.loads(str(data["metadata"]))
+
+            surrogate = cls(
+                method=metadata["method"],
+                degree=metadata["degree"],
+                kernel=metadata["kernel"],
+                epsilon=metadata["epsilon"],
+                smoothing=metadata["smoothing"],
+            )
+            surrogate.input_names = metadata["input_names"]
+            surrogate.output_names = metadata["output_names"]
+            surrogate.validation_error = metadata["validation_error"]
+
+            surrogate._lower = data["lower"]
+            surrogate._span = data["span"]
+            surrogate._exponents = data["exponents"]
+            surrogate._centers = data["centers"]
+            surrogate._coefficients = data["coefficients"]
+
+        return surrogate
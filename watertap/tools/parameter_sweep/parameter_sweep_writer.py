@@ -11,19 +11,72 @@
 #
 ###############################################################################
 
-import os, pathlib, warnings
+import os, pathlib, warnings, glob
 import h5py
 import itertools
+import json
 import pprint
 import numpy as np
 
-from scipy.interpolate import griddata
+from scipy.interpolate import LinearNDInterpolator, interp1d
+from scipy.spatial import cKDTree
 
-from pyomo.common.config import ConfigDict, ConfigValue
+from pyomo.common.config import ConfigDict, ConfigValue, In, PositiveInt
+
+from watertap.tools.parameter_sweep.parameter_sweep_surrogate import (
+    ParameterSweepSurrogate,
+)
+
+
+# The storage options of the values of a single sweep parameter or output in
+# the H5 files, see ParameterSweepWriter.CONFIG.h5_output_storage
+_H5_STORAGE = ConfigDict()
+_H5_STORAGE.declare("dtype", ConfigValue(domain=In(["float64", "float32"])))
+_H5_STORAGE.declare("compression", ConfigValue(domain=In([None, "gzip", "lzf"])))
+_H5_STORAGE.declare("store_constant_once", ConfigValue(domain=bool))
+
+
+def load_npy_results(results_dir, columns=None, mmap_mode="r"):
+    """
+    Loads the results written to ``npy_results_dir`` by a parameter sweep.
+
+    Args:
+        results_dir : The directory the results were written to.
+        columns (optional) : Names of the columns to load, e.g., the names of
+                             sweep parameters or outputs. The default is to
+                             load every column.
+        mmap_mode (optional) : Passed to ``numpy.load``. The default ``"r"``
+                               memory maps the columns read-only, so only the
+                               rows that are used are read from disk; None
+                               reads the columns into memory.
+
+    Returns:
+        values : Dictionary of the column values, keyed by column name.
+        metadata : Dictionary of the column metadata, e.g., the group, units
+                   and bounds, keyed by column name.
+    """
+
+    with open(os.path.join(results_dir, ParameterSweepWriter.npy_metadata_file)) as f:
+        metadata = {item["name"]: item for item in json.load(f)["columns"]}
+
+    if columns is None:
+        columns = list(metadata)
+
+    values = {}
+    for name in columns:
+        if name not in metadata:
+            raise KeyError(f"The results in {results_dir} have no column {name}")
+        values[name] = np.load(
+            os.path.join(results_dir, metadata[name]["file"]), mmap_mode=mmap_mode
+        )
+
+    return values, {name: metadata[name] for name in columns}
 
 
 class ParameterSweepWriter:
 
+    npy_metadata_file = "metadata.json"
+
     CONFIG = ConfigDict()
 
     CONFIG.declare(
@@ -49,6 +102,15 @@ class ParameterSweepWriter:
         ),
     )
 
+    CONFIG.declare(
+        "npy_results_dir",
+        ConfigValue(
+            default=None,
+            domain=str,
+            description="directory path to output the results as one binary .npy file per column.",
+        ),
+    )
+
     CONFIG.declare(
         "interpolate_nan_outputs",
         ConfigValue(
@@ -58,6 +120,150 @@ class ParameterSweepWriter:
         ),
     )
 
+    CONFIG.declare(
+        "interpolation_method",
+        ConfigValue(
+            default="linear",
+            domain=In(["linear", "idw"]),
+            description="Method to interpolate NaN outputs: piecewise linear on a triangulation of the parameter space, or inverse distance weighting of the nearest neighbors.",
+        ),
+    )
+
+    CONFIG.declare(
+        "interpolation_neighbors",
+        ConfigValue(
+            default=None,
+            domain=PositiveInt,
+            description="Number of nearest neighbors used by the inverse distance weighting interpolation, by default twice the number of sweep parameters.",
+        ),
+    )
+
+    CONFIG.declare(
+        "surrogate_file_name",
+        ConfigValue(
+            default=None,
+            domain=str,
+            description="filepath to the output .npz file of a surrogate model fitted to the results.",
+        ),
+    )
+
+    CONFIG.declare(
+        "surrogate_outputs",
+        ConfigValue(
+            default=None,
+            domain=list,
+            description="Names of the outputs fitted by the surrogate model, by default all outputs.",
+        ),
+    )
+
+    CONFIG.declare(
+        "surrogate_method",
+        ConfigValue(
+            default="polynomial",
+            domain=In(["polynomial", "rbf"]),
+            description="Surrogate model fitted to the results: a polynomial or radial basis functions.",
+        ),
+    )
+
+    CONFIG.declare(
+        "surrogate_options",
+        ConfigValue(
+            default=dict(),
+            domain=dict,
+            description="Keyword arguments of ParameterSweepSurrogate.from_results, e.g., degree, kernel or validation_fraction.",
+        ),
+    )
+
+    CONFIG.declare(
+        "h5_streaming",
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description="Bool to decide whether each rank appends its finished cases to its own H5 file during the sweep.",
+        ),
+    )
+
+    CONFIG.declare(
+        "h5_streaming_interval",
+        ConfigValue(
+            default=1,
+            domain=PositiveInt,
+            description="Number of finished cases buffered before they are appended to the streaming H5 file.",
+        ),
+    )
+
+    CONFIG.declare(
+        "h5_parallel",
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description="Bool to decide whether every rank writes its own cases to the H5 results file instead of rank 0 writing all of them.",
+        ),
+    )
+
+    CONFIG.declare(
+        "h5_dtype",
+        ConfigValue(
+            default="float64",
+            domain=In(["float64", "float32"]),
+            description="Floating point type of the values stored in the H5 files.",
+        ),
+    )
+
+    CONFIG.declare(
+        "h5_compression",
+        ConfigValue(
+            default=None,
+            domain=In([None, "gzip", "lzf"]),
+            description="Compression filter of the chunked value datasets of the H5 files, if any.",
+        ),
+    )
+
+    CONFIG.declare(
+        "h5_compression_level",
+        ConfigValue(
+            default=4,
+            domain=In(range(10)),
+            description="Level of the gzip compression, from 0 (fastest) to 9 (smallest).",
+        ),
+    )
+
+    CONFIG.declare(
+        "h5_store_constant_once",
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description="Bool to decide whether values that are the same in every case are stored once, as the fill value of an unallocated dataset, instead of once per case.",
+        ),
+    )
+
+    CONFIG.declare(
+        "h5_output_storage",
+        ConfigValue(
+            default=dict(),
+            domain=dict,
+            description="Per-output overrides of h5_dtype, h5_compression and h5_store_constant_once, keyed by the name of the sweep parameter or output, e.g., {'fs.costing.LCOW': {'dtype': 'float64'}}.",
+        ),
+    )
+
+    CONFIG.declare(
+        "checkpoint_dir",
+        ConfigValue(
+            default=None,
+            domain=str,
+            description="directory path for periodic per-rank checkpoints of the solved cases.",
+        ),
+    )
+
+    CONFIG.declare(
+        "checkpoint_interval",
+        ConfigValue(
+            default=10,
+            domain=PositiveInt,
+            description="Number of solved cases between two checkpoint writes.",
+        ),
+    )
+
     def __init__(
         self,
         comm,
@@ -70,13 +276,33 @@ class ParameterSweepWriter:
 
         self.config = self.CONFIG(options)
 
+        self._checkpoint_column_names = []
+        self._checkpoint_buffer = []
+        self._stream_value_paths = []
+        self._stream_buffer = []
+
+        # Only the options that were given override the global ones
+        self._h5_output_storage = {}
+        for name, storage in self.config.h5_output_storage.items():
+            checked = _H5_STORAGE(storage)
+            self._h5_output_storage[name] = {key: checked[key] for key in storage}
+
+        if self.config.h5_streaming and self.config.h5_results_file_name is None:
+            raise ValueError("Streaming the results requires an h5_results_file_name.")
+        if self.config.h5_parallel and self.config.h5_results_file_name is None:
+            raise ValueError(
+                "Writing the results in parallel requires an h5_results_file_name."
+            )
+
         if self.rank == 0:
             if (
                 self.config.h5_results_file_name is None
                 and self.config.csv_results_file_name is None
+                and self.config.npy_results_dir is None
+                and self.config.surrogate_file_name is None
             ):
                 warnings.warn(
-                    "No results will be writen to disk as h5_results_file_name and csv_results_file_name are both None"
+                    "No results will be writen to disk as h5_results_file_name, csv_results_file_name, npy_results_dir and surrogate_file_name are all None"
                 )
 
     @staticmethod
@@ -93,19 +319,22 @@ class ParameterSweepWriter:
         # Get the file name without the extension
         known_extensions = [".h5", ".csv"]
         for ext in known_extensions:
-            fname_no_ext, extension = _strip_extension(results_file_name, ext)
+            fname_no_ext, extension = ParameterSweepWriter._strip_extension(
+                results_file_name, ext
+            )
             if extension is not None:
                 break
 
         return dirname, fname_no_ext, extension
 
     @staticmethod
-    def _interp_nan_values(global_values, global_results):
+    def _interp_nan_values(
+        global_values, global_results, method="linear", num_neighbors=None
+    ):
 
         global_results_clean = np.copy(global_results)
 
         n_vals = np.shape(global_values)[1]
-        n_outs = np.shape(global_results)[1]
 
         # Build a mask of all the non-nan saved outputs
         # i.e., where the optimzation succeeded
@@ -113,21 +342,66 @@ class ParameterSweepWriter:
 
         # Create a list of points where good data is available
         x0 = global_values[mask, :]
+        y0 = global_results[mask, :]
+        xi = global_values[~mask, :]
 
         if np.sum(mask) >= 4:
-            # Interpolate to get a value for nan points where possible
-            for k in range(n_outs):
-                y0 = global_results[mask, k]
-                yi = griddata(
-                    x0, y0, global_values, method="linear", rescale=True
-                ).reshape(-1)
-                global_results_clean[~mask, k] = yi[~mask]
+            # Interpolate to get a value for nan points where possible. The
+            # triangulation or the neighborhoods are built once and shared by
+            # all of the outputs
+            if method == "idw":
+                global_results_clean[
+                    ~mask, :
+                ] = ParameterSweepWriter._interp_inverse_distance(
+                    x0, y0, xi, num_neighbors
+                )
+            elif n_vals == 1:
+                global_results_clean[~mask, :] = interp1d(
+                    x0[:, 0], y0, axis=0, bounds_error=False, fill_value=np.nan
+                )(xi[:, 0])
+            else:
+                global_results_clean[~mask, :] = LinearNDInterpolator(
+                    x0, y0, rescale=True
+                )(xi)
 
         else:
             warnings.warn("Too few points to perform interpolation.")
 
         return global_results_clean
 
+    @staticmethod
+    def _interp_inverse_distance(x0, y0, xi, num_neighbors=None):
+        """
+        Inverse distance weighted interpolation of the rows of ``y0`` at the
+        points ``xi`` from their ``num_neighbors`` nearest points in ``x0``,
+        measured after scaling every parameter to the unit interval.
+        """
+
+        n_vals = np.shape(x0)[1]
+        if num_neighbors is None:
+            num_neighbors = 2 * n_vals
+        num_neighbors = min(num_neighbors, np.shape(x0)[0])
+
+        lower = np.min(x0, axis=0)
+        span = np.max(x0, axis=0) - lower
+        span[span == 0] = 1.0
+
+        tree = cKDTree((x0 - lower) / span)
+        dist, idx = tree.query((xi - lower) / span, k=num_neighbors)
+        dist = np.reshape(dist, (len(xi), num_neighbors))
+        idx = np.reshape(idx, (len(xi), num_neighbors))
+
+        with np.errstate(divide="ignore"):
+            weights = 1.0 / dist**2
+
+        # A point that was solved is not interpolated
+        exact = dist[:, 0] == 0
+        weights[exact, :] = 0.0
+        weights[exact, 0] = 1.0
+        weights /= np.sum(weights, axis=1, keepdims=True)
+
+        return np.einsum("ij,ijk->ik", weights, y0[idx])
+
     def save_results(
         self,
         sweep_params,
@@ -136,6 +410,7 @@ class ParameterSweepWriter:
         local_results_dict,
         global_results_dict,
         global_results_arr,
+        local_case_indices=None,
     ):
 
         if self.rank == 0:
@@ -169,10 +444,37 @@ class ParameterSweepWriter:
             global_results_arr,
         )
 
-        if self.rank == 0 and self.config["h5_results_file_name"] is not None:
+        if self.rank == 0 and self.config["npy_results_dir"] is not None:
+            self._write_to_npy(global_results_dict)
+
+        if self.config["h5_results_file_name"] is None:
+            pass
+        elif self.config["h5_parallel"]:
+            # Every rank writes its own cases of the output dictionary
+            self._write_parallel_h5(
+                local_results_dict, local_case_indices, np.shape(global_values)[0]
+            )
+            if self.rank == 0:
+                self._write_output_txt(dict(local_results_dict), txt_options="keys")
+        elif self.rank == 0:
             # Save the data of output dictionary
             self._write_outputs(global_results_dict, txt_options="keys")
 
+        # The surrogate is fitted on rank 0 after the collective writes, and
+        # every rank learns whether the fit failed so that none of them are
+        # left waiting in a later collective call
+        if self.config["surrogate_file_name"] is not None:
+            surrogate_error = None
+            if self.rank == 0:
+                try:
+                    self._write_surrogate(global_results_dict)
+                except Exception as err:
+                    surrogate_error = err
+            if self.comm.bcast(surrogate_error is not None, root=0):
+                if surrogate_error is not None:
+                    raise surrogate_error
+                raise RuntimeError("Fitting the surrogate failed on rank 0.")
+
         return global_save_data
 
     def _write_debug_data(
@@ -216,6 +518,9 @@ class ParameterSweepWriter:
     def _write_outputs(self, output_dict, txt_options="metadata"):
 
         self._write_output_to_h5(output_dict, self.config["h5_results_file_name"])
+        self._write_output_txt(output_dict, txt_options)
+
+    def _write_output_txt(self, output_dict, txt_options="metadata"):
 
         # We will also create a companion txt file by default which contains
         # the metadata of the h5 file in a user readable format.
@@ -237,6 +542,105 @@ class ParameterSweepWriter:
         with open(txt_fname, "w") as log_file:
             pprint.pprint(my_dict, log_file)
 
+    @staticmethod
+    def _write_h5_metadata(subgrp, subitem, skip=()):
+
+        for subsubkey, subsubitem in subitem.items():
+            if subsubkey[0] != "_" and subsubkey not in skip:
+                if subsubkey == "lower bound" and subsubitem is None:
+                    subgrp.create_dataset(subsubkey, data=np.finfo("d").min)
+                elif subsubkey == "upper bound" and subsubitem is None:
+                    subgrp.create_dataset(subsubkey, data=np.finfo("d").max)
+                else:
+                    subgrp.create_dataset(subsubkey, data=subsubitem)
+
+    @staticmethod
+    def _append_to_h5(h5_obj, new_data):
+        """
+        Appends arrays along their first axis to resizable datasets of
+        ``h5_obj``, creating the datasets on first use.
+        """
+
+        for key, data in new_data.items():
+            if key not in h5_obj:
+                h5_obj.create_dataset(
+                    key,
+                    shape=(0,) + data.shape[1:],
+                    maxshape=(None,) + data.shape[1:],
+                    dtype=data.dtype,
+                    chunks=True,
+                )
+            num_stored = h5_obj[key].shape[0]
+            h5_obj[key].resize(num_stored + data.shape[0], axis=0)
+            h5_obj[key][num_stored:] = data
+
+    def _h5_storage(self, name):
+        """
+        Returns the dtype, compression and constant handling of the values of
+        the sweep parameter or output ``name`` in the H5 files.
+        """
+
+        storage = {
+            "dtype": self.config["h5_dtype"],
+            "compression": self.config["h5_compression"],
+            "store_constant_once": self.config["h5_store_constant_once"],
+        }
+        storage.update(self._h5_output_storage.get(name, {}))
+
+        return storage
+
+    def _h5_dataset_kwargs(self, storage):
+        """
+        Returns the keyword arguments of ``create_dataset`` for the dtype and
+        compression of ``storage``.
+        """
+
+        kwargs = {"dtype": storage["dtype"]}
+        if storage["compression"] is not None:
+            # Filters require a chunked layout
+            kwargs["chunks"] = True
+            kwargs["compression"] = storage["compression"]
+            if storage["compression"] == "gzip":
+                kwargs["compression_opts"] = self.config["h5_compression_level"]
+
+        return kwargs
+
+    def _create_h5_values(self, subgrp, name, values):
+        """
+        Creates the ``value`` dataset of the sweep parameter or output
+        ``name`` in ``subgrp``, with the storage options of ``name``.
+        """
+
+        storage = self._h5_storage(name)
+        kwargs = self._h5_dataset_kwargs(storage)
+        values = np.asarray(values, dtype=np.float64)
+
+        # The failed cases of a constant, e.g., a fixed variable, are NaN
+        missing = np.isnan(values)
+        known = values[~missing]
+
+        if (
+            storage["store_constant_once"]
+            and len(values) > 0
+            and np.all(known == known[:1])
+        ):
+            # Chunks that are never written are not allocated and read as the
+            # fill value, so only the chunks with failed cases are stored
+            kwargs["chunks"] = True
+            dset = subgrp.create_dataset(
+                "value",
+                shape=values.shape,
+                fillvalue=known[0] if len(known) > 0 else np.nan,
+                **kwargs,
+            )
+            if len(known) > 0:
+                positions = np.flatnonzero(missing)
+                for start, stop in self._contiguous_runs(positions):
+                    dset[positions[start] : positions[stop - 1] + 1] = np.nan
+            return dset
+
+        return subgrp.create_dataset("value", data=values, **kwargs)
+
     def _write_output_to_h5(self, output_dict, h5_results_file_name):
 
         f = h5py.File(h5_results_file_name, "w")
@@ -245,19 +649,180 @@ class ParameterSweepWriter:
             if key != "solve_successful":
                 for subkey, subitem in item.items():
                     subgrp = grp.create_group(subkey)
-                    for subsubkey, subsubitem in subitem.items():
-                        if subsubkey[0] != "_":
-                            if subsubkey == "lower bound" and subsubitem is None:
-                                subgrp.create_dataset(subsubkey, data=np.finfo("d").min)
-                            elif subsubkey == "upper bound" and subsubitem is None:
-                                subgrp.create_dataset(subsubkey, data=np.finfo("d").max)
-                            else:
-                                subgrp.create_dataset(subsubkey, data=subsubitem)
+                    self._write_h5_metadata(subgrp, subitem, skip=("value",))
+                    self._create_h5_values(subgrp, subkey, subitem["value"])
             elif key == "solve_successful":
                 grp.create_dataset(key, data=output_dict[key])
 
         f.close()
 
+    def _write_h5_layout(self, f, output_dict):
+        """
+        Creates the groups and metadata of the H5 results file for the
+        structure of ``output_dict``, without the values, and returns the
+        paths of the value datasets.
+        """
+
+        value_paths = []
+        for key, item in output_dict.items():
+            grp = f.create_group(key)
+            if key != "solve_successful":
+                for subkey, subitem in item.items():
+                    subgrp = grp.create_group(subkey)
+                    self._write_h5_metadata(subgrp, subitem, skip=("value",))
+                    value_paths.append(f"{key}/{subkey}/value")
+            else:
+                value_paths.append(f"{key}/{key}")
+
+        return value_paths
+
+    @staticmethod
+    def _contiguous_runs(positions):
+        """
+        Splits the sorted ``positions`` into runs of consecutive values and
+        returns the (start, stop) bounds of the runs within ``positions``.
+        """
+
+        breaks = np.flatnonzero(np.diff(positions) != 1) + 1
+        bounds = np.concatenate(([0], breaks, [len(positions)]))
+
+        return [
+            (start, stop)
+            for start, stop in zip(bounds[:-1], bounds[1:])
+            if stop > start
+        ]
+
+    def _part_file_name(self, rank):
+        _, fname_no_ext, _ = self._process_results_filename(
+            self.config["h5_results_file_name"]
+        )
+        return f"{fname_no_ext}_part{rank:03}.h5"
+
+    def _write_parallel_h5(self, local_results_dict, local_case_indices, num_cases):
+        """
+        Writes the H5 results file from the local results of every rank, so
+        the values never pass through rank 0. The cases of a rank go to the
+        rows given by ``local_case_indices``, or, if None, to the rows after
+        the cases of the lower ranks; rows past ``num_cases`` are dropped.
+
+        With parallel h5py, all ranks write their rows to the shared file
+        through the MPI-IO driver. Otherwise every rank writes its rows to its
+        own part file and rank 0 creates the results file with virtual
+        datasets that map the rows of the part files.
+        """
+
+        local_num_cases = len(local_results_dict["solve_successful"])
+        if local_case_indices is None:
+            offset = sum(self.comm.allgather(local_num_cases)[: self.rank])
+            positions = offset + np.arange(local_num_cases, dtype=np.int64)
+        else:
+            positions = np.asarray(local_case_indices, dtype=np.int64)
+
+        rows = np.flatnonzero(positions < num_cases)
+        rows = rows[np.argsort(positions[rows], kind="stable")]
+        positions = positions[rows]
+
+        local_data = [
+            np.asarray(subitem["value"], dtype=np.float64)[rows]
+            for key, item in local_results_dict.items()
+            if key != "solve_successful"
+            for subitem in item.values()
+        ]
+        local_data.append(
+            np.asarray(local_results_dict["solve_successful"], dtype=bool)[rows]
+        )
+
+        # The dtype and compression of every column; the solve status is
+        # stored as is
+        local_kwargs = [
+            self._h5_dataset_kwargs(self._h5_storage(subkey))
+            for key, item in local_results_dict.items()
+            if key != "solve_successful"
+            for subkey in item
+        ]
+        local_kwargs.append({"dtype": bool})
+
+        fname = self.config["h5_results_file_name"]
+
+        if self.num_procs == 1 or h5py.get_config().mpi:
+            if self.num_procs == 1:
+                driver_kwargs = {}
+            else:
+                driver_kwargs = {"driver": "mpio", "comm": self.comm}
+
+            # Creating the groups and datasets is collective, writing the rows
+            # of each rank is independent
+            with h5py.File(fname, "w", **driver_kwargs) as f:
+                value_paths = self._write_h5_layout(f, local_results_dict)
+                for path, data, kwargs in zip(value_paths, local_data, local_kwargs):
+                    if self.num_procs > 1:
+                        # Filters need collective writes through MPI-IO
+                        kwargs = {"dtype": kwargs["dtype"]}
+                    dset = f.create_dataset(
+                        path,
+                        shape=(num_cases,),
+                        fillvalue=np.nan if data.dtype == np.float64 else False,
+                        **kwargs,
+                    )
+                    for start, stop in self._contiguous_runs(positions):
+                        dset[positions[start] : positions[stop - 1] + 1] = data[
+                            start:stop
+                        ]
+
+        else:
+            with h5py.File(self._part_file_name(self.rank), "w") as f:
+                f.create_dataset("case_index", data=positions)
+                for j, (data, kwargs) in enumerate(zip(local_data, local_kwargs)):
+                    f.create_dataset(f"column_{j:06}", data=data, **kwargs)
+
+            # Only the row positions are collected on rank 0
+            all_positions = self.comm.gather(positions, root=0)
+
+            if self.rank == 0:
+                with h5py.File(fname, "w") as f:
+                    value_paths = self._write_h5_layout(f, local_results_dict)
+                    for j, (path, data, kwargs) in enumerate(
+                        zip(value_paths, local_data, local_kwargs)
+                    ):
+                        layout = h5py.VirtualLayout(
+                            shape=(num_cases,), dtype=kwargs["dtype"]
+                        )
+                        for rank, rank_positions in enumerate(all_positions):
+                            # Relative to the results file, so the files can be moved
+                            source = h5py.VirtualSource(
+                                os.path.basename(self._part_file_name(rank)),
+                                f"column_{j:06}",
+                                shape=(len(rank_positions),),
+                                dtype=kwargs["dtype"],
+                            )
+                            for start, stop in self._contiguous_runs(rank_positions):
+                                layout[
+                                    rank_positions[start] : rank_positions[stop - 1] + 1
+                                ] = source[start:stop]
+                        f.create_virtual_dataset(
+                            path,
+                            layout,
+                            fillvalue=np.nan if data.dtype == np.float64 else False,
+                        )
+
+        self.comm.Barrier()
+
+    @staticmethod
+    def _get_result_columns(results_dict):
+        """
+        Returns the (name, item) pairs of the result columns of the CSV file:
+        the outputs followed by the optional per-case solver statistics and
+        solve status.
+        """
+
+        return list(
+            itertools.chain(
+                results_dict["outputs"].items(),
+                results_dict.get("solver_stats", {}).items(),
+                results_dict.get("solve_status", {}).items(),
+            )
+        )
+
     def _write_to_csv(
         self,
         sweep_params,
@@ -271,7 +836,7 @@ class ParameterSweepWriter:
 
         if self.rank == 0:
             data_header = ",".join(itertools.chain(sweep_params))
-            for i, (key, item) in enumerate(global_results_dict["outputs"].items()):
+            for key, item in self._get_result_columns(global_results_dict):
                 data_header = ",".join([data_header, key])
 
             if self.config["csv_results_file_name"] is not None:
@@ -286,8 +851,15 @@ class ParameterSweepWriter:
 
                 # If we want the interpolated output_list in CSV
                 if self.config["interpolate_nan_outputs"]:
-                    global_results_clean = self._interp_nan_values(
-                        global_values, global_results_arr
+                    # Only the outputs are interpolated, the solver statistics
+                    # and solve status of the failed cases are kept as measured
+                    num_outputs = len(global_results_dict["outputs"])
+                    global_results_clean = np.copy(global_results_arr)
+                    global_results_clean[:, :num_outputs] = self._interp_nan_values(
+                        global_values,
+                        global_results_arr[:, :num_outputs],
+                        self.config["interpolation_method"],
+                        self.config["interpolation_neighbors"],
                     )
                     global_save_data_clean = np.hstack(
                         (global_values, global_results_clean)
@@ -309,3 +881,263 @@ class ParameterSweepWriter:
                     )
 
         return global_save_data
+
+    def _write_to_npy(self, global_results_dict):
+        """
+        Writes every sweep parameter, result column and the solve status to
+        its own binary .npy file in ``npy_results_dir``. The names, groups,
+        units and bounds of the columns are stored in a JSON metadata file.
+        """
+
+        results_dir = self.config["npy_results_dir"]
+        os.makedirs(results_dir, exist_ok=True)
+
+        # The same columns, in the same order, as in the CSV file
+        columns = [
+            (group, key, item)
+            for group in ("sweep_params", "outputs", "solver_stats", "solve_status")
+            for key, item in global_results_dict.get(group, {}).items()
+        ]
+        columns.append(
+            (
+                "solve_successful",
+                "solve_successful",
+                {
+                    "value": np.asarray(
+                        global_results_dict["solve_successful"], dtype=bool
+                    )
+                },
+            )
+        )
+
+        metadata = []
+        for j, (group, key, item) in enumerate(columns):
+            fname = f"column_{j:06}.npy"
+            data = np.asarray(item["value"])
+            if data.dtype != bool:
+                data = data.astype(np.float64)
+            np.save(os.path.join(results_dir, fname), np.ascontiguousarray(data))
+
+            column = {"name": key, "group": group, "file": fname}
+            for subkey, subitem in item.items():
+                if subkey != "value" and subkey[0] != "_":
+                    column[subkey] = subitem
+            metadata.append(column)
+
+        # Written last, so the metadata only refers to complete columns
+        with open(os.path.join(results_dir, self.npy_metadata_file), "w") as f:
+            json.dump(
+                {"num_cases": len(columns[-1][2]["value"]), "columns": metadata},
+                f,
+                indent=1,
+                default=lambda obj: obj.item() if hasattr(obj, "item") else str(obj),
+            )
+
+    def _write_surrogate(self, global_results_dict):
+        """
+        Fits a surrogate model of the results and saves it to
+        ``surrogate_file_name``.
+        """
+
+        pathlib.Path(self.config["surrogate_file_name"]).parent.mkdir(
+            parents=True, exist_ok=True
+        )
+
+        surrogate = ParameterSweepSurrogate.from_results(
+            global_results_dict,
+            outputs=self.config["surrogate_outputs"],
+            method=self.config["surrogate_method"],
+            **self.config["surrogate_options"],
+        )
+        surrogate.save(self.config["surrogate_file_name"])
+
+    def _checkpoint_file_name(self, rank):
+        return os.path.join(self.config["checkpoint_dir"], f"checkpoint_{rank:03}.h5")
+
+    def _checkpoint_file_pattern(self):
+        return os.path.join(self.config["checkpoint_dir"], "checkpoint_*.h5")
+
+    def start_checkpoint(self, column_names, resume=False):
+        """
+        Prepares the checkpoint directory for a new sweep. Unless ``resume`` is
+        True, checkpoints of a previous sweep are removed.
+
+        Returns the cases found in the checkpoint files of all ranks when
+        resuming, else None.
+        """
+
+        if self.rank == 0:
+            os.makedirs(self.config["checkpoint_dir"], exist_ok=True)
+            if not resume:
+                for fname in glob.glob(self._checkpoint_file_pattern()):
+                    os.remove(fname)
+
+        self.comm.Barrier()
+
+        self._checkpoint_column_names = list(column_names)
+        self._checkpoint_buffer = []
+
+        if resume:
+            checkpoint_data = self._read_checkpoints()
+        else:
+            checkpoint_data = None
+
+        # Make sure nobody appends to a file that is still being read
+        self.comm.Barrier()
+
+        return checkpoint_data
+
+    def _read_checkpoints(self):
+
+        case_index = []
+        solve_successful = []
+        values = []
+
+        for fname in sorted(glob.glob(self._checkpoint_file_pattern())):
+            try:
+                with h5py.File(fname, "r") as f:
+                    column_names = list(f["column_names"].asstr()[()])
+                    if column_names != self._checkpoint_column_names:
+                        raise ValueError(
+                            f"The checkpoint {fname} was written by a sweep with different sweep parameters or outputs"
+                        )
+                    case_index.append(f["case_index"][()])
+                    solve_successful.append(f["solve_successful"][()])
+                    values.append(f["values"][()])
+            except OSError:
+                warnings.warn(f"Could not read the checkpoint {fname}, ignoring it.")
+
+        num_columns = len(self._checkpoint_column_names)
+
+        if case_index:
+            return {
+                "case_index": np.concatenate(case_index),
+                "solve_successful": np.concatenate(solve_successful),
+                "values": np.vstack(values),
+            }
+        else:
+            return {
+                "case_index": np.zeros(0, dtype=np.int64),
+                "solve_successful": np.zeros(0, dtype=bool),
+                "values": np.zeros((0, num_columns), dtype=np.float64),
+            }
+
+    def checkpoint_case(self, case_index, values, solve_successful):
+        """
+        Records a solved case and writes the recorded cases to this rank's
+        checkpoint file every ``checkpoint_interval`` cases.
+        """
+
+        self._checkpoint_buffer.append((case_index, values, solve_successful))
+
+        if len(self._checkpoint_buffer) >= self.config["checkpoint_interval"]:
+            self.flush_checkpoint()
+
+    def flush_checkpoint(self):
+
+        if not self._checkpoint_buffer:
+            return
+
+        case_index, values, solve_successful = zip(*self._checkpoint_buffer)
+        new_data = {
+            "case_index": np.array(case_index, dtype=np.int64),
+            "solve_successful": np.array(solve_successful, dtype=bool),
+            "values": np.vstack(values).astype(np.float64),
+        }
+
+        # Cases are only ever appended, so an interrupted sweep loses at most
+        # the cases recorded since the last write
+        with h5py.File(self._checkpoint_file_name(self.rank), "a") as f:
+            if "column_names" not in f:
+                f.create_dataset(
+                    "column_names",
+                    data=np.array(
+                        self._checkpoint_column_names, dtype=h5py.string_dtype()
+                    ),
+                )
+            self._append_to_h5(f, new_data)
+
+        self._checkpoint_buffer = []
+
+    def _stream_file_name(self, rank):
+        _, fname_no_ext, _ = self._process_results_filename(
+            self.config["h5_results_file_name"]
+        )
+        return f"{fname_no_ext}_rank{rank:03}.h5"
+
+    def start_stream(self, output_dict):
+        """
+        Creates this rank's streaming H5 file with the same layout as the
+        final H5 results file. The metadata of every sweep parameter and
+        output is written up front along with empty, resizable value datasets
+        that grow as cases finish. A ``case_index`` dataset maps the rows to
+        the global case numbers.
+        """
+
+        if self.rank == 0:
+            pathlib.Path(self.config["h5_results_file_name"]).parent.mkdir(
+                parents=True, exist_ok=True
+            )
+        self.comm.Barrier()
+
+        self._stream_value_paths = []
+        self._stream_buffer = []
+
+        with h5py.File(self._stream_file_name(self.rank), "w") as f:
+            for key, item in output_dict.items():
+                if key == "solve_successful":
+                    continue
+                grp = f.create_group(key)
+                for subkey, subitem in item.items():
+                    subgrp = grp.create_group(subkey)
+                    self._write_h5_metadata(subgrp, subitem, skip=("value",))
+                    self._stream_value_paths.append(f"{key}/{subkey}/value")
+
+                    # The values are appended with the dtype and compression
+                    # of their sweep parameter or output
+                    kwargs = self._h5_dataset_kwargs(self._h5_storage(subkey))
+                    kwargs["chunks"] = True
+                    subgrp.create_dataset(
+                        "value", shape=(0,), maxshape=(None,), **kwargs
+                    )
+
+            self._append_to_h5(
+                f,
+                {
+                    "case_index": np.zeros(0, dtype=np.int64),
+                    "solve_successful/solve_successful": np.zeros(0, dtype=bool),
+                },
+            )
+
+    def stream_case(self, case_index, values, solve_successful):
+        """
+        Records a finished case and appends the recorded cases to this rank's
+        streaming H5 file every ``h5_streaming_interval`` cases.
+        """
+
+        self._stream_buffer.append((case_index, values, solve_successful))
+
+        if len(self._stream_buffer) >= self.config["h5_streaming_interval"]:
+            self.flush_stream()
+
+    def flush_stream(self):
+
+        if not self._stream_buffer:
+            return
+
+        case_index, values, solve_successful = zip(*self._stream_buffer)
+        values = np.vstack(values)
+
+        new_data = {
+            "case_index": np.array(case_index, dtype=np.int64),
+            "solve_successful/solve_successful": np.array(solve_successful, dtype=bool),
+        }
+        for j, path in enumerate(self._stream_value_paths):
+            new_data[path] = values[:, j]
+
+        # The file is only open while appending, so it can be read by other
+        # processes between two writes
+        with h5py.File(self._stream_file_name(self.rank), "a") as f:
+            self._append_to_h5(f, new_data)
+
+        self._stream_buffer = []
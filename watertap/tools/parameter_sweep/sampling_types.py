@@ -14,8 +14,11 @@
 # sampling.py - This file contains all of the sampling classes
 
 import numpy as np
+import warnings
 
 from enum import Enum, auto
+from scipy.spatial import cKDTree
+from scipy.stats import qmc
 from abc import abstractmethod, ABC
 
 
@@ -23,6 +26,8 @@ class SamplingType(Enum):
     FIXED = auto()
     RANDOM = auto()
     RANDOM_LHS = auto()
+    ADAPTIVE = auto()
+    LOW_DISCREPANCY = auto()
 
 
 class _Sample(ABC):
@@ -99,8 +104,11 @@ class ReverseGeomSample(FixedSample):
 
 
 class UniformSample(RandomSample):
-    def sample(self, num_samples):
-        return np.random.uniform(self.lower_limit, self.upper_limit, num_samples)
+    def sample(self, num_samples, generator=None):
+        # Without a generator, draw from numpy's global random state
+        if generator is None:
+            generator = np.random
+        return generator.uniform(self.lower_limit, self.upper_limit, num_samples)
 
     def setup(self, lower_limit, upper_limit):
         self.lower_limit = lower_limit
@@ -108,8 +116,11 @@ class UniformSample(RandomSample):
 
 
 class NormalSample(RandomSample):
-    def sample(self, num_samples):
-        return np.random.normal(self.mean, self.sd, num_samples)
+    def sample(self, num_samples, generator=None):
+        # Without a generator, draw from numpy's global random state
+        if generator is None:
+            generator = np.random
+        return generator.normal(self.mean, self.sd, num_samples)
 
     def setup(self, mean, sd):
         self.mean = mean
@@ -119,9 +130,185 @@ class NormalSample(RandomSample):
 class LatinHypercubeSample(_Sample):
     sampling_type = SamplingType.RANDOM_LHS
 
+    def sample(self, num_samples):
+        return [self.lower_limit, self.upper_limit]
+
+    def sample_strata(self, strata, num_samples, generator):
+        # Draw one point uniformly from each of the given strata, out of
+        # num_samples strata of equal width between the limits
+        offsets = generator.uniform(0.0, 1.0, len(strata))
+        return self.lower_limit + (np.asarray(strata) + offsets) / num_samples * (
+            self.upper_limit - self.lower_limit
+        )
+
+    def setup(self, lower_limit, upper_limit):
+        self.lower_limit = lower_limit
+        self.upper_limit = upper_limit
+
+
+class _LowDiscrepancySample(_Sample):
+    sampling_type = SamplingType.LOW_DISCREPANCY
+
     def sample(self, num_samples):
         return [self.lower_limit, self.upper_limit]
 
     def setup(self, lower_limit, upper_limit):
         self.lower_limit = lower_limit
         self.upper_limit = upper_limit
+
+
+class SobolSample(_LowDiscrepancySample):
+    engine = qmc.Sobol
+
+
+class HaltonSample(_LowDiscrepancySample):
+    engine = qmc.Halton
+
+
+def low_discrepancy_points(samples, start, stop, seed=None):
+    """
+    Returns the points ``start`` to ``stop - 1`` of the scrambled
+    low-discrepancy sequence spanned by ``samples``, one column per sample.
+
+    The scrambling only depends on ``seed``, so any sub-range of the sequence
+    can be generated independently, e.g., by each MPI rank.
+
+    Args:
+        samples: list of SobolSample or HaltonSample objects
+        start: index of the first point
+        stop: index after the last point
+        seed (optional): seed of the scrambling
+
+    Returns:
+        An array of shape (stop - start, len(samples))
+    """
+
+    engines = {type(sample).engine for sample in samples}
+    if len(engines) != 1:
+        raise ValueError("Cannot mix Sobol and Halton samples")
+
+    engine = engines.pop()(d=len(samples), scramble=True, seed=seed)
+    if start > 0:
+        engine.fast_forward(start)
+
+    with warnings.catch_warnings():
+        # Sobol warns about sample sizes that are not powers of two
+        warnings.simplefilter("ignore", UserWarning)
+        points = engine.random(stop - start)
+
+    lower_limits = np.array([sample.lower_limit for sample in samples])
+    upper_limits = np.array([sample.upper_limit for sample in samples])
+
+    return lower_limits + points * (upper_limits - lower_limits)
+
+
+class AdaptiveSample(_Sample):
+    sampling_type = SamplingType.ADAPTIVE
+
+    def sample(self, num_samples):
+        # The first round of an adaptive sweep is a linear grid
+        return np.linspace(self.lower_limit, self.upper_limit, self.num_samples)
+
+    def setup(self, lower_limit, upper_limit, num_samples):
+        self.lower_limit = lower_limit
+        self.upper_limit = upper_limit
+        self.num_samples = num_samples
+
+
+def adaptive_refinement_points(
+    values,
+    results,
+    solve_successful,
+    lower_limits,
+    upper_limits,
+    num_points,
+    num_neighbors=None,
+):
+    """
+    Selects the points of the next round of an adaptive sweep.
+
+    Every case is paired with its nearest neighbours in the parameter space,
+    scaled to the unit box, and the midpoints of the pairs are scored by their
+    length times the sum of: a large weight if one case of the pair solved
+    and the other did not, the largest change of any output between the two
+    cases relative to the range of that output, and a small constant. The
+    length accounts for how uncertain the results are between two cases, so
+    that sharp features are refined first but no region is left unsampled.
+
+    Args:
+        values: array of the sweep parameter values of the solved cases
+        results: array of the outputs of the solved cases
+        solve_successful: boolean array with the solve status of the cases
+        lower_limits: lower limits of the sweep parameters
+        upper_limits: upper limits of the sweep parameters
+        num_points: maximum number of points to return
+        num_neighbors (optional): number of neighbours paired with each
+            case, defaults to twice the number of sweep parameters
+
+    Returns:
+        An array with up to num_points new combinations of sweep parameter values
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    results = np.asarray(results, dtype=np.float64).reshape(len(values), -1)
+    solve_successful = np.asarray(solve_successful, dtype=bool)
+    lower_limits = np.asarray(lower_limits, dtype=np.float64)
+
+    num_cases, num_params = np.shape(values)
+    if num_neighbors is None:
+        num_neighbors = 2 * num_params
+    num_neighbors = min(num_neighbors, num_cases - 1)
+    if num_neighbors < 1 or num_points < 1:
+        return np.zeros((0, num_params))
+
+    scale = np.asarray(upper_limits, dtype=np.float64) - lower_limits
+    scale[scale == 0] = 1.0
+    x = (values - lower_limits) / scale
+
+    # Pair every case with its nearest neighbours, counting each pair once
+    tree = cKDTree(x)
+    _, neighbors = tree.query(x, num_neighbors + 1)
+    pairs = np.column_stack(
+        (np.repeat(np.arange(num_cases), num_neighbors), neighbors[:, 1:].ravel())
+    )
+    pairs = np.unique(np.sort(pairs, axis=1), axis=0)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    a, b = pairs[:, 0], pairs[:, 1]
+
+    length = np.linalg.norm(x[a] - x[b], axis=1)
+
+    # Change of the outputs along the pair, relative to their range
+    change = np.zeros(len(pairs))
+    both_solved = solve_successful[a] & solve_successful[b]
+    if np.any(both_solved):
+        solved_results = results[solve_successful]
+        with np.errstate(invalid="ignore"):
+            output_range = np.nanmax(solved_results, axis=0) - np.nanmin(
+                solved_results, axis=0
+            )
+        output_range[~(output_range > 0)] = 1.0
+        relative_change = np.abs(results[a[both_solved]] - results[b[both_solved]])
+        relative_change = np.nan_to_num(relative_change / output_range)
+        change[both_solved] = np.max(relative_change, axis=1, initial=0.0)
+
+    # Crossing the feasibility boundary ranks above any change of the outputs
+    flip = solve_successful[a] != solve_successful[b]
+    score = length * (2.0 * flip + change + 0.1)
+
+    midpoints = 0.5 * (x[a] + x[b])
+    new_points = []
+    taken = set()
+    for k in np.argsort(-score, kind="stable"):
+        if len(new_points) == num_points:
+            break
+        # Skip midpoints that were already solved or selected
+        key = tuple(np.round(midpoints[k], 12))
+        if key in taken or tree.query(midpoints[k])[0] < 1e-12:
+            continue
+        taken.add(key)
+        new_points.append(midpoints[k])
+
+    if not new_points:
+        return np.zeros((0, num_params))
+
+    return lower_limits + np.array(new_points) * scale
@@ -0,0 +1,291 @@
+###############################################################################
+# WaterTAP Copyright (c) 2021, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National
+# Laboratory, National Renewable Energy Laboratory, and National Energy
+# Technology Laboratory (subject to receipt of any required approvals from
+# the U.S. Dept. of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#
+###############################################################################
+
+import pytest
+import os
+import numpy as np
+
+from pyomo.environ import value
+
+from watertap.tools.parameter_sweep.sampling_types import *
+from watertap.tools.parameter_sweep import DifferentialParameterSweep
+from watertap.tools.parameter_sweep.tests.test_parameter_sweep import (
+    _build_model,
+    _analytic_optimization,
+    _read_output_h5,
+    _get_rank0_path,
+)
+
+import watertap.tools.MPI as MPI
+
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture
+def model():
+    m = _build_model()
+    m.fs.slack.setub(0)
+    return m
+
+
+def _outputs(m):
+    return {
+        "output_c": m.fs.output["c"],
+        "output_d": m.fs.output["d"],
+        "performance": m.fs.performance,
+    }
+
+
+@pytest.mark.component
+def test_differential_parameter_sweep(model, tmp_path):
+    comm = MPI.COMM_WORLD
+
+    tmp_path = _get_rank0_path(comm, tmp_path)
+    csv_results_file_name = os.path.join(tmp_path, "global_results_differential.csv")
+    h5_results_file_name = os.path.join(tmp_path, "global_results_differential.h5")
+
+    m = model
+    A = m.fs.input["a"]
+    B = m.fs.input["b"]
+
+    ps = DifferentialParameterSweep(
+        comm=comm,
+        optimize_function=_analytic_optimization,
+        csv_results_file_name=csv_results_file_name,
+        h5_results_file_name=h5_results_file_name,
+        differential_sweep_specs={
+            A.name: {"step": 0.01},
+            # A parameter that is not swept, perturbed by an absolute step
+            "slack_penalty": {
+                "pyomo_object": m.fs.slack_penalty,
+                "step": 10.0,
+                "relative": False,
+            },
+        },
+    )
+
+    sweep_params = {
+        A.name: LinearSample(A, 0.1, 0.5, 3),
+        B.name: LinearSample(B, 0.0, 0.3, 2),
+    }
+    data = ps.parameter_sweep(m, sweep_params, outputs=_outputs(m))
+
+    # Every nominal case is followed by one step up and down in every
+    # perturbed parameter
+    nominal = np.array(
+        [[a, b, 1000.0] for a in (0.1, 0.3, 0.5) for b in (0.0, 0.3)], dtype=float
+    )
+    offsets = np.array(
+        [
+            [0.0, 0.0, 0.0],
+            [0.01, 0.0, 0.0],
+            [-0.01, 0.0, 0.0],
+            [0.0, 0.0, 10.0],
+            [0.0, 0.0, -10.0],
+        ]
+    )
+    values = np.repeat(nominal, 5, axis=0)
+    values[:, 0] *= 1.0 + np.tile(offsets[:, 0], 6)
+    values[:, 2] += np.tile(offsets[:, 2], 6)
+
+    c = 2 * values[:, 0]
+    d = 3 * values[:, 1]
+    feasible = (c <= 1.0) & (d <= 1.0)
+    results = np.column_stack((c, d, c + d))
+    results[~feasible, :] = np.nan
+
+    assert np.allclose(data, np.hstack((values, results)), equal_nan=True)
+
+    # The perturbed parameter that is not swept is restored
+    assert value(m.fs.slack_penalty) == 1000.0
+
+    assert ps.differential_params == [A.name, "slack_penalty"]
+    assert np.allclose(ps.nominal_values, nominal)
+    assert list(ps.sensitivities) == ["output_c", "output_d", "performance"]
+    # The sensitivities at a = 0.5 are fitted without the infeasible step up
+    assert np.allclose(ps.sensitivities["output_c"], [[2.0, 0.0]] * 6)
+    assert np.allclose(ps.sensitivities["output_d"], 0.0)
+    assert np.allclose(ps.sensitivities["performance"], [[2.0, 0.0]] * 6)
+
+    if ps.rank == 0:
+        csv_data = np.genfromtxt(csv_results_file_name, skip_header=1, delimiter=",")
+        assert np.allclose(csv_data, data, equal_nan=True)
+
+        read_dict = _read_output_h5(h5_results_file_name)
+        assert list(read_dict["sweep_params"]) == [
+            "fs.input[a]",
+            "fs.input[b]",
+            "fs.slack_penalty",
+        ]
+        assert read_dict["solve_successful"] == list(feasible)
+
+
+@pytest.mark.component
+def test_differential_parameter_sweep_uniform(model):
+    m = model
+    A = m.fs.input["a"]
+    B = m.fs.input["b"]
+
+    ps = DifferentialParameterSweep(
+        optimize_function=_analytic_optimization,
+        differential_sweep_specs={A.name: {"step": 0.02}, B.name: {"step": 0.05}},
+        differential_sampling="uniform",
+        num_diff_samples=4,
+    )
+
+    sweep_params = {
+        A.name: LinearSample(A, 0.1, 0.2, 2),
+        B.name: LinearSample(B, 0.1, 0.2, 2),
+    }
+    data = ps.parameter_sweep(m, sweep_params, outputs=_outputs(m), seed=1)
+
+    assert np.shape(data) == (4 * 5, 5)
+    nominal = np.repeat(ps.nominal_values, 5, axis=0)
+    assert np.all(np.abs(data[:, 0] / nominal[:, 0] - 1.0) <= 0.02)
+    assert np.all(np.abs(data[:, 1] / nominal[:, 1] - 1.0) <= 0.05)
+    # The perturbations differ between the nominal cases
+    assert not np.allclose(data[1:5, 0] / data[0, 0], data[6:10, 0] / data[5, 0])
+
+    assert np.allclose(ps.sensitivities["output_c"], [[2.0, 0.0]] * 4)
+    assert np.allclose(ps.sensitivities["output_d"], [[0.0, 3.0]] * 4)
+
+    # The same seed draws the same perturbations
+    assert np.allclose(
+        ps.parameter_sweep(m, sweep_params, outputs=_outputs(m), seed=1), data
+    )
+
+
+@pytest.mark.component
+def test_differential_parameter_sweep_nominal_warm_start(model):
+    m = model
+    A = m.fs.input["a"]
+    m.fs.input["b"].fix(0.1)
+
+    # The value of output c when each case is started, and the value of a
+    starts = []
+
+    def _recording_optimization(m):
+        starts.append((value(m.fs.output["c"]), value(m.fs.input["a"])))
+        return _analytic_optimization(m)
+
+    ps = DifferentialParameterSweep(
+        comm=MPI.COMM_WORLD,
+        optimize_function=_recording_optimization,
+        differential_sweep_specs={A.name: {"step": 0.1}},
+    )
+
+    # The nominal case a = 0.6 is infeasible
+    sweep_params = {A.name: LinearSample(A, 0.2, 0.6, 3)}
+    data = ps.parameter_sweep(m, sweep_params, outputs=_outputs(m))
+
+    assert np.all(np.isnan(data[6:, 2:]))
+    assert np.all(np.isnan(ps.sensitivities["output_c"][2, :]))
+    assert np.allclose(ps.sensitivities["output_c"][:2, :], 2.0)
+
+    # Every perturbation starts from the solution of its nominal case, and
+    # the perturbations of the infeasible nominal case are not solved
+    solved_a = [a for c, a in starts]
+    for nominal_a in (0.2, 0.4):
+        if nominal_a in solved_a:
+            k = solved_a.index(nominal_a)
+            assert starts[k + 1] == pytest.approx((2 * nominal_a, 1.1 * nominal_a))
+            assert starts[k + 2] == pytest.approx((2 * nominal_a, 0.9 * nominal_a))
+    assert not any(a == pytest.approx(0.66) for a in solved_a)
+    assert not any(a == pytest.approx(0.54) for a in solved_a)
+
+
+@pytest.mark.component
+def test_differential_parameter_sweep_zero_nominal(model):
+    m = model
+    A = m.fs.input["a"]
+    m.fs.input["b"].fix(0.1)
+
+    ps = DifferentialParameterSweep(
+        optimize_function=_analytic_optimization,
+        differential_sweep_specs={A.name: {"step": 0.01}},
+    )
+
+    # The relative step of the nominal case a = 0 is taken as absolute
+    sweep_params = {A.name: LinearSample(A, 0.0, 0.2, 2)}
+    data = ps.parameter_sweep(m, sweep_params, outputs=_outputs(m))
+
+    assert np.allclose(data[:, 0], [0.0, 0.01, -0.01, 0.2, 0.202, 0.198])
+    assert np.allclose(ps.sensitivities["output_c"], 2.0)
+
+
+@pytest.mark.unit
+def test_differential_parameter_sweep_degenerate_fit():
+    ps = DifferentialParameterSweep(
+        differential_sweep_specs={"a": {"step": 0.1}, "b": {"step": 0.1}}
+    )
+    ps._group_size = 4
+
+    # The perturbations of the first nominal case only move along a + b, so
+    # they do not determine the derivatives
+    values = np.array(
+        [
+            [0.5, 0.5],
+            [0.6, 0.6],
+            [0.4, 0.4],
+            [0.7, 0.7],
+            [0.5, 0.5],
+            [0.6, 0.5],
+            [0.5, 0.6],
+            [0.4, 0.5],
+        ]
+    )
+    results = 2.0 * values[:, :1] + 3.0 * values[:, 1:]
+
+    sensitivities = ps._fit_sensitivities(values, results, [0, 1])
+    assert np.all(np.isnan(sensitivities[0]))
+    assert np.allclose(sensitivities[1], [[2.0, 3.0]])
+
+
+@pytest.mark.unit
+def test_differential_parameter_sweep_errors(model):
+    m = model
+    A = m.fs.input["a"]
+    sweep_params = {A.name: LinearSample(A, 0.1, 0.5, 3)}
+
+    ps = DifferentialParameterSweep(optimize_function=_analytic_optimization)
+    with pytest.raises(ValueError, match="requires differential_sweep_specs"):
+        ps.parameter_sweep(m, sweep_params)
+
+    ps = DifferentialParameterSweep(
+        optimize_function=_analytic_optimization,
+        differential_sweep_specs={"fs.input[b]": {"step": 0.1}},
+    )
+    with pytest.raises(ValueError, match="has no pyomo_object"):
+        ps.parameter_sweep(m, sweep_params)
+
+    ps = DifferentialParameterSweep(
+        optimize_function=_analytic_optimization,
+        differential_sweep_specs={A.name: {}},
+    )
+    with pytest.raises(ValueError, match="has no step"):
+        ps.parameter_sweep(m, sweep_params)
+
+    ps = DifferentialParameterSweep(
+        optimize_function=_analytic_optimization,
+        differential_sweep_specs={A.name: {"step": 0.1}},
+        space_filling_order=True,
+    )
+    with pytest.raises(ValueError, match="space_filling_order is not supported"):
+        ps.parameter_sweep(m, sweep_params)
+
+    ps = DifferentialParameterSweep(
+        optimize_function=_analytic_optimization,
+        differential_sweep_specs={A.name: {"step": 0.1}},
+    )
+    with pytest.raises(ValueError, match="Adaptive sampling is not supported"):
+        ps.parameter_sweep(m, {A.name: AdaptiveSample(A, 0.1, 0.5, 3)})
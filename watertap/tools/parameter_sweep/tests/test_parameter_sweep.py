@@ -16,46 +16,68 @@ import os
 import numpy as np
 import pyomo.environ as pyo
 import warnings
+import json
+import sys
+import time
 
 from pyomo.environ import value
+from pyomo.opt import SolverResults, SolverStatus, TerminationCondition
 
 from watertap.tools.parameter_sweep.sampling_types import *
-from watertap.tools.parameter_sweep import ParameterSweep, parameter_sweep
+from watertap.tools.parameter_sweep.sampling_types import (
+    adaptive_refinement_points,
+    low_discrepancy_points,
+)
+from watertap.tools.parameter_sweep import (
+    ParameterSweep,
+    parameter_sweep,
+    load_npy_results,
+    ParameterSweepSurrogate,
+)
+from watertap.tools.parameter_sweep.parameter_sweep import (
+    _CaseTimer,
+    _OutputExtractor,
+    _RankLocalSampler,
+    _SweepProgress,
+)
 from watertap.tools.parameter_sweep.parameter_sweep_writer import *
 
 import watertap.tools.MPI as MPI
+from watertap.tools.MPI.dummy_mpi import DummyCOMM
 
 # -----------------------------------------------------------------------------
 
 
-class TestParallelManager:
-    @pytest.fixture(scope="class")
-    def model(self):
-        m = pyo.ConcreteModel()
-        m.fs = fs = pyo.Block()
+def _build_model():
+    m = pyo.ConcreteModel()
+    m.fs = fs = pyo.Block()
 
-        fs.input = pyo.Var(["a", "b"], within=pyo.UnitInterval, initialize=0.5)
-        fs.output = pyo.Var(["c", "d"], within=pyo.UnitInterval, initialize=0.5)
+    fs.input = pyo.Var(["a", "b"], within=pyo.UnitInterval, initialize=0.5)
+    fs.output = pyo.Var(["c", "d"], within=pyo.UnitInterval, initialize=0.5)
 
-        fs.slack = pyo.Var(["ab_slack", "cd_slack"], bounds=(0, 0), initialize=0.0)
-        fs.slack_penalty = pyo.Param(
-            default=1000.0, mutable=True, within=pyo.PositiveReals
-        )
+    fs.slack = pyo.Var(["ab_slack", "cd_slack"], bounds=(0, 0), initialize=0.0)
+    fs.slack_penalty = pyo.Param(default=1000.0, mutable=True, within=pyo.PositiveReals)
 
-        fs.ab_constr = pyo.Constraint(
-            expr=(fs.output["c"] + fs.slack["ab_slack"] == 2 * fs.input["a"])
-        )
-        fs.cd_constr = pyo.Constraint(
-            expr=(fs.output["d"] + fs.slack["cd_slack"] == 3 * fs.input["b"])
-        )
+    fs.ab_constr = pyo.Constraint(
+        expr=(fs.output["c"] + fs.slack["ab_slack"] == 2 * fs.input["a"])
+    )
+    fs.cd_constr = pyo.Constraint(
+        expr=(fs.output["d"] + fs.slack["cd_slack"] == 3 * fs.input["b"])
+    )
 
-        fs.performance = pyo.Expression(expr=pyo.summation(fs.output))
+    fs.performance = pyo.Expression(expr=pyo.summation(fs.output))
 
-        m.objective = pyo.Objective(
-            expr=m.fs.performance - m.fs.slack_penalty * pyo.summation(m.fs.slack),
-            sense=pyo.maximize,
-        )
-        return m
+    m.objective = pyo.Objective(
+        expr=m.fs.performance - m.fs.slack_penalty * pyo.summation(m.fs.slack),
+        sense=pyo.maximize,
+    )
+    return m
+
+
+class TestParallelManager:
+    @pytest.fixture(scope="class")
+    def model(self):
+        return _build_model()
 
     @pytest.mark.unit
     def test_single_index_unrolled(self):
@@ -288,6 +310,41 @@ class TestParallelManager:
             assert local_combo_array[-1, 1] == pytest.approx(range_B[1])
             assert local_combo_array[-1, 2] == pytest.approx(range_C[1])
 
+    @pytest.mark.component
+    def test_decode_fixed_combinations(self):
+        ps = ParameterSweep()
+
+        A_param = pyo.Param(initialize=0.0, mutable=True)
+        B_param = pyo.Param(initialize=1.0, mutable=True)
+        C_param = pyo.Param(initialize=2.0, mutable=True)
+
+        param_dict = dict()
+        param_dict["var_A"] = LinearSample(A_param, 0.0, 10.0, 4)
+        param_dict["var_B"] = GeomSample(B_param, 1.0, 20.0, 5)
+        param_dict["var_C"] = ReverseGeomSample(C_param, 2.0, 30.0, 6)
+
+        # The decoded combinations match the full grid built by meshgrid
+        param_values = [v.sample(None) for v in param_dict.values()]
+        truth = np.array(np.meshgrid(*param_values, indexing="ij"))
+        truth = truth.reshape(len(param_dict), -1).T
+
+        num_cases = ps._get_num_combinations(param_dict, SamplingType.FIXED, None)
+        assert num_cases == 4 * 5 * 6
+
+        case_indices = ps._divide_case_indices(num_cases)
+        assert np.array_equal(
+            case_indices,
+            np.array_split(np.arange(num_cases), ps.num_procs)[ps.rank],
+        )
+
+        local_combo_array = ps._decode_fixed_combinations(param_dict, case_indices)
+        assert np.allclose(local_combo_array, truth[case_indices, :])
+
+        assert np.allclose(
+            ps._decode_fixed_combinations(param_dict, [119, 0, 37]),
+            truth[[119, 0, 37], :],
+        )
+
     @pytest.mark.component
     def test_update_model_values(self, model):
         m = model
@@ -460,85 +517,1588 @@ class TestParallelManager:
             },
         }
 
-        _assert_dictionary_correctness(truth_dict, output_dict)
+        _assert_dictionary_correctness(truth_dict, output_dict)
+
+    @pytest.mark.unit
+    def test_create_global_output(self, model):
+        ps = ParameterSweep()
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        sweep_params = {
+            "input_a": NormalSample(m.fs.input["a"], 0.1, 0.9),
+            "input_b": NormalSample(m.fs.input["b"], 0.0, 0.5),
+        }
+        outputs = {
+            "output_c": m.fs.output["c"],
+            "output_d": m.fs.output["d"],
+            "performance": m.fs.performance,
+        }
+
+        sweep_params, sampling_type = ps._process_sweep_params(sweep_params)
+        # Get the globale sweep param values
+        global_num_cases = 2 * ps.num_procs
+        global_values = ps._build_combinations(
+            sweep_params, sampling_type, global_num_cases
+        )
+        # divide the workload between processors
+        local_values = ps._divide_combinations(global_values)
+        local_num_cases = np.shape(local_values)[0]
+
+        local_output_dict = ps._create_local_output_skeleton(
+            model, sweep_params, None, local_num_cases
+        )
+
+        # Manually update the values in the numpy array
+        for key, value in local_output_dict.items():
+            for subkey, subvalue in value.items():
+                subvalue["value"][:] = ps.rank
+
+        # Local output dict also contains the solve_successful. The solve status is
+        # based on the
+        local_output_dict["solve_successful"] = [True] * local_num_cases
+
+        # Get the global output dictionary, This is properly created only on rank 0
+        global_output_dict = ps._create_global_output(
+            local_output_dict, global_num_cases
+        )
+
+        if ps.rank > 0:
+            assert global_output_dict == local_output_dict
+        else:
+            test_array = np.repeat(np.arange(0, ps.num_procs, dtype=float), 2)
+            test_list = [True] * global_num_cases
+            for key, value in global_output_dict.items():
+                if key != "solve_successful":
+                    for subkey, subvalue in value.items():
+                        assert np.allclose(subvalue["value"], test_array)
+                elif key == "solve_successful":
+                    assert list(value) == test_list
+        ps.comm.Barrier()
+
+    @pytest.mark.unit
+    def test_create_global_output_case_order(self, model, monkeypatch):
+        ps = ParameterSweep(comm=DummyCOMM)
+
+        A = model.fs.input["a"]
+        sweep_params = {A.name: LinearSample(A, 0.0, 1.0, 4)}
+        local_output_dict = ps._create_local_output_skeleton(
+            model, sweep_params, None, 4
+        )
+
+        # Cases solved out of order, e.g., by the dynamic scheduler
+        local_case_indices = [2, 0, 3, 1]
+        for key, item in local_output_dict.items():
+            for subitem in item.values():
+                subitem["value"][:] = local_case_indices
+        local_output_dict["solve_successful"] = [True, False, True, False]
+
+        gathers = []
+        gatherv = DummyCOMM.Gatherv
+
+        def _counting_gatherv(*args, **kwargs):
+            gathers.append(kwargs)
+            return gatherv(*args, **kwargs)
+
+        monkeypatch.setattr(DummyCOMM, "Gatherv", _counting_gatherv)
+
+        global_output_dict = ps._create_global_output(
+            local_output_dict, 3, local_case_indices
+        )
+
+        # All of the outputs are collected at once, straight from the array
+        # that holds the local values
+        assert len(gathers) == 1
+        for item in local_output_dict["outputs"].values():
+            assert np.shares_memory(gathers[0]["sendbuf"], item["value"])
+
+        assert list(global_output_dict) == list(local_output_dict)
+        assert list(global_output_dict["solve_successful"]) == [False, False, True]
+        for key, item in global_output_dict.items():
+            if key != "solve_successful":
+                assert list(item) == list(local_output_dict[key])
+                for subkey, subitem in item.items():
+                    assert np.array_equal(subitem["value"], [0.0, 1.0, 2.0])
+                    assert subitem.keys() == local_output_dict[key][subkey].keys()
+
+    @pytest.mark.component
+    def test_parameter_sweep(self, model, tmp_path):
+
+        comm = MPI.COMM_WORLD
+
+        tmp_path = _get_rank0_path(comm, tmp_path)
+
+        results_fname = os.path.join(tmp_path, "global_results")
+        csv_results_file_name = str(results_fname) + ".csv"
+        h5_results_file_name = str(results_fname) + ".h5"
+
+        ps = ParameterSweep(
+            comm=comm,
+            optimize_function=_optimization,
+            csv_results_file_name=csv_results_file_name,
+            h5_results_file_name=h5_results_file_name,
+            debugging_data_dir=tmp_path,
+            interpolate_nan_outputs=True,
+        )
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.9, 3), B.name: (B, 0.0, 0.5, 3)}
+        outputs = {
+            "output_c": m.fs.output["c"],
+            "output_d": m.fs.output["d"],
+            "performance": m.fs.performance,
+        }
+
+        # Call the parameter_sweep function
+        _ = ps.parameter_sweep(
+            m,
+            sweep_params,
+            outputs=outputs,
+        )
+
+        # NOTE: rank 0 "owns" tmp_path, so it needs to be
+        #       responsible for doing any output file checking
+        #       tmp_path can be deleted as soon as this method
+        #       returns
+        if ps.rank == 0:
+            # Check that the global results file is created
+            assert os.path.isfile(csv_results_file_name)
+            assert os.path.isfile(
+                os.path.join(tmp_path, "interpolated_global_results.csv")
+            )
+
+            # Check that all local output files have been created
+            for k in range(ps.num_procs):
+                assert os.path.isfile(
+                    os.path.join(tmp_path, f"local_results_{k:03}.h5")
+                )
+                assert os.path.isfile(
+                    os.path.join(tmp_path, f"local_results_{k:03}.csv")
+                )
+
+            # Attempt to read in the data
+            data = np.genfromtxt(csv_results_file_name, skip_header=1, delimiter=",")
+
+            # Compare the last row of the imported data to truth
+            truth_data = [0.9, 0.5, np.nan, np.nan, np.nan]
+            assert np.allclose(data[-1], truth_data, equal_nan=True)
+
+        # Check for the h5 output
+        if ps.rank == 0:
+            truth_dict = {
+                "outputs": {
+                    "output_c": {
+                        "lower bound": 0,
+                        "units": "None",
+                        "upper bound": 1,
+                        "value": np.array(
+                            [0.2, 0.2, np.nan, 1.0, 1.0, np.nan, np.nan, np.nan, np.nan]
+                        ),
+                    },
+                    "output_d": {
+                        "lower bound": 0,
+                        "units": "None",
+                        "upper bound": 1,
+                        "value": np.array(
+                            [
+                                0.0,
+                                0.75,
+                                np.nan,
+                                0.0,
+                                0.75,
+                                np.nan,
+                                np.nan,
+                                np.nan,
+                                np.nan,
+                            ]
+                        ),
+                    },
+                    "performance": {
+                        "value": np.array(
+                            [
+                                0.2,
+                                0.95,
+                                np.nan,
+                                1.0,
+                                1.75,
+                                np.nan,
+                                np.nan,
+                                np.nan,
+                                np.nan,
+                            ]
+                        )
+                    },
+                },
+                "solve_successful": [
+                    True,
+                    True,
+                    False,
+                    True,
+                    True,
+                    False,
+                    False,
+                    False,
+                    False,
+                ],
+                "sweep_params": {
+                    "fs.input[a]": {
+                        "lower bound": 0,
+                        "units": "None",
+                        "upper bound": 1,
+                        "value": np.array(
+                            [0.1, 0.1, 0.1, 0.5, 0.5, 0.5, 0.9, 0.9, 0.9]
+                        ),
+                    },
+                    "fs.input[b]": {
+                        "lower bound": 0,
+                        "units": "None",
+                        "upper bound": 1,
+                        "value": np.array(
+                            [0.0, 0.25, 0.5, 0.0, 0.25, 0.5, 0.0, 0.25, 0.5]
+                        ),
+                    },
+                },
+            }
+
+            read_dict = _read_output_h5(h5_results_file_name)
+            _assert_dictionary_correctness(truth_dict, read_dict)
+            _assert_h5_csv_agreement(csv_results_file_name, read_dict)
+
+            # Check if there is a text file created
+            import ast
+
+            truth_txt_dict = {
+                "outputs": ["output_c", "output_d", "performance"],
+                "sweep_params": ["fs.input[a]", "fs.input[b]"],
+            }
+
+            txt_fpath = h5_results_file_name + ".txt"
+            assert os.path.exists(txt_fpath)
+            f = open(txt_fpath)
+            f_contents = f.read()
+            read_txt_dict = ast.literal_eval(f_contents)
+            assert read_txt_dict == truth_txt_dict
+
+    @pytest.mark.component
+    def test_parameter_sweep_dynamic_scheduler(self, model, tmp_path):
+        comm = MPI.COMM_WORLD
+
+        tmp_path = _get_rank0_path(comm, tmp_path)
+        results_fname = os.path.join(tmp_path, "global_results_dynamic")
+        csv_results_file_name = str(results_fname) + ".csv"
+        h5_results_file_name = str(results_fname) + ".h5"
+
+        ps = ParameterSweep(
+            comm=comm,
+            optimize_function=_analytic_optimization,
+            csv_results_file_name=csv_results_file_name,
+            h5_results_file_name=h5_results_file_name,
+            scheduler="dynamic",
+            dynamic_chunk_size=2,
+        )
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.9, 3), B.name: (B, 0.0, 0.5, 3)}
+        outputs = {
+            "output_c": m.fs.output["c"],
+            "output_d": m.fs.output["d"],
+            "performance": m.fs.performance,
+        }
+
+        data = ps.parameter_sweep(m, sweep_params, outputs=outputs)
+
+        truth_data = np.array(
+            [
+                [0.1, 0.0, 0.2, 0.0, 0.2],
+                [0.1, 0.25, 0.2, 0.75, 0.95],
+                [0.1, 0.5, np.nan, np.nan, np.nan],
+                [0.5, 0.0, 1.0, 0.0, 1.0],
+                [0.5, 0.25, 1.0, 0.75, 1.75],
+                [0.5, 0.5, np.nan, np.nan, np.nan],
+                [0.9, 0.0, np.nan, np.nan, np.nan],
+                [0.9, 0.25, np.nan, np.nan, np.nan],
+                [0.9, 0.5, np.nan, np.nan, np.nan],
+            ]
+        )
+
+        # The cases are solved out of order but must come back in global order
+        assert np.allclose(data, truth_data, equal_nan=True)
+
+        if ps.rank == 0:
+            read_dict = _read_output_h5(h5_results_file_name)
+            assert read_dict["solve_successful"] == [
+                True,
+                True,
+                False,
+                True,
+                True,
+                False,
+                False,
+                False,
+                False,
+            ]
+            assert np.allclose(
+                read_dict["sweep_params"]["fs.input[a]"]["value"], truth_data[:, 0]
+            )
+            _assert_h5_csv_agreement(csv_results_file_name, read_dict)
+
+    @pytest.mark.unit
+    def test_parameter_sweep_dynamic_skeleton(self, model, monkeypatch):
+        ps = ParameterSweep(
+            comm=DummyCOMM,
+            optimize_function=_analytic_optimization,
+            scheduler="dynamic",
+            dynamic_chunk_size=1,
+        )
+
+        # Count the walks of the model for the outputs and their compilations
+        calls = {"metadata": 0, "extractor": 0}
+        collect_output_metadata = ps._collect_output_metadata
+
+        def _counting_metadata(*args, **kwargs):
+            calls["metadata"] += 1
+            return collect_output_metadata(*args, **kwargs)
+
+        module = sys.modules[ParameterSweep.__module__]
+        output_extractor = module._OutputExtractor
+
+        def _counting_extractor(*args, **kwargs):
+            calls["extractor"] += 1
+            return output_extractor(*args, **kwargs)
+
+        monkeypatch.setattr(ps, "_collect_output_metadata", _counting_metadata)
+        monkeypatch.setattr(module, "_OutputExtractor", _counting_extractor)
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+        m.fs.input["b"].fix(0.1)
+
+        A = m.fs.input["a"]
+        sweep_params = {A.name: (A, 0.1, 0.4, 4)}
+
+        # Every output of the model is saved, for one case per chunk
+        data = ps.parameter_sweep(m, sweep_params, outputs=None)
+
+        assert calls == {"metadata": 1, "extractor": 1}
+        assert np.shape(data)[0] == 4
+        assert data[:, 0] == pytest.approx([0.1, 0.2, 0.3, 0.4])
+
+        # A new sweep collects them again
+        ps.parameter_sweep(m, sweep_params, outputs=None)
+        assert calls == {"metadata": 2, "extractor": 2}
+
+    @pytest.mark.component
+    def test_parameter_sweep_multiprocessing(self, tmp_path):
+        comm = MPI.COMM_WORLD
+
+        tmp_path = _get_rank0_path(comm, tmp_path)
+        results_fname = os.path.join(tmp_path, "global_results_multiprocessing")
+        csv_results_file_name = str(results_fname) + ".csv"
+        h5_results_file_name = str(results_fname) + ".h5"
+
+        ps = ParameterSweep(
+            comm=comm,
+            optimize_function=_analytic_optimization,
+            csv_results_file_name=csv_results_file_name,
+            h5_results_file_name=h5_results_file_name,
+            parallel_back_end="multiprocessing",
+            number_of_subprocesses=2,
+            build_model=_build_model,
+            dynamic_chunk_size=2,
+        )
+
+        m = _build_model()
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.9, 3), B.name: (B, 0.0, 0.5, 3)}
+        outputs = {
+            "output_c": m.fs.output["c"],
+            "output_d": m.fs.output["d"],
+            "performance": m.fs.performance,
+        }
+
+        data = ps.parameter_sweep(m, sweep_params, outputs=outputs)
+
+        truth_data = np.array(
+            [
+                [0.1, 0.0, 0.2, 0.0, 0.2],
+                [0.1, 0.25, 0.2, 0.75, 0.95],
+                [0.1, 0.5, np.nan, np.nan, np.nan],
+                [0.5, 0.0, 1.0, 0.0, 1.0],
+                [0.5, 0.25, 1.0, 0.75, 1.75],
+                [0.5, 0.5, np.nan, np.nan, np.nan],
+                [0.9, 0.0, np.nan, np.nan, np.nan],
+                [0.9, 0.25, np.nan, np.nan, np.nan],
+                [0.9, 0.5, np.nan, np.nan, np.nan],
+            ]
+        )
+
+        assert np.allclose(data, truth_data, equal_nan=True)
+
+        if ps.rank == 0:
+            read_dict = _read_output_h5(h5_results_file_name)
+            assert read_dict["solve_successful"] == [
+                True,
+                True,
+                False,
+                True,
+                True,
+                False,
+                False,
+                False,
+                False,
+            ]
+            _assert_h5_csv_agreement(csv_results_file_name, read_dict)
+
+    @pytest.mark.unit
+    def test_multiprocessing_requires_build_model(self, model):
+        ps = ParameterSweep(parallel_back_end="multiprocessing")
+
+        A = model.fs.input["a"]
+        sweep_params = {A.name: (A, 0.1, 0.9, 3)}
+
+        with pytest.raises(ValueError, match="requires a build_model function"):
+            ps.parameter_sweep(model, sweep_params)
+
+    @pytest.mark.component
+    def test_parameter_sweep_checkpoint_resume(self, model, tmp_path):
+        comm = MPI.COMM_WORLD
+
+        tmp_path = _get_rank0_path(comm, tmp_path)
+        checkpoint_dir = os.path.join(tmp_path, "checkpoints")
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.9, 3), B.name: (B, 0.0, 0.5, 3)}
+        outputs = {
+            "output_c": m.fs.output["c"],
+            "output_d": m.fs.output["d"],
+            "performance": m.fs.performance,
+        }
+
+        ps = ParameterSweep(
+            comm=comm,
+            optimize_function=_analytic_optimization,
+            checkpoint_dir=checkpoint_dir,
+            checkpoint_interval=2,
+        )
+        reference_data = ps.parameter_sweep(m, sweep_params, outputs=outputs)
+
+        if ps.rank == 0:
+            for k in range(ps.num_procs):
+                assert os.path.isfile(
+                    os.path.join(checkpoint_dir, f"checkpoint_{k:03}.h5")
+                )
+
+        # Every case is in the checkpoints, so resuming must not solve anything
+        ps = ParameterSweep(
+            comm=comm,
+            optimize_function=_failing_optimization,
+            checkpoint_dir=checkpoint_dir,
+        )
+        data = ps.parameter_sweep(m, sweep_params, outputs=outputs, resume=True)
+        assert np.allclose(data, reference_data, equal_nan=True)
+
+        # Simulate a sweep that was interrupted after its first checkpoint write
+        ps.comm.Barrier()
+        if ps.rank == 0:
+            for k in range(ps.num_procs):
+                with h5py.File(
+                    os.path.join(checkpoint_dir, f"checkpoint_{k:03}.h5"), "a"
+                ) as f:
+                    for key in ("case_index", "solve_successful", "values"):
+                        f[key].resize(min(2, f[key].shape[0]), axis=0)
+        ps.comm.Barrier()
+
+        ps = ParameterSweep(
+            comm=comm,
+            optimize_function=_analytic_optimization,
+            checkpoint_dir=checkpoint_dir,
+            scheduler="dynamic",
+        )
+        data = ps.parameter_sweep(m, sweep_params, outputs=outputs, resume=True)
+        assert np.allclose(data, reference_data, equal_nan=True)
+
+        # A checkpoint can only be resumed by the sweep that wrote it
+        sweep_params = {A.name: (A, 0.2, 0.9, 3), B.name: (B, 0.0, 0.5, 3)}
+        with pytest.raises(ValueError, match="do not match the sweep"):
+            ps.parameter_sweep(m, sweep_params, outputs=outputs, resume=True)
+
+    @pytest.mark.component
+    def test_parameter_sweep_h5_streaming(self, model, tmp_path):
+        comm = MPI.COMM_WORLD
+
+        tmp_path = _get_rank0_path(comm, tmp_path)
+        results_fname = os.path.join(tmp_path, "global_results_streaming")
+        h5_results_file_name = str(results_fname) + ".h5"
+
+        ps = ParameterSweep(
+            comm=comm,
+            optimize_function=_analytic_optimization,
+            h5_results_file_name=h5_results_file_name,
+            h5_streaming=True,
+            h5_streaming_interval=2,
+        )
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.9, 3), B.name: (B, 0.0, 0.5, 3)}
+        outputs = {
+            "output_c": m.fs.output["c"],
+            "output_d": m.fs.output["d"],
+            "performance": m.fs.performance,
+        }
+
+        ps.parameter_sweep(m, sweep_params, outputs=outputs)
+
+        if ps.rank == 0:
+            read_dict = _read_output_h5(h5_results_file_name)
+
+            # Stitch the per-rank files back together in case order
+            case_index = []
+            solve_successful = []
+            values = {"sweep_params": {}, "outputs": {}}
+            for k in range(ps.num_procs):
+                fname = f"{results_fname}_rank{k:03}.h5"
+                with h5py.File(fname, "r") as f:
+                    case_index.extend(f["case_index"][()])
+                    solve_successful.extend(f["solve_successful/solve_successful"][()])
+                    for key in values:
+                        for subkey in f[key]:
+                            values[key].setdefault(subkey, []).extend(
+                                f[key][subkey]["value"][()]
+                            )
+                            assert set(f[key][subkey]) == set(read_dict[key][subkey])
+
+            sorting = np.argsort(case_index)
+            assert list(np.array(solve_successful)[sorting]) == list(
+                read_dict["solve_successful"]
+            )
+            for key, item in values.items():
+                assert item.keys() == read_dict[key].keys()
+                for subkey, subitem in item.items():
+                    assert np.allclose(
+                        np.array(subitem)[sorting],
+                        read_dict[key][subkey]["value"],
+                        equal_nan=True,
+                    )
+
+    @pytest.mark.unit
+    def test_h5_streaming_requires_h5_file(self):
+        with pytest.raises(ValueError, match="requires an h5_results_file_name"):
+            ParameterSweep(h5_streaming=True)
+
+    @pytest.mark.component
+    @pytest.mark.parametrize("scheduler", ["static", "dynamic"])
+    def test_parameter_sweep_h5_parallel(self, model, tmp_path, scheduler):
+        comm = MPI.COMM_WORLD
+
+        tmp_path = _get_rank0_path(comm, tmp_path)
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.9, 3), B.name: (B, 0.0, 0.5, 4)}
+        outputs = {
+            "output_c": m.fs.output["c"],
+            "output_d": m.fs.output["d"],
+            "performance": m.fs.performance,
+        }
+
+        h5_results_file_names = {}
+        for h5_parallel in (False, True):
+            h5_results_file_names[h5_parallel] = os.path.join(
+                tmp_path, f"global_results_{scheduler}_{h5_parallel}.h5"
+            )
+            ps = ParameterSweep(
+                comm=comm,
+                optimize_function=_analytic_optimization,
+                h5_results_file_name=h5_results_file_names[h5_parallel],
+                h5_parallel=h5_parallel,
+                scheduler=scheduler,
+                dynamic_chunk_size=2,
+            )
+            ps.parameter_sweep(m, sweep_params, outputs=outputs)
+
+        if ps.rank == 0:
+            truth_dict = _read_output_h5(h5_results_file_names[False])
+            read_dict = _read_output_h5(h5_results_file_names[True])
+
+            assert read_dict.keys() == truth_dict.keys()
+            for key, item in truth_dict.items():
+                if key != "solve_successful":
+                    assert read_dict[key].keys() == item.keys()
+            _assert_dictionary_correctness(truth_dict, read_dict)
+
+            assert os.path.isfile(h5_results_file_names[True] + ".txt")
+
+            # Without parallel h5py, the results file is a view of per-rank files
+            part_files = glob.glob(
+                os.path.join(tmp_path, f"global_results_{scheduler}_True_part*.h5")
+            )
+            if ps.num_procs == 1 or h5py.get_config().mpi:
+                assert len(part_files) == 0
+            else:
+                assert len(part_files) == ps.num_procs
+
+    @pytest.mark.component
+    @pytest.mark.parametrize("h5_mode", ["serial", "parallel", "streaming"])
+    def test_parameter_sweep_h5_storage(self, model, tmp_path, h5_mode):
+        comm = MPI.COMM_WORLD
+
+        tmp_path = _get_rank0_path(comm, tmp_path)
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        # Every case is feasible
+        sweep_params = {A.name: (A, 0.1, 0.4, 3), B.name: (B, 0.0, 0.3, 4)}
+
+        h5_results_file_names = {}
+        for storage in ("default", "reduced"):
+            h5_results_file_names[storage] = os.path.join(
+                tmp_path, f"global_results_{h5_mode}_{storage}.h5"
+            )
+            options = {}
+            if storage == "reduced":
+                options = dict(
+                    h5_dtype="float32",
+                    h5_compression="lzf",
+                    h5_store_constant_once=True,
+                    h5_output_storage={"fs.performance": {"dtype": "float64"}},
+                )
+            ps = ParameterSweep(
+                comm=comm,
+                optimize_function=_analytic_optimization,
+                h5_results_file_name=h5_results_file_names[storage],
+                h5_parallel=h5_mode == "parallel",
+                h5_streaming=h5_mode == "streaming",
+                **options,
+            )
+            # All of the variables, including the fixed slacks
+            ps.parameter_sweep(m, sweep_params, outputs=None)
+
+        if ps.rank == 0:
+            truth_dict = _read_output_h5(h5_results_file_names["default"])
+            read_dict = _read_output_h5(h5_results_file_names["reduced"])
+
+            assert read_dict.keys() == truth_dict.keys()
+            assert read_dict["solve_successful"] == truth_dict["solve_successful"]
+            for key in ("sweep_params", "outputs"):
+                assert read_dict[key].keys() == truth_dict[key].keys()
+                for subkey, subitem in truth_dict[key].items():
+                    assert np.allclose(
+                        read_dict[key][subkey]["value"],
+                        subitem["value"],
+                        rtol=1e-6,
+                        equal_nan=True,
+                    )
+
+            with h5py.File(h5_results_file_names["reduced"], "r") as f:
+                assert f["outputs/fs.performance/value"].dtype == np.float64
+                assert f["outputs/fs.output[c]/value"].dtype == np.float32
+                slack = f["outputs/fs.slack[ab_slack]/value"]
+                if h5_mode != "parallel":
+                    assert slack.compression == "lzf"
+                    # The slack is fixed at zero, so it is stored once
+                    assert slack.id.get_storage_size() == 0
+
+            if h5_mode == "streaming":
+                with h5py.File(
+                    h5_results_file_names["reduced"][:-3] + "_rank000.h5", "r"
+                ) as f:
+                    assert f["outputs/fs.output[c]/value"].dtype == np.float32
+                    assert f["outputs/fs.output[c]/value"].compression == "lzf"
+
+    @pytest.mark.component
+    def test_parameter_sweep_npy_results(self, model, tmp_path):
+        comm = MPI.COMM_WORLD
+
+        tmp_path = _get_rank0_path(comm, tmp_path)
+        csv_results_file_name = os.path.join(tmp_path, "global_results_npy.csv")
+        npy_results_dir = os.path.join(tmp_path, "global_results_npy")
+
+        ps = ParameterSweep(
+            comm=comm,
+            optimize_function=_analytic_optimization,
+            csv_results_file_name=csv_results_file_name,
+            npy_results_dir=npy_results_dir,
+            solver_telemetry=True,
+        )
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.9, 3), B.name: (B, 0.0, 0.5, 3)}
+        outputs = {
+            "output_c": m.fs.output["c"],
+            "output_d": m.fs.output["d"],
+            "performance": m.fs.performance,
+        }
+
+        global_save_data = ps.parameter_sweep(m, sweep_params, outputs=outputs)
+
+        if ps.rank == 0:
+            values, metadata = load_npy_results(npy_results_dir)
+
+            # The same columns as the CSV file, at full precision
+            csv_header = _build_header_list_from_csv(csv_results_file_name)
+            assert list(values)[:-1] == csv_header
+            for k, name in enumerate(csv_header):
+                assert isinstance(values[name], np.memmap)
+                assert np.array_equal(
+                    values[name], global_save_data[:, k], equal_nan=True
+                )
+
+            assert values["solve_successful"].dtype == bool
+            assert list(values["solve_successful"]) == list(
+                np.isfinite(global_save_data[:, 2])
+            )
+
+            assert metadata[A.name]["group"] == "sweep_params"
+            assert metadata["output_c"]["group"] == "outputs"
+            assert metadata["output_c"]["lower bound"] == 0
+            assert metadata["output_c"]["upper bound"] == 1
+            assert metadata["wall_time"]["group"] == "solver_stats"
+            assert metadata["wall_time"]["units"] == "s"
+
+            # Only the requested columns are loaded
+            values, metadata = load_npy_results(
+                npy_results_dir, columns=["performance"], mmap_mode=None
+            )
+            assert list(values) == list(metadata) == ["performance"]
+            assert not isinstance(values["performance"], np.memmap)
+
+            with pytest.raises(KeyError, match="no column missing"):
+                load_npy_results(npy_results_dir, columns=["missing"])
+
+    @pytest.mark.component
+    def test_parameter_sweep_surrogate(self, model, tmp_path):
+        comm = MPI.COMM_WORLD
+
+        tmp_path = _get_rank0_path(comm, tmp_path)
+        surrogate_file_name = os.path.join(tmp_path, "surrogate", "lcow.npz")
+
+        ps = ParameterSweep(
+            comm=comm,
+            optimize_function=_analytic_optimization,
+            surrogate_file_name=surrogate_file_name,
+            surrogate_outputs=["output_c", "performance"],
+            surrogate_options={"degree": 1, "seed": 0},
+        )
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.9, 4), B.name: (B, 0.0, 0.5, 4)}
+        outputs = {
+            "output_c": m.fs.output["c"],
+            "output_d": m.fs.output["d"],
+            "performance": m.fs.performance,
+        }
+
+        ps.parameter_sweep(m, sweep_params, outputs=outputs)
+
+        if ps.rank == 0:
+            surrogate = ParameterSweepSurrogate.load(surrogate_file_name)
+
+            assert surrogate.input_names == [A.name, B.name]
+            assert surrogate.output_names == ["output_c", "performance"]
+            assert surrogate.validation_error["output_c"]["rmse"] == pytest.approx(
+                0, abs=1e-8
+            )
+
+            # The outputs are linear in the parameters where the cases are
+            # feasible, including where the case with a = 0.9 failed
+            points = np.array([[0.2, 0.1], [0.45, 0.3], [0.9, 0.2]])
+            expected = np.column_stack(
+                (2 * points[:, 0], 2 * points[:, 0] + 3 * points[:, 1])
+            )
+            assert surrogate.predict(points) == pytest.approx(expected)
+
+    @pytest.mark.component
+    def test_parameter_sweep_surrogate_error(self, model, tmp_path):
+        comm = MPI.COMM_WORLD
+
+        tmp_path = _get_rank0_path(comm, tmp_path)
+        h5_results_file_name = os.path.join(tmp_path, "global_results.h5")
+
+        ps = ParameterSweep(
+            comm=comm,
+            optimize_function=_analytic_optimization,
+            h5_results_file_name=h5_results_file_name,
+            h5_parallel=comm.Get_size() == 1,
+            surrogate_file_name=os.path.join(tmp_path, "surrogate.npz"),
+            surrogate_outputs=["missing"],
+        )
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+        m.fs.input["b"].fix(0.1)
+
+        A = m.fs.input["a"]
+        sweep_params = {A.name: (A, 0.1, 0.4, 4)}
+        outputs = {"output_c": m.fs.output["c"]}
+
+        # Every rank raises once the results are written, rather than waiting
+        # for rank 0
+        with pytest.raises((KeyError, RuntimeError)):
+            ps.parameter_sweep(m, sweep_params, outputs=outputs)
+
+        if ps.rank == 0:
+            read_dict = _read_output_h5(h5_results_file_name)
+            assert np.allclose(
+                read_dict["outputs"]["output_c"]["value"], 2 * np.linspace(0.1, 0.4, 4)
+            )
+
+    @pytest.mark.component
+    @pytest.mark.parametrize("scheduler", ["static", "dynamic"])
+    def test_parameter_sweep_progress(self, model, tmp_path, scheduler):
+        comm = MPI.COMM_WORLD
+
+        tmp_path = _get_rank0_path(comm, tmp_path)
+        progress_dir = os.path.join(tmp_path, f"progress_{scheduler}")
+
+        ps = ParameterSweep(
+            comm=comm,
+            optimize_function=_analytic_optimization,
+            scheduler=scheduler,
+            progress_dir=progress_dir,
+            progress_interval=1e-6,
+        )
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.9, 3), B.name: (B, 0.0, 0.5, 3)}
+
+        global_save_data = ps.parameter_sweep(
+            m, sweep_params, outputs={"output_c": m.fs.output["c"]}
+        )
+
+        with open(os.path.join(progress_dir, f"progress_{ps.rank:03}.json")) as f:
+            status = json.load(f)
+        assert status["rank"] == ps.rank
+        assert status["finished"]
+        assert status["cases_completed"] == status["num_cases"]
+        assert status["cases_solved"] == status["cases_completed"]
+        assert status["eta"] == 0
+        if status["cases_completed"] > 0:
+            assert status["mean_solve_time"] > 0
+            assert status["p95_solve_time"] >= status["mean_solve_time"] * 0.5
+
+        if ps.rank == 0:
+            with open(os.path.join(progress_dir, "progress.json")) as f:
+                summary = json.load(f)
+
+            num_successful = int(np.sum(np.isfinite(global_save_data[:, 2])))
+            assert summary["num_cases"] == 9
+            assert summary["num_ranks"] == ps.num_procs
+            assert summary["ranks_reporting"] == ps.num_procs
+            assert summary["cases_completed"] == 9
+            assert summary["cases_successful"] == num_successful
+            assert summary["success_rate"] == pytest.approx(num_successful / 9)
+            assert summary["mean_solve_time"] > 0
+            assert summary["eta"] == 0
+            assert summary["finished"]
+            assert [item["rank"] for item in summary["ranks"]] == list(
+                range(ps.num_procs)
+            )
+
+    @pytest.mark.unit
+    def test_sweep_progress(self, tmp_path):
+        progress_dir = str(tmp_path)
+
+        # Rank 1 has solved 2 of its 4 cases, at 1 case per second
+        rank1 = _SweepProgress(progress_dir, 1, 2, 10, interval=1e6)
+        rank1.add_cases(4)
+        rank1.case_done(True, 0.5)
+        rank1.case_done(False, 1.5)
+        rank1._start -= 2.0
+        rank1.write()
+
+        status = rank1.status()
+        assert status["cases_completed"] == 2
+        assert status["success_rate"] == 0.5
+        assert status["mean_solve_time"] == pytest.approx(1.0)
+        assert status["p95_solve_time"] == pytest.approx(1.45)
+        assert status["cases_per_second"] == pytest.approx(1.0, rel=1e-2)
+        assert status["eta"] == pytest.approx(2.0, rel=1e-2)
+
+        # Rank 0 restored one case and solved one, without writing its status
+        # again within the interval
+        rank0 = _SweepProgress(progress_dir, 0, 2, 10, interval=1e6)
+        rank0.add_cases(4)
+        rank0.case_done(True)
+        rank0._start -= 1.0
+        rank0.case_done(True, 2.0)
+
+        with open(os.path.join(progress_dir, "progress_000.json")) as f:
+            assert json.load(f)["cases_completed"] == 1
+
+        rank0.write()
+        with open(os.path.join(progress_dir, "progress.json")) as f:
+            summary = json.load(f)
+
+        assert summary["ranks_reporting"] == 2
+        assert summary["cases_completed"] == 4
+        assert summary["cases_successful"] == 3
+        assert summary["mean_solve_time"] == pytest.approx(4.0 / 3.0)
+        assert summary["p95_solve_time"] == pytest.approx(2.0)
+        assert summary["cases_per_second"] == pytest.approx(2.0, rel=1e-2)
+        # The 6 cases left take 3 s at the combined rate
+        assert summary["eta"] == pytest.approx(3.0, rel=1e-2)
+        assert not summary["finished"]
+
+    @pytest.mark.unit
+    def test_progress_not_supported(self):
+        ps = ParameterSweep(
+            progress_dir="progress",
+            parallel_back_end="multiprocessing",
+            build_model=_build_model,
+        )
+        m = _build_model()
+        with pytest.raises(ValueError, match="not supported with the multiprocessing"):
+            ps.parameter_sweep(
+                m, {"a": LinearSample(m.fs.input["a"], 0.1, 0.9, 3)}, outputs=None
+            )
+
+    @pytest.mark.unit
+    def test_h5_parallel_requires_h5_file(self):
+        with pytest.raises(ValueError, match="requires an h5_results_file_name"):
+            ParameterSweep(h5_parallel=True)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("warm_start", ["previous", "nearest"])
+    def test_parameter_sweep_nearest_warm_start(self, model, warm_start):
+        # Record the value of output d each solve starts from
+        starting_points = {}
+
+        def _recording_optimization(m):
+            case = (value(m.fs.input["a"]), value(m.fs.input["b"]))
+            starting_points[case] = value(m.fs.output["d"])
+            return _analytic_optimization(m)
+
+        ps = ParameterSweep(
+            comm=DummyCOMM,
+            optimize_function=_recording_optimization,
+            warm_start=warm_start,
+        )
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.3, 3), B.name: (B, 0.0, 0.2, 2)}
+        outputs = {"output_d": m.fs.output["d"]}
+
+        ps.parameter_sweep(m, sweep_params, outputs=outputs)
+
+        # The case (0.2, 0.0) follows (0.1, 0.2) but is closest to (0.1, 0.0)
+        if warm_start == "nearest":
+            assert starting_points[(0.2, 0.0)] == pytest.approx(0.0)
+        else:
+            assert starting_points[(0.2, 0.0)] == pytest.approx(0.6)
+
+    @pytest.mark.unit
+    def test_parameter_sweep_predictor_warm_start(self, model):
+        # Record the value of output c each solve starts from
+        starting_points = []
+
+        def _recording_optimization(m):
+            starting_points.append(value(m.fs.output["c"]))
+            return _analytic_optimization(m)
+
+        ps = ParameterSweep(
+            comm=DummyCOMM,
+            optimize_function=_recording_optimization,
+            warm_start="predictor",
+        )
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+        m.fs.input["b"].fix(0.1)
+        m.fs.output["c"].set_value(0.5)
+
+        A = m.fs.input["a"]
+        sweep_params = {A.name: (A, 0.1, 0.4, 4)}
+        outputs = {"output_c": m.fs.output["c"]}
+
+        results = ps.parameter_sweep(m, sweep_params, outputs=outputs)
+
+        # From the initial point, the previous case, then along the secant
+        assert starting_points == pytest.approx([0.5, 0.2, 0.6, 0.8])
+        assert results[:, 1] == pytest.approx([0.2, 0.4, 0.6, 0.8])
+
+    @pytest.mark.component
+    def test_parameter_sweep_output_patterns(self, model):
+        ps = ParameterSweep(optimize_function=_analytic_optimization)
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.3, 3), B.name: (B, 0.0, 0.2, 2)}
+
+        global_save_data = ps.parameter_sweep(
+            m,
+            sweep_params,
+            outputs={"performance": "fs.perf*", "outputs": "fs.output[*]"},
+        )
+
+        if ps.rank == 0:
+            # The performance, then c and d
+            assert global_save_data[:, 2] == pytest.approx(
+                2 * global_save_data[:, 0] + 3 * global_save_data[:, 1]
+            )
+            assert global_save_data[:, 3] == pytest.approx(2 * global_save_data[:, 0])
+            assert global_save_data[:, 4] == pytest.approx(3 * global_save_data[:, 1])
+
+    @pytest.mark.unit
+    def test_output_extractor(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(
+            [1, 2, 3], initialize={1: 1.5, 2: -2.0, 3: 0.3}, units=pyo.units.m
+        )
+        m.p = pyo.Param(mutable=True, initialize=2.0)
+        m.e1 = pyo.Expression(
+            expr=pyo.exp(m.x[1]) * m.p + pyo.log(m.x[3]) - abs(m.x[2])
+        )
+        m.e2 = pyo.Expression(
+            expr=m.e1**2 / m.x[1] + pyo.units.convert(m.x[1], to_units=pyo.units.km)
+        )
+        m.e3 = pyo.Expression(
+            expr=pyo.Expr_if(IF=m.x[1] <= m.x[3], THEN=m.e1, ELSE=-m.e2)
+        )
+        m.e4 = pyo.Expression(
+            expr=pyo.Expr_if(
+                IF=pyo.inequality(0, m.x[3], 1, strict=True), THEN=3, ELSE=m.x[2]
+            )
+        )
+        m.e5 = pyo.Expression(expr=sum(i * m.x[i] for i in m.x) + 5)
+        m.o = pyo.Objective(expr=m.e5 + m.e2)
+        m.f = pyo.ExternalFunction(lambda a: 2 * a)
+
+        components = list(
+            m.component_data_objects((pyo.Var, pyo.Expression, pyo.Objective))
+        ) + [3 * m.x[1], m.p, m.f(m.x[1])]
+        extractor = _OutputExtractor(components)
+
+        # Only the external function is left to pyo.value
+        assert extractor._uncompiled == [len(components) - 1]
+        # The named expressions are compiled once
+        assert len(extractor._named_names) == 6
+
+        row = np.zeros(len(components))
+        for x3 in (0.3, 2.0):
+            m.x[3].set_value(x3)
+            m.p.set_value(x3 + 1)
+            extractor.evaluate(row)
+            assert list(row) == [pyo.value(c) for c in components]
+
+        # Errors are reported as by pyo.value
+        m.x[3].set_value(-1)
+        with pytest.raises(ValueError, match="math domain error"):
+            extractor.evaluate(row)
+        m.x[3].set_value(None)
+        with pytest.raises(ValueError, match="No value for uninitialized"):
+            extractor.evaluate(row)
+
+    @pytest.mark.unit
+    def test_parameter_sweep_space_filling_order(self, model):
+        solve_order = []
+
+        def _recording_optimization(m):
+            solve_order.append(
+                (round(value(m.fs.input["a"]), 6), round(value(m.fs.input["b"]), 6))
+            )
+            return _analytic_optimization(m)
+
+        ps = ParameterSweep(
+            comm=DummyCOMM,
+            optimize_function=_recording_optimization,
+            space_filling_order=True,
+        )
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.0, 0.3, 4), B.name: (B, 0.0, 0.3, 4)}
+        outputs = {"output_c": m.fs.output["c"], "output_d": m.fs.output["d"]}
+
+        data = ps.parameter_sweep(m, sweep_params, outputs=outputs)
+
+        # The first quadrant of the grid is finished before moving on
+        assert set(solve_order[:4]) == {
+            (0.0, 0.0),
+            (0.0, 0.1),
+            (0.1, 0.0),
+            (0.1, 0.1),
+        }
+        assert len(set(solve_order)) == 16
+
+        # The results are still returned in the original case order
+        assert np.allclose(data[:, 2], 2 * data[:, 0])
+        assert np.allclose(data[:, 3], 3 * data[:, 1])
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("use_LHS", [False, True])
+    def test_parameter_sweep_rank_local_sampling(self, model, monkeypatch, use_LHS):
+        # Use small blocks so that the cases span several random streams
+        monkeypatch.setattr(_RankLocalSampler, "block_size", 4)
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        if use_LHS:
+            sweep_params = {
+                A.name: LatinHypercubeSample(A, 0.0, 0.5),
+                B.name: LatinHypercubeSample(B, 0.0, 0.3),
+            }
+        else:
+            sweep_params = {
+                A.name: UniformSample(A, 0.0, 0.5),
+                B.name: UniformSample(B, 0.0, 0.3),
+            }
+        outputs = {"output_c": m.fs.output["c"], "output_d": m.fs.output["d"]}
+
+        num_samples = 10
+        data = []
+        for comm, scheduler in (
+            (MPI.COMM_WORLD, "static"),
+            (MPI.COMM_WORLD, "dynamic"),
+            (DummyCOMM, "static"),
+        ):
+            ps = ParameterSweep(
+                comm=comm,
+                optimize_function=_analytic_optimization,
+                rank_local_sampling=True,
+                scheduler=scheduler,
+                dynamic_chunk_size=3,
+            )
+            data.append(
+                ps.parameter_sweep(
+                    m, sweep_params, outputs=outputs, num_samples=num_samples, seed=1
+                )
+            )
+
+        # The samples do not depend on the number of ranks or on which rank
+        # solves which cases
+        assert np.array_equal(data[0], data[2])
+        assert np.array_equal(data[1], data[2])
+
+        # Any subset of the cases, in any order, gets the same values
+        sampler = ps._rank_local_sampler
+        case_indices = np.array([9, 2, 5, 4, 0, 8])
+        assert np.array_equal(sampler.sample(case_indices), data[2][case_indices, :2])
+
+        values = data[2]
+        assert np.shape(values) == (num_samples, 4)
+        assert np.all((values[:, 0] >= 0.0) & (values[:, 0] <= 0.5))
+        assert np.all((values[:, 1] >= 0.0) & (values[:, 1] <= 0.3))
+        assert np.allclose(values[:, 2], 2 * values[:, 0])
+        assert np.allclose(values[:, 3], 3 * values[:, 1])
+
+        if use_LHS:
+            # Each of the strata of each parameter holds exactly one sample
+            for j, ub in enumerate([0.5, 0.3]):
+                strata = np.floor(values[:, j] / ub * num_samples)
+                assert sorted(strata) == list(range(num_samples))
+
+        # The same seed reproduces the same samples
+        ps = ParameterSweep(
+            comm=DummyCOMM,
+            optimize_function=_analytic_optimization,
+            rank_local_sampling=True,
+        )
+        repeat = ps.parameter_sweep(
+            m, sweep_params, outputs=outputs, num_samples=num_samples, seed=1
+        )
+        assert np.array_equal(repeat, values)
+
+    @pytest.mark.unit
+    def test_parameter_sweep_solver_telemetry(self, model, tmp_path):
+        comm = MPI.COMM_WORLD
+
+        tmp_path = _get_rank0_path(comm, tmp_path)
+        results_fname = os.path.join(tmp_path, "global_results_telemetry")
+        csv_results_file_name = str(results_fname) + ".csv"
+        h5_results_file_name = str(results_fname) + ".h5"
+
+        tee_values = []
+
+        def _recording_optimization(m, tee=False):
+            tee_values.append(tee)
+            return _analytic_optimization(m)
+
+        ps = ParameterSweep(
+            comm=comm,
+            optimize_function=_recording_optimization,
+            reinitialize_function=_reinitialize,
+            csv_results_file_name=csv_results_file_name,
+            h5_results_file_name=h5_results_file_name,
+            interpolate_nan_outputs=True,
+            interpolation_method="idw",
+            solver_telemetry=True,
+        )
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.9, 3), B.name: (B, 0.0, 0.5, 3)}
+        outputs = {"output_c": m.fs.output["c"], "output_d": m.fs.output["d"]}
+
+        data = ps.parameter_sweep(m, sweep_params, outputs=outputs)
+
+        # The solver statistics follow the outputs
+        assert np.shape(data) == (9, 2 + 2 + 6)
+        solved = np.array([True, True, False, True, True, False, False, False, False])
+        wall_time, optimize_time, reinitialize_time = data[:, 4], data[:, 5], data[:, 6]
+        iterations, termination_condition, reinitialized = (
+            data[:, 7],
+            data[:, 8],
+            data[:, 9],
+        )
+
+        assert np.all(wall_time >= optimize_time + reinitialize_time)
+        assert np.all(optimize_time > 0.0)
+
+        # The solver log is requested, but there is no solver to print one
+        assert all(tee_values)
+        assert np.all(np.isnan(iterations))
+
+        optimal = list(TerminationCondition).index(TerminationCondition.optimal)
+        infeasible = list(TerminationCondition).index(TerminationCondition.infeasible)
+        assert np.all(termination_condition[solved] == optimal)
+        assert np.all(termination_condition[~solved] == infeasible)
+
+        # Only the failed cases fall back on the reinitialize_function
+        assert np.all(reinitialized == ~solved)
+        assert np.all(reinitialize_time[solved] == 0.0)
+
+        if ps.rank == 0:
+            read_dict = _read_output_h5(h5_results_file_name)
+            assert set(read_dict["solver_stats"]) == {
+                "wall_time",
+                "optimize_time",
+                "reinitialize_time",
+                "iterations",
+                "termination_condition",
+                "reinitialized",
+            }
+            assert np.allclose(
+                read_dict["solver_stats"]["reinitialized"]["value"], ~solved
+            )
+
+            csv_header = _build_header_list_from_csv(csv_results_file_name)
+            assert csv_header[-6:] == [
+                "wall_time",
+                "optimize_time",
+                "reinitialize_time",
+                "iterations",
+                "termination_condition",
+                "reinitialized",
+            ]
+
+            # Only the outputs of the failed cases are interpolated, their
+            # solver statistics are kept as they were measured
+            interp_data = np.genfromtxt(
+                os.path.join(tmp_path, "interpolated_global_results_telemetry.csv"),
+                skip_header=1,
+                delimiter=",",
+            )
+            assert np.allclose(interp_data[:, 4:], data[:, 4:], equal_nan=True)
+            assert np.allclose(interp_data[solved, 2:4], data[solved, 2:4])
+            assert np.all(np.isfinite(interp_data[:, 2:4]))
+
+    @pytest.mark.component
+    @pytest.mark.skipif(
+        not pyo.SolverFactory("ipopt").available(exception_flag=False),
+        reason="Ipopt is not available",
+    )
+    def test_parameter_sweep_solver_telemetry_iterations(self, model):
+        # The default optimize_function prints the Ipopt log for the telemetry
+        ps = ParameterSweep(comm=DummyCOMM, solver_telemetry=True)
+
+        A = model.fs.input["a"]
+        B = model.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.3, 2), B.name: (B, 0.1, 0.2, 2)}
+        outputs = {"output_c": model.fs.output["c"]}
+
+        data = ps.parameter_sweep(model, sweep_params, outputs=outputs)
+
+        iterations = data[:, 6]
+        assert np.all(np.isfinite(iterations))
+        assert np.all(iterations >= 1)
+        assert np.all(iterations == np.round(iterations))
+
+    @pytest.mark.unit
+    def test_parameter_sweep_case_timeout(self, model):
+        reinitialized = []
+
+        def _hanging_optimization(m):
+            # Stands in for a solver that never returns on this case
+            if value(m.fs.input["a"]) == pytest.approx(0.5):
+                time.sleep(60)
+            return _analytic_optimization(m)
+
+        def _recording_reinitialize(m):
+            reinitialized.append(value(m.fs.input["a"]))
+
+        ps = ParameterSweep(
+            comm=DummyCOMM,
+            optimize_function=_hanging_optimization,
+            reinitialize_function=_recording_reinitialize,
+            case_timeout=0.2,
+            solver_telemetry=True,
+        )
+
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.9, 3), B.name: (B, 0.0, 0.25, 2)}
+        outputs = {"output_c": m.fs.output["c"]}
+
+        start = time.perf_counter()
+        data = ps.parameter_sweep(m, sweep_params, outputs=outputs)
+        assert time.perf_counter() - start < 10.0
+
+        # The timed out cases fail and are flagged in the last column
+        timed_out = np.array([False, False, True, True, False, False])
+        assert np.all(np.isnan(data[timed_out, 2]))
+        assert np.allclose(data[:2, 2], [0.2, 0.2])
+        assert np.all(data[:, -1] == timed_out)
+
+        wall_time = data[:, 3]
+        assert np.all(wall_time[timed_out] == pytest.approx(0.2, abs=0.1))
+
+        termination_condition = data[:, 7]
+        max_time = list(TerminationCondition).index(TerminationCondition.maxTimeLimit)
+        assert np.all(termination_condition[timed_out] == max_time)
+
+        # A timeout does not fall back on the reinitialize_function
+        assert 0.5 not in reinitialized
 
     @pytest.mark.unit
-    def test_create_global_output(self, model):
-        ps = ParameterSweep()
+    @pytest.mark.skipif(
+        not _CaseTimer.is_supported(), reason="SIGALRM timers are not available"
+    )
+    def test_case_timer(self):
+        with _CaseTimer(0.05) as timer:
+            time.sleep(1.0)
+        assert timer.expired
+
+        # An alarm after the case finished is ignored
+        with _CaseTimer(0.05) as timer:
+            timer.finish()
+            time.sleep(0.2)
+        assert not timer.expired
+
+        # The timer is cancelled when the case ends
+        with _CaseTimer(0.05) as timer:
+            pass
+        time.sleep(0.2)
+        assert not timer.expired
+
+    @pytest.mark.component
+    def test_parameter_sweep_multiprocessing_telemetry_timeout(self):
+        ps = ParameterSweep(
+            comm=DummyCOMM,
+            optimize_function=_hanging_optimization,
+            parallel_back_end="multiprocessing",
+            number_of_subprocesses=2,
+            build_model=_build_model,
+            case_timeout=0.5,
+            solver_telemetry=True,
+        )
+
+        m = _build_model()
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {A.name: (A, 0.1, 0.9, 3), B.name: (B, 0.0, 0.25, 2)}
+        outputs = {"output_c": m.fs.output["c"]}
+
+        data = ps.parameter_sweep(m, sweep_params, outputs=outputs)
+
+        # The solver statistics and the timeout flag follow the outputs
+        assert np.shape(data) == (6, 2 + 1 + 6 + 1)
+        timed_out = np.array([False, False, True, True, False, False])
+        assert np.allclose(data[:2, 2], [0.2, 0.2])
+        assert np.all(np.isnan(data[2:, 2]))
+        assert np.all(data[:, -1] == timed_out)
+
+        termination_condition = data[:, 7]
+        max_time = list(TerminationCondition).index(TerminationCondition.maxTimeLimit)
+        assert np.all(termination_condition[timed_out] == max_time)
+        assert np.all(data[:, 3] > 0.0)
+
+    @pytest.mark.unit
+    def test_parameter_sweep_case_cache(self, model, tmp_path):
+        comm = MPI.COMM_WORLD
+        tmp_path = _get_rank0_path(comm, tmp_path)
+        case_cache_dir = os.path.join(tmp_path, "case_cache")
+
+        solved = []
+
+        def _counting_optimization(m, scale=1.0):
+            solved.append((value(m.fs.input["a"]), value(m.fs.input["b"])))
+            return _analytic_optimization(m)
 
         m = model
         m.fs.slack_penalty = 1000.0
         m.fs.slack.setub(0)
 
-        sweep_params = {
-            "input_a": NormalSample(m.fs.input["a"], 0.1, 0.9),
-            "input_b": NormalSample(m.fs.input["b"], 0.0, 0.5),
-        }
-        outputs = {
-            "output_c": m.fs.output["c"],
-            "output_d": m.fs.output["d"],
-            "performance": m.fs.performance,
-        }
-
-        sweep_params, sampling_type = ps._process_sweep_params(sweep_params)
-        # Get the globale sweep param values
-        global_num_cases = 2 * ps.num_procs
-        global_values = ps._build_combinations(
-            sweep_params, sampling_type, global_num_cases
-        )
-        # divide the workload between processors
-        local_values = ps._divide_combinations(global_values)
-        local_num_cases = np.shape(local_values)[0]
-
-        local_output_dict = ps._create_local_output_skeleton(
-            model, sweep_params, None, local_num_cases
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        outputs = {"output_c": m.fs.output["c"], "output_d": m.fs.output["d"]}
+
+        def _run(sweep_params, outputs, **options):
+            solved.clear()
+            ps = ParameterSweep(
+                comm=comm,
+                optimize_function=_counting_optimization,
+                case_cache_dir=case_cache_dir,
+                **options,
+            )
+            data = ps.parameter_sweep(m, sweep_params, outputs=outputs)
+            return data, comm.allreduce(len(solved))
+
+        sweep_params = {A.name: (A, 0.1, 0.5, 2), B.name: (B, 0.0, 0.25, 2)}
+        first, num_solved = _run(sweep_params, outputs)
+        assert num_solved == 4
+
+        # Solved cases are read back, even with more outputs
+        more_outputs = dict(outputs, performance=m.fs.performance)
+        data, num_solved = _run(sweep_params, more_outputs)
+        assert num_solved == 0
+        assert np.allclose(data[:, :4], first)
+        assert np.allclose(data[:, 4], data[:, 2] + data[:, 3])
+
+        # Only the new points of an extended sweep are solved
+        sweep_params = {A.name: (A, 0.1, 0.5, 2), B.name: (B, 0.0, 0.5, 3)}
+        data, num_solved = _run(sweep_params, outputs)
+        assert num_solved == 2
+        assert np.allclose(data[[0, 1, 3, 4], :], first)
+
+        # Other solver options or a changed model miss the cache
+        sweep_params = {A.name: (A, 0.1, 0.5, 2), B.name: (B, 0.0, 0.25, 2)}
+        data, num_solved = _run(sweep_params, outputs, optimize_kwargs={"scale": 2.0})
+        assert num_solved == 4
+
+        m.fs.slack_penalty = 100.0
+        data, num_solved = _run(sweep_params, outputs)
+        assert num_solved == 4
+
+        # Cases rejected by the probe_function are not read from the cache
+        data, num_solved = _run(
+            sweep_params, outputs, probe_function=_bad_test_function
         )
+        assert num_solved == 0
+        assert np.all(np.isnan(data[:, 2:]))
 
-        # Manually update the values in the numpy array
-        for key, value in local_output_dict.items():
-            for subkey, subvalue in value.items():
-                subvalue["value"][:] = ps.rank
+        # The cache is closed after the sweep, also when it fails
+        def _raising_probe(m):
+            raise RuntimeError("The sweep was interrupted")
 
-        # Local output dict also contains the solve_successful. The solve status is
-        # based on the
-        local_output_dict["solve_successful"] = [True] * local_num_cases
+        ps = ParameterSweep(
+            comm=DummyCOMM,
+            optimize_function=_analytic_optimization,
+            probe_function=_raising_probe,
+            case_cache_dir=case_cache_dir,
+        )
+        with pytest.raises(RuntimeError, match="interrupted"):
+            ps.parameter_sweep(m, sweep_params, outputs=outputs)
+        assert ps._case_cache is None
 
-        # Get the global output dictionary, This is properly created only on rank 0
-        global_output_dict = ps._create_global_output(
-            local_output_dict, global_num_cases
+    @pytest.mark.unit
+    def test_adaptive_refinement_points(self):
+        # A 1-D step between 0.6 and 0.7 and a failed solve past 0.9
+        values = np.linspace(0.0, 1.0, 11)[:, np.newaxis]
+        results = np.where(values < 0.65, 0.0, 1.0)
+        solve_successful = values[:, 0] < 0.95
+        results[~solve_successful] = np.nan
+
+        new_points = adaptive_refinement_points(
+            values, results, solve_successful, [0.0], [1.0], 2
         )
 
-        if ps.rank > 0:
-            assert global_output_dict == local_output_dict
-        else:
-            test_array = np.repeat(np.arange(0, ps.num_procs, dtype=float), 2)
-            test_list = [True] * global_num_cases
-            for key, value in global_output_dict.items():
-                if key != "solve_successful":
-                    for subkey, subvalue in value.items():
-                        assert np.allclose(subvalue["value"], test_array)
-                elif key == "solve_successful":
-                    assert list(value) == test_list
-        ps.comm.Barrier()
+        assert np.allclose(np.sort(new_points[:, 0]), [0.65, 0.95])
 
-    @pytest.mark.component
-    def test_parameter_sweep(self, model, tmp_path):
+        # Points that were already solved are not proposed again
+        new_points = adaptive_refinement_points(
+            values, results, solve_successful, [0.0], [1.0], 20
+        )
+        assert len(new_points) == 10
+        assert not np.any(np.isclose(new_points, values.T).any(axis=1))
 
+    @pytest.mark.unit
+    def test_parameter_sweep_adaptive(self, model, tmp_path):
         comm = MPI.COMM_WORLD
 
         tmp_path = _get_rank0_path(comm, tmp_path)
-
-        results_fname = os.path.join(tmp_path, "global_results")
-        csv_results_file_name = str(results_fname) + ".csv"
-        h5_results_file_name = str(results_fname) + ".h5"
+        h5_results_file_name = os.path.join(tmp_path, "global_results_adaptive.h5")
 
         ps = ParameterSweep(
             comm=comm,
-            optimize_function=_optimization,
-            csv_results_file_name=csv_results_file_name,
+            optimize_function=_analytic_optimization,
             h5_results_file_name=h5_results_file_name,
-            debugging_data_dir=tmp_path,
-            interpolate_nan_outputs=True,
+            refinement_rounds=3,
         )
 
         m = model
@@ -547,142 +2107,146 @@ class TestParallelManager:
 
         A = m.fs.input["a"]
         B = m.fs.input["b"]
-        sweep_params = {A.name: (A, 0.1, 0.9, 3), B.name: (B, 0.0, 0.5, 3)}
-        outputs = {
-            "output_c": m.fs.output["c"],
-            "output_d": m.fs.output["d"],
-            "performance": m.fs.performance,
+        sweep_params = {
+            A.name: AdaptiveSample(A, 0.0, 1.0, 3),
+            B.name: AdaptiveSample(B, 0.0, 1.0, 3),
         }
+        outputs = {"output_c": m.fs.output["c"], "output_d": m.fs.output["d"]}
 
-        # Call the parameter_sweep function
-        _ = ps.parameter_sweep(
-            m,
-            sweep_params,
-            outputs=outputs,
+        data = ps.parameter_sweep(m, sweep_params, outputs=outputs, num_samples=8)
+
+        # The initial grid is followed by three rounds of eight points
+        assert np.shape(data) == (9 + 3 * 8, 4)
+        assert len(np.unique(data[:, :2], axis=0)) == len(data)
+
+        solved = (data[:, 0] <= 0.5) & (data[:, 1] <= 1.0 / 3.0)
+        assert np.allclose(data[solved, 2], 2 * data[solved, 0])
+        assert np.all(np.isnan(data[~solved, 2]))
+
+        # The later rounds refine the edge of the feasible region
+        a, b = data[17:, 0], data[17:, 1]
+        distance = np.where(
+            solved[17:],
+            np.minimum(0.5 - a, 1.0 / 3.0 - b),
+            np.hypot(np.maximum(a - 0.5, 0.0), np.maximum(b - 1.0 / 3.0, 0.0)),
         )
+        assert np.all(distance < 0.25)
 
-        # NOTE: rank 0 "owns" tmp_path, so it needs to be
-        #       responsible for doing any output file checking
-        #       tmp_path can be deleted as soon as this method
-        #       returns
         if ps.rank == 0:
-            # Check that the global results file is created
-            assert os.path.isfile(csv_results_file_name)
-            assert os.path.isfile(
-                os.path.join(tmp_path, "interpolated_global_results.csv")
-            )
+            read_dict = _read_output_h5(h5_results_file_name)
+            assert list(read_dict["solve_successful"]) == list(solved)
+            assert np.allclose(read_dict["sweep_params"][A.name]["value"], data[:, 0])
 
-            # Check that all local output files have been created
-            for k in range(ps.num_procs):
-                assert os.path.isfile(
-                    os.path.join(tmp_path, f"local_results_{k:03}.h5")
-                )
-                assert os.path.isfile(
-                    os.path.join(tmp_path, f"local_results_{k:03}.csv")
-                )
+    @pytest.mark.unit
+    def test_parameter_sweep_adaptive_telemetry(self, model, monkeypatch):
+        scored_results = []
+
+        def _recording_refinement_points(values, results, *args, **kwargs):
+            scored_results.append(np.copy(results))
+            return adaptive_refinement_points(values, results, *args, **kwargs)
+
+        # The module is shadowed by the parameter_sweep function in the package
+        monkeypatch.setattr(
+            sys.modules[ParameterSweep.__module__],
+            "adaptive_refinement_points",
+            _recording_refinement_points,
+        )
 
-            # Attempt to read in the data
-            data = np.genfromtxt(csv_results_file_name, skip_header=1, delimiter=",")
+        ps = ParameterSweep(
+            comm=DummyCOMM,
+            optimize_function=_analytic_optimization,
+            refinement_rounds=2,
+            solver_telemetry=True,
+            case_timeout=60.0,
+        )
 
-            # Compare the last row of the imported data to truth
-            truth_data = [0.9, 0.5, np.nan, np.nan, np.nan]
-            assert np.allclose(data[-1], truth_data, equal_nan=True)
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
 
-        # Check for the h5 output
-        if ps.rank == 0:
-            truth_dict = {
-                "outputs": {
-                    "output_c": {
-                        "lower bound": 0,
-                        "units": "None",
-                        "upper bound": 1,
-                        "value": np.array(
-                            [0.2, 0.2, np.nan, 1.0, 1.0, np.nan, np.nan, np.nan, np.nan]
-                        ),
-                    },
-                    "output_d": {
-                        "lower bound": 0,
-                        "units": "None",
-                        "upper bound": 1,
-                        "value": np.array(
-                            [
-                                0.0,
-                                0.75,
-                                np.nan,
-                                0.0,
-                                0.75,
-                                np.nan,
-                                np.nan,
-                                np.nan,
-                                np.nan,
-                            ]
-                        ),
-                    },
-                    "performance": {
-                        "value": np.array(
-                            [
-                                0.2,
-                                0.95,
-                                np.nan,
-                                1.0,
-                                1.75,
-                                np.nan,
-                                np.nan,
-                                np.nan,
-                                np.nan,
-                            ]
-                        )
-                    },
-                },
-                "solve_successful": [
-                    True,
-                    True,
-                    False,
-                    True,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                ],
-                "sweep_params": {
-                    "fs.input[a]": {
-                        "lower bound": 0,
-                        "units": "None",
-                        "upper bound": 1,
-                        "value": np.array(
-                            [0.1, 0.1, 0.1, 0.5, 0.5, 0.5, 0.9, 0.9, 0.9]
-                        ),
-                    },
-                    "fs.input[b]": {
-                        "lower bound": 0,
-                        "units": "None",
-                        "upper bound": 1,
-                        "value": np.array(
-                            [0.0, 0.25, 0.5, 0.0, 0.25, 0.5, 0.0, 0.25, 0.5]
-                        ),
-                    },
-                },
-            }
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {
+            A.name: AdaptiveSample(A, 0.0, 1.0, 3),
+            B.name: AdaptiveSample(B, 0.0, 1.0, 3),
+        }
+        outputs = {"output_c": m.fs.output["c"]}
 
-            read_dict = _read_output_h5(h5_results_file_name)
-            _assert_dictionary_correctness(truth_dict, read_dict)
-            _assert_h5_csv_agreement(csv_results_file_name, read_dict)
+        data = ps.parameter_sweep(m, sweep_params, outputs=outputs, num_samples=8)
+        assert np.shape(data) == (9 + 2 * 8, 2 + 1 + 6 + 1)
 
-            # Check if there is a text file created
-            import ast
+        # Only the outputs steer the refinement, not the solver statistics
+        # and solve status that follow them
+        assert [np.shape(results) for results in scored_results] == [(9, 1), (17, 1)]
+        assert np.array_equal(scored_results[-1][:, 0], data[:17, 2], equal_nan=True)
 
-            truth_txt_dict = {
-                "outputs": ["output_c", "output_d", "performance"],
-                "sweep_params": ["fs.input[a]", "fs.input[b]"],
-            }
+    @pytest.mark.unit
+    @pytest.mark.parametrize("sample_class", [SobolSample, HaltonSample])
+    def test_low_discrepancy_points(self, model, sample_class):
+        A = model.fs.input["a"]
+        B = model.fs.input["b"]
+        samples = [sample_class(A, 0.0, 0.5), sample_class(B, 0.1, 0.3)]
 
-            txt_fpath = h5_results_file_name + ".txt"
-            assert os.path.exists(txt_fpath)
-            f = open(txt_fpath)
-            f_contents = f.read()
-            read_txt_dict = ast.literal_eval(f_contents)
-            assert read_txt_dict == truth_txt_dict
+        points = low_discrepancy_points(samples, 0, 16, seed=7)
+        assert np.shape(points) == (16, 2)
+        assert np.all((points[:, 0] >= 0.0) & (points[:, 0] <= 0.5))
+        assert np.all((points[:, 1] >= 0.1) & (points[:, 1] <= 0.3))
+
+        # Any sub-range of the sequence can be generated on its own
+        assert np.allclose(low_discrepancy_points(samples, 5, 11, seed=7), points[5:11])
+
+        # The scrambling depends on the seed
+        assert not np.allclose(low_discrepancy_points(samples, 0, 16, seed=8), points)
+
+        if sample_class is SobolSample:
+            # Each of 16 equal strata of a parameter holds exactly one point
+            strata = np.floor(points[:, 0] / 0.5 * 16)
+            assert sorted(strata) == list(range(16))
+
+        with pytest.raises(ValueError, match="Cannot mix Sobol and Halton"):
+            low_discrepancy_points([SobolSample(A, 0, 1), HaltonSample(B, 0, 1)], 0, 4)
+
+    @pytest.mark.unit
+    def test_parameter_sweep_low_discrepancy(self, model):
+        m = model
+        m.fs.slack_penalty = 1000.0
+        m.fs.slack.setub(0)
+
+        A = m.fs.input["a"]
+        B = m.fs.input["b"]
+        sweep_params = {
+            A.name: SobolSample(A, 0.0, 0.5),
+            B.name: SobolSample(B, 0.0, 0.3),
+        }
+        outputs = {"output_c": m.fs.output["c"], "output_d": m.fs.output["d"]}
+
+        data = []
+        for comm in (MPI.COMM_WORLD, DummyCOMM):
+            ps = ParameterSweep(comm=comm, optimize_function=_analytic_optimization)
+            data.append(
+                ps.parameter_sweep(
+                    m, sweep_params, outputs=outputs, num_samples=10, seed=3
+                )
+            )
+
+        # The points do not depend on the number of ranks
+        assert np.array_equal(data[0], data[1])
+
+        assert np.allclose(
+            data[1][:, :2],
+            low_discrepancy_points(list(sweep_params.values()), 0, 10, seed=3),
+        )
+        assert np.allclose(data[1][:, 2], 2 * data[1][:, 0])
+
+    @pytest.mark.unit
+    def test_resume_requires_checkpoint_dir(self, model):
+        ps = ParameterSweep()
+
+        A = model.fs.input["a"]
+        sweep_params = {A.name: (A, 0.1, 0.9, 3)}
+
+        with pytest.raises(ValueError, match="requires a checkpoint_dir"):
+            ps.parameter_sweep(model, sweep_params, resume=True)
 
     @pytest.mark.requires_idaes_solver
     @pytest.mark.component
@@ -1573,6 +3137,33 @@ def _optimization(m, relax_feasibility=False):
     return results
 
 
+def _analytic_optimization(m):
+    # Solves the test model in closed form so the sweep machinery can be
+    # exercised without an NLP solver
+    m.fs.output["c"].set_value(2 * value(m.fs.input["a"]))
+    m.fs.output["d"].set_value(3 * value(m.fs.input["b"]))
+
+    results = SolverResults()
+    results.solver.status = SolverStatus.ok
+    if all(value(v) <= v.ub for v in m.fs.output.values()):
+        results.solver.termination_condition = TerminationCondition.optimal
+    else:
+        results.solver.termination_condition = TerminationCondition.infeasible
+
+    return results
+
+
+def _hanging_optimization(m):
+    # Stands in for a solver that never returns on the cases with a = 0.5
+    if value(m.fs.input["a"]) == pytest.approx(0.5):
+        time.sleep(60)
+    return _analytic_optimization(m)
+
+
+def _failing_optimization(m):
+    raise RuntimeError("This optimization should not have been called")
+
+
 def _reinitialize(m, slack_penalty=10.0):
     m.fs.slack.setub(None)
     m.fs.slack_penalty.value = slack_penalty
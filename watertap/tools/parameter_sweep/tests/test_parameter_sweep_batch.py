@@ -0,0 +1,158 @@
+###############################################################################
+# WaterTAP Copyright (c) 2021, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National
+# Laboratory, National Renewable Energy Laboratory, and National Energy
+# Technology Laboratory (subject to receipt of any required approvals from
+# the U.S. Dept. of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#
+###############################################################################
+
+import os
+import pytest
+import numpy as np
+
+import watertap.tools.MPI as MPI
+from watertap.tools.MPI.dummy_mpi import DummyCOMM
+from watertap.tools.parameter_sweep import parameter_sweep, LinearSample
+from watertap.tools.parameter_sweep.parameter_sweep_batch import (
+    batch_parameter_sweep,
+    _lpt_schedule,
+)
+from watertap.tools.parameter_sweep.tests.test_parameter_sweep import (
+    _build_model,
+    _analytic_optimization,
+    _get_rank0_path,
+)
+
+# ------------------------------------------------------------------------------
+
+
+def _build_sweep_params(m, num_b=3):
+    A = m.fs.input["a"]
+    B = m.fs.input["b"]
+    return {
+        A.name: LinearSample(A, 0.1, 0.9, 3),
+        B.name: LinearSample(B, 0.0, 0.5, num_b),
+    }
+
+
+def _build_outputs(m):
+    return {
+        "output_c": m.fs.output["c"],
+        "output_d": m.fs.output["d"],
+        "performance": m.fs.performance,
+    }
+
+
+def _build_jobs(tmp_path):
+    return [
+        {
+            "build_model": _build_model,
+            "build_sweep_params": _build_sweep_params,
+            "build_sweep_params_kwargs": {"num_b": num_b},
+            "build_outputs": _build_outputs,
+            "sweep_kwargs": {
+                "optimize_function": _analytic_optimization,
+                "csv_results_file_name": os.path.join(
+                    tmp_path, f"batch_results_{num_b}.csv"
+                ),
+            },
+            "cost": 3 * num_b,
+        }
+        for num_b in (2, 5, 3, 4)
+    ]
+
+
+@pytest.mark.unit
+def test_lpt_schedule():
+    # The most expensive jobs are spread first, the cheaper ones fill up
+    job_groups = _lpt_schedule([2, 7, 3, 5, 4, 1], [1, 1])
+    assert list(job_groups) == [1, 0, 0, 1, 1, 0]
+
+    # A group of two ranks takes on twice the work of a single rank
+    job_groups = _lpt_schedule([4, 4, 4], [2, 1])
+    assert list(job_groups) == [0, 0, 1]
+
+    # Equal costs are assigned round robin
+    job_groups = _lpt_schedule([1, 1, 1, 1], [1, 1, 1])
+    assert list(job_groups) == [0, 1, 2, 0]
+
+
+@pytest.mark.component
+@pytest.mark.parametrize("num_groups", [None, 1])
+def test_batch_parameter_sweep(tmp_path, num_groups):
+    comm = MPI.COMM_WORLD
+    tmp_path = _get_rank0_path(comm, tmp_path)
+
+    jobs = _build_jobs(tmp_path)
+    results = batch_parameter_sweep(jobs, mpi_comm=comm, num_groups=num_groups)
+
+    if comm.Get_rank() != 0:
+        assert results is None
+        return
+
+    assert len(results) == len(jobs)
+    for job, result in zip(jobs, results):
+        # The same results as a sweep of the job on its own
+        m = _build_model()
+        truth = parameter_sweep(
+            m,
+            _build_sweep_params(m, **job["build_sweep_params_kwargs"]),
+            outputs=_build_outputs(m),
+            optimize_function=_analytic_optimization,
+            mpi_comm=DummyCOMM,
+        )
+        assert np.allclose(result, truth, equal_nan=True)
+
+        assert os.path.isfile(job["sweep_kwargs"]["csv_results_file_name"])
+        csv_data = np.genfromtxt(
+            job["sweep_kwargs"]["csv_results_file_name"], delimiter=",", skip_header=1
+        )
+        assert np.allclose(csv_data, truth, equal_nan=True)
+
+
+@pytest.mark.component
+def test_batch_parameter_sweep_multiprocessing(tmp_path):
+    comm = MPI.COMM_WORLD
+    tmp_path = _get_rank0_path(comm, tmp_path)
+
+    jobs = _build_jobs(tmp_path)[:3]
+    results = batch_parameter_sweep(
+        jobs,
+        mpi_comm=comm,
+        parallel_back_end="multiprocessing",
+        number_of_subprocesses=2,
+    )
+
+    if comm.Get_rank() == 0:
+        for job, result in zip(jobs, results):
+            num_b = job["build_sweep_params_kwargs"]["num_b"]
+            assert np.shape(result) == (3 * num_b, 5)
+            assert os.path.isfile(job["sweep_kwargs"]["csv_results_file_name"])
+
+
+@pytest.mark.unit
+def test_batch_parameter_sweep_errors(tmp_path):
+    with pytest.raises(ValueError, match="requires a build_model"):
+        batch_parameter_sweep([{"build_sweep_params": _build_sweep_params}])
+
+    job = {
+        "build_model": _build_model,
+        "build_sweep_params": _build_sweep_params,
+        "sweep_kwargs": {"mpi_comm": DummyCOMM},
+    }
+    with pytest.raises(ValueError, match="cannot set mpi_comm"):
+        batch_parameter_sweep([job])
+
+    with pytest.raises(ValueError):
+        batch_parameter_sweep([{"build_model": _build_model, "cost": -1.0}])
+
+    with pytest.raises(ValueError, match="Unknown parallel_back_end"):
+        batch_parameter_sweep([], parallel_back_end="threads")
+
+    with pytest.raises(ValueError, match="groups of ranks"):
+        batch_parameter_sweep([], num_groups=MPI.COMM_WORLD.Get_size() + 1)
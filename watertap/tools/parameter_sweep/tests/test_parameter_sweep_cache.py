@@ -0,0 +1,127 @@
+###############################################################################
+# WaterTAP Copyright (c) 2021, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National
+# Laboratory, National Renewable Energy Laboratory, and National Energy
+# Technology Laboratory (subject to receipt of any required approvals from
+# the U.S. Dept. of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#
+###############################################################################
+
+import pytest
+import os
+import pyomo.environ as pyo
+
+from pyomo.environ import value
+from watertap.tools.parameter_sweep.sampling_types import LinearSample
+from watertap.tools.parameter_sweep.parameter_sweep_cache import ParameterSweepCache
+from watertap.tools.parameter_sweep.tests.test_parameter_sweep import _build_model
+
+# ------------------------------------------------------------------------------
+
+
+class TestParameterSweepCache:
+    @pytest.fixture
+    def model(self):
+        return _build_model()
+
+    @pytest.fixture
+    def sweep_params(self, model):
+        A = model.fs.input["a"]
+        return {A.name: LinearSample(A, 0.1, 0.9, 3)}
+
+    @pytest.mark.unit
+    def test_store_load(self, model, sweep_params, tmp_path):
+        cache = ParameterSweepCache(str(tmp_path), model, sweep_params)
+        assert os.path.isfile(os.path.join(tmp_path, "case_cache.sqlite"))
+
+        model.fs.input["a"].fix(0.1)
+        model.fs.output["c"].set_value(0.2)
+        model.fs.output["d"].set_value(0.3)
+
+        assert not cache.load([0.1], model)
+        cache.store([0.1], model)
+
+        model.fs.output["c"].set_value(0.9)
+        model.fs.output["d"].set_value(0.9)
+
+        # A second connection, e.g., on another rank, sees the stored case
+        other_cache = ParameterSweepCache(str(tmp_path), model, sweep_params)
+        assert other_cache.load([0.1], model)
+        assert value(model.fs.output["c"]) == pytest.approx(0.2)
+        assert value(model.fs.output["d"]) == pytest.approx(0.3)
+
+        # The fixed sweep parameter is not overwritten
+        model.fs.input["a"].fix(0.5)
+        assert not other_cache.load([0.5], model)
+        assert other_cache.load([0.1], model)
+        assert value(model.fs.input["a"]) == pytest.approx(0.5)
+
+        cache.close()
+        other_cache.close()
+
+    @pytest.mark.unit
+    def test_model_fingerprint(self, model, sweep_params):
+        exclude = [item.pyomo_object for item in sweep_params.values()]
+        fingerprint = ParameterSweepCache.model_fingerprint(model, exclude)
+
+        # Changing the sweep parameter or the starting point does not matter
+        model.fs.input["a"].fix(0.3)
+        model.fs.output["c"].set_value(0.7)
+        assert ParameterSweepCache.model_fingerprint(model, exclude) == fingerprint
+
+        # Other fixed values, parameters and constraints do
+        model.fs.input["b"].fix(0.3)
+        assert ParameterSweepCache.model_fingerprint(model, exclude) != fingerprint
+        model.fs.input["b"].unfix()
+        assert ParameterSweepCache.model_fingerprint(model, exclude) == fingerprint
+
+        model.fs.slack_penalty = 10.0
+        assert ParameterSweepCache.model_fingerprint(model, exclude) != fingerprint
+        model.fs.slack_penalty = 1000.0
+
+        model.fs.ab_constr.deactivate()
+        assert ParameterSweepCache.model_fingerprint(model, exclude) != fingerprint
+
+    @pytest.mark.unit
+    def test_solver_fingerprint(self):
+        def _optimize(m, tee=False):
+            pass
+
+        fingerprint = ParameterSweepCache.solver_fingerprint(_optimize, {"tee": False})
+        assert fingerprint == ParameterSweepCache.solver_fingerprint(
+            _optimize, {"tee": False}
+        )
+        assert fingerprint != ParameterSweepCache.solver_fingerprint(
+            _optimize, {"tee": True}
+        )
+        assert fingerprint != ParameterSweepCache.solver_fingerprint(
+            pyo.value, {"tee": False}
+        )
+
+    @pytest.mark.unit
+    def test_solver_fingerprint_solver_objects(self):
+        def _optimize(m, solver=None):
+            pass
+
+        # Solvers are identified by their name and options, not their identity
+        fingerprint = ParameterSweepCache.solver_fingerprint(
+            _optimize, {"solver": pyo.SolverFactory("ipopt")}
+        )
+        solver = pyo.SolverFactory("ipopt")
+        assert fingerprint == ParameterSweepCache.solver_fingerprint(
+            _optimize, {"solver": solver}
+        )
+        solver.options["tol"] = 1e-6
+        assert fingerprint != ParameterSweepCache.solver_fingerprint(
+            _optimize, {"solver": solver}
+        )
+
+        # An option without a stable representation cannot be cached
+        with pytest.raises(
+            ValueError, match=r"optimize_kwargs\['data'\] of type object"
+        ):
+            ParameterSweepCache.solver_fingerprint(_optimize, {"data": object()})
@@ -0,0 +1,220 @@
+###############################################################################
+# WaterTAP Copyright (c) 2021, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National
+# Laboratory, National Renewable Energy Laboratory, and National Energy
+# Technology Laboratory (subject to receipt of any required approvals from
+# the U.S. Dept. of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#
+###############################################################################
+
+import pytest
+import sys
+import warnings
+import numpy as np
+
+import pyomo.environ as pyo
+
+from pyomo.environ import value
+from watertap.tools.parameter_sweep.sampling_types import LinearSample
+from watertap.tools.parameter_sweep.parameter_sweep_predictor import (
+    MissingDualsError,
+    ParameterSweepPredictor,
+    kkt_sensitivity_available,
+)
+from watertap.tools.parameter_sweep.tests.test_parameter_sweep import (
+    _build_model,
+    _analytic_optimization,
+)
+
+# ------------------------------------------------------------------------------
+
+
+class TestParameterSweepPredictor:
+    @pytest.fixture
+    def model(self):
+        m = _build_model()
+        m.fs.slack.setub(0)
+        return m
+
+    @pytest.fixture
+    def sweep_params(self, model):
+        A = model.fs.input["a"]
+        B = model.fs.input["b"]
+        return {
+            A.name: LinearSample(A, 0.1, 0.3, 3),
+            B.name: LinearSample(B, 0, 0.2, 2),
+        }
+
+    def _solve(self, model, point):
+        model.fs.input["a"].fix(point[0])
+        model.fs.input["b"].fix(point[1])
+        _analytic_optimization(model)
+
+    @pytest.mark.unit
+    def test_secant(self, model, sweep_params):
+        predictor = ParameterSweepPredictor(model, sweep_params, use_kkt=False)
+        assert len(predictor) == 0
+
+        # Nothing to predict from yet
+        model.fs.output["c"].set_value(0.5)
+        assert not predictor.predict([0.1, 0.0], model)
+        assert value(model.fs.output["c"]) == 0.5
+
+        self._solve(model, [0.1, 0.0])
+        predictor.add([0.1, 0.0], model)
+
+        # A single case gives a zeroth order prediction
+        model.fs.input["a"].fix(0.15)
+        assert predictor.predict([0.15, 0.0], model)
+        assert value(model.fs.output["c"]) == pytest.approx(0.2)
+
+        self._solve(model, [0.15, 0.0])
+        predictor.add([0.15, 0.0], model)
+        self._solve(model, [0.15, 0.1])
+        predictor.add([0.15, 0.1], model)
+        assert len(predictor) == 3
+
+        # The outputs are linear in the parameters, so the secant is exact
+        assert predictor.predict([0.2, 0.15], model)
+        assert value(model.fs.output["c"]) == pytest.approx(0.4)
+        assert value(model.fs.output["d"]) == pytest.approx(0.45)
+
+        # The prediction is projected onto the bounds
+        model.fs.output["d"].setub(0.5)
+        assert predictor.predict([0.15, 0.3], model)
+        assert value(model.fs.output["d"]) == pytest.approx(0.5)
+        model.fs.output["d"].setub(1)
+
+        # Only the last num_params + 1 cases are kept
+        self._solve(model, [0.2, 0.1])
+        predictor.add([0.2, 0.1], model)
+        assert len(predictor) == 3
+
+    @pytest.mark.unit
+    def test_secant_long_step(self, model, sweep_params):
+        predictor = ParameterSweepPredictor(model, sweep_params, use_kkt=False)
+
+        for point in ([0.1, 0.0], [0.1, 0.01]):
+            self._solve(model, point)
+            predictor.add(point, model)
+
+        # A jump much longer than the steps between the stored cases is not
+        # extrapolated
+        model.fs.output["d"].set_value(0.7)
+        assert not predictor.predict([0.1, 0.5], model)
+        assert value(model.fs.output["d"]) == 0.7
+
+        assert predictor.predict([0.1, 0.02], model)
+        assert value(model.fs.output["d"]) == pytest.approx(0.06)
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(
+        not kkt_sensitivity_available(), reason="PyNumero ASL is not available"
+    )
+    def test_kkt_sensitivity(self, model, sweep_params):
+        predictor = ParameterSweepPredictor(model, sweep_params, use_kkt=True)
+
+        self._solve(model, [0.1, 0.1])
+        sensitivity = predictor.kkt_sensitivity(model)
+
+        # The sweep parameters are left fixed
+        assert model.fs.input["a"].fixed
+        assert model.fs.input["b"].fixed
+
+        column = {v.name: i for i, v in enumerate(predictor.variables)}
+        assert sensitivity[column["fs.output[c]"], :] == pytest.approx([2.0, 0.0])
+        assert sensitivity[column["fs.output[d]"], :] == pytest.approx([0.0, 3.0])
+        # The slacks are at their bounds
+        assert sensitivity[column["fs.slack[ab_slack]"], :] == pytest.approx([0, 0])
+
+        # The NLP is only built once
+        nlp = predictor._nlp
+        predictor.add([0.1, 0.1], model)
+        assert predictor._nlp is nlp
+        assert predictor.predict([0.2, 0.15], model)
+        assert value(model.fs.output["c"]) == pytest.approx(0.4)
+        assert value(model.fs.output["d"]) == pytest.approx(0.45)
+
+    @pytest.mark.unit
+    def test_dual_suffix(self, model, sweep_params):
+        ParameterSweepPredictor(model, sweep_params, use_kkt=False)
+        assert model.component("dual") is None
+
+        # The duals are imported from the solves for the KKT sensitivity
+        ParameterSweepPredictor(model, sweep_params, use_kkt=True)
+        assert isinstance(model.dual, pyo.Suffix)
+        assert model.dual.import_enabled()
+
+    @pytest.mark.unit
+    def test_param_sweep_parameters(self, model, monkeypatch):
+        P = model.fs.slack_penalty
+        sweep_params = {P.name: LinearSample(P, 10, 20, 2)}
+
+        with pytest.raises(ValueError, match="requires every sweep parameter"):
+            ParameterSweepPredictor(model, sweep_params, use_kkt=True)
+
+        # Even if PyNumero is available, the secant is used, with a warning
+        monkeypatch.setattr(
+            sys.modules[ParameterSweepPredictor.__module__],
+            "kkt_sensitivity_available",
+            lambda: True,
+        )
+        with pytest.warns(UserWarning, match="secant predictor is used"):
+            predictor = ParameterSweepPredictor(model, sweep_params)
+        assert not predictor.use_kkt
+        assert model.component("dual") is None
+
+    @pytest.mark.unit
+    def test_kkt_sensitivity_failure(self, model, sweep_params, monkeypatch):
+        predictor = ParameterSweepPredictor(model, sweep_params, use_kkt=True)
+        self._solve(model, [0.1, 0.1])
+
+        def _failing_sensitivity(model):
+            raise KeyError("boom")
+
+        monkeypatch.setattr(predictor, "kkt_sensitivity", _failing_sensitivity)
+        with pytest.warns(UserWarning, match="KKT sensitivity failed: 'boom'"):
+            predictor.add([0.1, 0.1], model)
+        assert predictor._sensitivity is None
+
+        # A singular KKT matrix falls back to the secant without a warning
+        def _singular_sensitivity(model):
+            raise np.linalg.LinAlgError("The KKT matrix is singular.")
+
+        monkeypatch.setattr(predictor, "kkt_sensitivity", _singular_sensitivity)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            predictor.add([0.1, 0.1], model)
+        assert predictor._sensitivity is None
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(
+        not kkt_sensitivity_available(), reason="PyNumero ASL is not available"
+    )
+    def test_kkt_sensitivity_duals(self):
+        # The solution x = y = sqrt(p) depends on the curvature of x * y
+        m = pyo.ConcreteModel()
+        m.p = pyo.Var(initialize=4.0)
+        m.p.fix()
+        m.x = pyo.Var(initialize=2.0)
+        m.y = pyo.Var(initialize=2.0)
+        m.c = pyo.Constraint(expr=m.x * m.y == m.p)
+        m.objective = pyo.Objective(expr=m.x**2 + m.y**2)
+
+        sweep_params = {m.p.name: LinearSample(m.p, 4.0, 5.0, 2)}
+        predictor = ParameterSweepPredictor(m, sweep_params, use_kkt=True)
+
+        # The solver loaded no duals
+        with pytest.raises(MissingDualsError):
+            predictor.kkt_sensitivity(m)
+        with pytest.warns(UserWarning, match="secant predictor"):
+            predictor.add([4.0], m)
+        assert predictor._sensitivity is None
+
+        m.dual[m.c] = -2.0
+        sensitivity = predictor.kkt_sensitivity(m)
+        assert sensitivity[:, 0] == pytest.approx([0.25, 0.25])
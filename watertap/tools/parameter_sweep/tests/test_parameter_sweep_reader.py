@@ -21,8 +21,11 @@ from pyomo.environ import value
 
 from watertap.tools.parameter_sweep.parameter_sweep_reader import (
     ParameterSweepReader,
+    ComponentNameIndex,
     get_sweep_params_from_yaml,
+    get_outputs_from_yaml,
     set_defaults_from_yaml,
+    select_outputs,
 )
 
 # Imports for conditional fails
@@ -91,6 +94,25 @@ class TestInputParser:
                 "upper_limit": 10,
                 "num_samples": 3,
             },
+            "h_val": {
+                "type": "SobolSample",
+                "param": "fs.a",
+                "lower_limit": 1,
+                "upper_limit": 10,
+            },
+            "i_val": {
+                "type": "HaltonSample",
+                "param": "fs.a",
+                "lower_limit": 1,
+                "upper_limit": 10,
+            },
+            "g_val": {
+                "type": "AdaptiveSample",
+                "param": "fs.a",
+                "lower_limit": 1,
+                "upper_limit": 10,
+                "num_samples": 3,
+            },
         }
 
         with open(filename, "w") as fp:
@@ -196,3 +218,108 @@ class TestInputParser:
             psr.set_defaults_from_yaml(m, filename)
 
         os.remove(filename)
+
+
+class TestOutputSelection:
+    @pytest.fixture(scope="class")
+    def model(self):
+        m = pyo.ConcreteModel()
+        m.fs = pyo.Block()
+        for unit in ("RO", "P1", "P2"):
+            b = pyo.Block()
+            m.fs.add_component(unit, b)
+            b.costing = pyo.Block()
+            b.costing.capital_cost = pyo.Var(initialize=1.0)
+            b.flux = pyo.Var([1, 2], ["H2O", "NaCl"], initialize=0.1)
+        m.fs.LCOW = pyo.Expression(expr=m.fs.RO.costing.capital_cost + 1)
+        m.fs.inactive = pyo.Objective(expr=m.fs.LCOW)
+        m.fs.inactive.deactivate()
+        m.fs.p = pyo.Param(initialize=1.0, mutable=True)
+
+        return m
+
+    @pytest.mark.unit
+    def test_component_name_index(self, model):
+        index = ComponentNameIndex(model)
+
+        # Params and inactive components are not indexed
+        assert "fs.p" not in index.names
+        assert "fs.inactive" not in index.names
+
+        names = [name for name, _ in index.select("fs.*.costing.capital_cost")]
+        assert names == [
+            "fs.RO.costing.capital_cost",
+            "fs.P1.costing.capital_cost",
+            "fs.P2.costing.capital_cost",
+        ]
+
+        # Square brackets are literal
+        names = [name for name, _ in index.select("fs.RO.flux[*]")]
+        assert names == [
+            "fs.RO.flux[1,H2O]",
+            "fs.RO.flux[1,NaCl]",
+            "fs.RO.flux[2,H2O]",
+            "fs.RO.flux[2,NaCl]",
+        ]
+        names = [name for name, _ in index.select("fs.P?.flux[2,NaCl]")]
+        assert names == ["fs.P1.flux[2,NaCl]", "fs.P2.flux[2,NaCl]"]
+
+        names = [name for name, _ in index.select(r"re:fs\.RO\.flux\[1,.*\]")]
+        assert names == ["fs.RO.flux[1,H2O]", "fs.RO.flux[1,NaCl]"]
+
+        assert index.select("fs.LCOW") == [("fs.LCOW", model.fs.LCOW)]
+        assert index.select("fs.RO.flux") == []
+        assert index.select("fs.RO.costing") == []
+
+    @pytest.mark.unit
+    def test_select_outputs(self, model):
+        outputs = select_outputs(model, "fs.*.flux[2,H2O]")
+        assert outputs == {
+            "fs.RO.flux[2,H2O]": model.fs.RO.flux[2, "H2O"],
+            "fs.P1.flux[2,H2O]": model.fs.P1.flux[2, "H2O"],
+            "fs.P2.flux[2,H2O]": model.fs.P2.flux[2, "H2O"],
+        }
+
+        # Components matched by several patterns are kept once
+        outputs = select_outputs(model, ["fs.LCOW", "fs.L*", model.fs.p])
+        assert outputs == {"fs.LCOW": model.fs.LCOW, "fs.p": model.fs.p}
+
+        outputs = select_outputs(
+            model,
+            {
+                "LCOW": "fs.LCOW",
+                "capital_cost": "fs.P*.costing.capital_cost",
+                "p": model.fs.p,
+            },
+        )
+        assert outputs == {
+            "LCOW": model.fs.LCOW,
+            "fs.P1.costing.capital_cost": model.fs.P1.costing.capital_cost,
+            "fs.P2.costing.capital_cost": model.fs.P2.costing.capital_cost,
+            "p": model.fs.p,
+        }
+
+        with pytest.raises(ValueError, match="fs.X.* does not match any component"):
+            select_outputs(model, ["fs.LCOW", "fs.X.*"])
+
+    @pytest.mark.unit
+    def test_get_outputs_from_yaml(self, model, tmp_path):
+        filename = os.path.join(tmp_path, "outputs.yaml")
+
+        with open(filename, "w") as fp:
+            yaml.dump(["fs.RO.costing.*", "re:fs\\.P1\\.flux\\[1,.*"], fp)
+        outputs = get_outputs_from_yaml(model, filename)
+        assert list(outputs) == [
+            "fs.RO.costing.capital_cost",
+            "fs.P1.flux[1,H2O]",
+            "fs.P1.flux[1,NaCl]",
+        ]
+
+        with open(filename, "w") as fp:
+            yaml.dump({"LCOW": "fs.LCOW", "flux": "fs.P2.flux[1,*]"}, fp)
+        outputs = ParameterSweepReader().get_outputs_from_yaml(model, filename)
+        assert outputs == {
+            "LCOW": model.fs.LCOW,
+            "fs.P2.flux[1,H2O]": model.fs.P2.flux[1, "H2O"],
+            "fs.P2.flux[1,NaCl]": model.fs.P2.flux[1, "NaCl"],
+        }
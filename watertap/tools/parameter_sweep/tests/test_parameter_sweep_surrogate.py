@@ -0,0 +1,132 @@
+###############################################################################
+# WaterTAP Copyright (c) 2021, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National
+# Laboratory, National Renewable Energy Laboratory, and National Energy
+# Technology Laboratory (subject to receipt of any required approvals from
+# the U.S. Dept. of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#
+###############################################################################
+
+import os
+import pytest
+import numpy as np
+
+from watertap.tools.parameter_sweep import ParameterSweepSurrogate
+
+# ------------------------------------------------------------------------------
+
+
+def _quadratic(x):
+    return np.column_stack(
+        (1.0 + 2.0 * x[:, 0] - x[:, 1] + x[:, 0] * x[:, 1], 3.0 * x[:, 1] ** 2)
+    )
+
+
+class TestParameterSweepSurrogate:
+    @pytest.fixture
+    def cases(self):
+        x = np.random.default_rng(0).uniform([0, 10], [1, 20], size=(60, 2))
+        return x, _quadratic(x)
+
+    @pytest.mark.unit
+    def test_polynomial(self, cases, tmp_path):
+        x, y = cases
+
+        surrogate = ParameterSweepSurrogate(degree=2).fit(
+            x, y, input_names=["a", "b"], output_names=["c", "d"], seed=1
+        )
+
+        # A quadratic is fitted exactly
+        assert list(surrogate.validation_error) == ["c", "d"]
+        for error in surrogate.validation_error.values():
+            assert error["rmse"] == pytest.approx(0, abs=1e-8)
+            assert error["max_abs_error"] == pytest.approx(0, abs=1e-8)
+            assert error["r2"] == pytest.approx(1)
+
+        points = np.random.default_rng(2).uniform([0, 10], [1, 20], size=(1000, 2))
+        assert surrogate.predict(points) == pytest.approx(_quadratic(points))
+        assert surrogate.predict(points, chunk_size=7) == pytest.approx(
+            _quadratic(points)
+        )
+
+        # A single point gives a single row
+        assert surrogate.predict(points[0]).shape == (1, 2)
+        with pytest.raises(ValueError, match="with 2 sweep parameters"):
+            surrogate.predict(np.ones((3, 3)))
+
+        file_name = os.path.join(tmp_path, "surrogate.npz")
+        surrogate.save(file_name)
+        loaded = ParameterSweepSurrogate.load(file_name)
+
+        assert loaded.method == "polynomial"
+        assert loaded.input_names == ["a", "b"]
+        assert loaded.output_names == ["c", "d"]
+        assert loaded.validation_error == surrogate.validation_error
+        assert np.array_equal(loaded.predict(points), surrogate.predict(points))
+
+    @pytest.mark.unit
+    def test_polynomial_too_few_cases(self, cases):
+        x, y = cases
+        with pytest.raises(ValueError, match="needs at least 6 cases, got 5"):
+            ParameterSweepSurrogate(degree=2).fit(x[:5], y[:5], validation_fraction=0)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("kernel", sorted(ParameterSweepSurrogate.kernels))
+    def test_rbf(self, cases, kernel, tmp_path):
+        x, y = cases
+
+        surrogate = ParameterSweepSurrogate(method="rbf", kernel=kernel).fit(
+            x, y[:, 0], validation_fraction=0.25, seed=1
+        )
+        assert surrogate.output_names == ["y0"]
+        assert surrogate.validation_error["y0"]["r2"] > 0.9
+
+        # Without smoothing the fitted cases are interpolated
+        assert surrogate.predict(x)[:, 0] == pytest.approx(y[:, 0])
+
+        file_name = os.path.join(tmp_path, "surrogate.npz")
+        surrogate.save(file_name)
+        loaded = ParameterSweepSurrogate.load(file_name)
+        assert loaded.kernel == kernel
+        assert np.array_equal(loaded.predict(x), surrogate.predict(x))
+
+    @pytest.mark.unit
+    def test_from_results(self, cases):
+        x, y = cases
+        y[3, 1] = np.nan
+        results = {
+            "sweep_params": {"a": {"value": x[:, 0]}, "b": {"value": x[:, 1]}},
+            "outputs": {
+                "c": {"value": y[:, 0] + np.where(np.arange(60) == 5, 100.0, 0.0)},
+                "d": {"value": y[:, 1]},
+            },
+            "solve_successful": [k != 5 for k in range(60)],
+        }
+
+        # The failed and NaN cases are not fitted
+        surrogate = ParameterSweepSurrogate.from_results(results, seed=0)
+        assert surrogate.input_names == ["a", "b"]
+        assert surrogate.output_names == ["c", "d"]
+        assert surrogate.predict(x[5]) == pytest.approx(_quadratic(x[5:6]))
+
+        surrogate = ParameterSweepSurrogate.from_results(
+            results, outputs=["d"], method="rbf", validation_fraction=0
+        )
+        assert surrogate.output_names == ["d"]
+        assert surrogate.validation_error == {}
+
+        with pytest.raises(KeyError, match="e is not an output"):
+            ParameterSweepSurrogate.from_results(results, outputs=["e"])
+
+    @pytest.mark.unit
+    def test_bad_options(self):
+        with pytest.raises(ValueError, match="Unknown surrogate method"):
+            ParameterSweepSurrogate(method="kriging")
+        with pytest.raises(ValueError, match="Unknown RBF kernel"):
+            ParameterSweepSurrogate(method="rbf", kernel="quintic")
+        with pytest.raises(RuntimeError, match="has not been fitted"):
+            ParameterSweepSurrogate().predict(np.ones((1, 2)))
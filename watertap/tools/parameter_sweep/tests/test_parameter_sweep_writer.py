@@ -13,11 +13,14 @@
 
 import pytest
 import os
+import h5py
 import numpy as np
 import pyomo.environ as pyo
 import warnings, copy
+import itertools
 
 from pyomo.environ import value
+from scipy.interpolate import griddata
 from watertap.tools.parameter_sweep.parameter_sweep import *
 from watertap.tools.parameter_sweep.parameter_sweep_writer import *
 from watertap.tools.parameter_sweep.tests.test_parameter_sweep import (
@@ -98,6 +101,79 @@ class TestParallelWriterManager:
         assert (global_results_clean[8]) == pytest.approx(np.mean(global_results[0:8]))
         assert (global_results_clean[9]) == pytest.approx(global_results[7])
 
+    @pytest.mark.unit
+    def test_interp_nan_values_idw(self):
+        corners = np.array(list(itertools.product([0, 1], repeat=3)), dtype=float)
+        global_values = np.vstack((corners, [[0.5, 0.5, 0.5], [1, 1, 1], [0, 0, 0.2]]))
+
+        # Two outputs, failed in the same cases
+        global_results = np.column_stack(
+            (np.arange(11, dtype=float), 10 * np.arange(11, dtype=float))
+        )
+        global_results[8:, :] = np.nan
+
+        global_results_clean = ParameterSweepWriter._interp_nan_values(
+            global_values, global_results, method="idw", num_neighbors=8
+        )
+
+        assert np.shape(global_results_clean) == np.shape(global_results)
+        assert np.array_equal(global_results_clean[:8], global_results[:8])
+
+        # Equally far from all the corners
+        assert global_results_clean[8] == pytest.approx([3.5, 35.0])
+        # A solved point is reproduced
+        assert global_results_clean[9] == pytest.approx([7.0, 70.0])
+        # Closest to the first corner
+        assert global_results_clean[10, 1] == pytest.approx(
+            10 * global_results_clean[10, 0]
+        )
+        assert 0 < global_results_clean[10, 0] < 3.5
+
+    @pytest.mark.unit
+    def test_interp_nan_values_linear(self):
+        # All outputs are interpolated at once, like separate calls to griddata
+        rng = np.random.default_rng(1)
+        global_values = rng.uniform(size=(40, 2))
+        global_results = np.column_stack(
+            (
+                global_values[:, 0] + 2 * global_values[:, 1],
+                global_values[:, 0] * global_values[:, 1],
+            )
+        )
+        global_results[::4, :] = np.nan
+
+        global_results_clean = ParameterSweepWriter._interp_nan_values(
+            global_values, global_results
+        )
+
+        mask = np.isfinite(global_results[:, 0])
+        for k in range(2):
+            expected = griddata(
+                global_values[mask],
+                global_results[mask, k],
+                global_values[~mask],
+                method="linear",
+                rescale=True,
+            )
+            assert np.allclose(global_results_clean[~mask, k], expected, equal_nan=True)
+        # The first output is linear, so it is exact inside the convex hull
+        inside = np.isfinite(global_results_clean[:, 0])
+        assert np.allclose(
+            global_results_clean[inside, 0],
+            global_values[inside, 0] + 2 * global_values[inside, 1],
+        )
+
+        # A single sweep parameter
+        global_values = np.linspace(0, 1, 6)[:, np.newaxis]
+        global_results = 3 * global_values
+        global_results[[0, 2], 0] = np.nan
+
+        global_results_clean = ParameterSweepWriter._interp_nan_values(
+            global_values, global_results
+        )
+        assert np.isnan(global_results_clean[0, 0])
+        assert global_results_clean[2, 0] == pytest.approx(1.2)
+
     @pytest.mark.unit
     def test_h5_read_write(self, tmp_path):
         ps = ParameterSweep()
@@ -177,3 +253,91 @@ class TestParallelWriterManager:
 
         read_dictionary = _read_output_h5(os.path.join(tmp_path, h5_fname))
         _assert_dictionary_correctness(reference_dict, read_dictionary)
+
+    @pytest.mark.unit
+    def test_h5_storage_options(self, tmp_path):
+        ps = ParameterSweep()
+
+        tmp_path = _get_rank0_path(ps.comm, tmp_path)
+        h5_fname = os.path.join(tmp_path, "h5_storage_{0}.h5".format(ps.rank))
+
+        ps_writer = ParameterSweepWriter(
+            ps.comm,
+            h5_results_file_name=h5_fname,
+            h5_dtype="float32",
+            h5_compression="gzip",
+            h5_compression_level=9,
+            h5_store_constant_once=True,
+            h5_output_storage={
+                "fs.output[c]": {"dtype": "float64", "compression": None},
+                "fs.output[d]": {"store_constant_once": False},
+            },
+        )
+
+        input_dict = {
+            "outputs": {
+                "fs.output[c]": {
+                    "units": "None",
+                    "value": np.array([0.2, 0.2, 0.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.1]),
+                },
+                "fs.output[d]": {"units": "None", "value": np.full(9, 0.75)},
+                "fs.slack[ab_slack]": {"units": "None", "value": np.full(9, 0.1)},
+                "fs.slack[cd_slack]": {"units": "None", "value": np.full(9, np.nan)},
+                "fs.performance": {
+                    "units": "None",
+                    "value": np.array(
+                        [0.5, np.nan, np.nan, 0.5, 0.5, np.nan] + [0.5] * 3
+                    ),
+                },
+            },
+            "solve_successful": [True] * 9,
+            "sweep_params": {
+                "fs.input[a]": {
+                    "units": "None",
+                    "value": np.array([0.1, 0.1, 0.0, 0.5, 0.5, 0.0, 0.0, 0.0, 0.0]),
+                },
+            },
+        }
+
+        ps_writer._write_output_to_h5(input_dict, h5_fname)
+
+        with h5py.File(h5_fname, "r") as f:
+            values = {
+                key: f[f"{group}/{key}/value"]
+                for group in ("outputs", "sweep_params")
+                for key in f[group]
+            }
+
+            # The overrides take precedence over the global options
+            assert values["fs.output[c]"].dtype == np.float64
+            assert values["fs.output[c]"].compression is None
+            assert values["fs.input[a]"].dtype == np.float32
+            assert values["fs.input[a]"].compression == "gzip"
+            assert values["fs.input[a]"].compression_opts == 9
+
+            # Constant values are not allocated, unless overridden
+            assert values["fs.output[d]"].id.get_storage_size() > 0
+            assert values["fs.slack[ab_slack]"].id.get_storage_size() == 0
+            assert values["fs.slack[cd_slack]"].id.get_storage_size() == 0
+            # A constant with failed cases keeps its NaN values
+            assert values["fs.performance"].fillvalue == np.float32(0.5)
+
+            for group in ("outputs", "sweep_params"):
+                for key, item in input_dict[group].items():
+                    assert values[key].shape == (9,)
+                    assert np.allclose(
+                        values[key][()], item["value"], rtol=1e-6, equal_nan=True
+                    )
+
+        with pytest.raises(ValueError):
+            ParameterSweepWriter(
+                ps.comm,
+                h5_results_file_name=h5_fname,
+                h5_output_storage={"fs.output[c]": {"chunks": True}},
+            )
+        with pytest.raises(ValueError):
+            ParameterSweepWriter(
+                ps.comm,
+                h5_results_file_name=h5_fname,
+                h5_output_storage={"fs.output[c]": {"dtype": "float16"}},
+            )
@@ -25,7 +25,10 @@ from watertap.tools.parameter_sweep import (
     recursive_parameter_sweep,
 )
 from watertap.tools.parameter_sweep.parameter_sweep_writer import *
+from watertap.tools.parameter_sweep.parameter_sweep import _knn_success_fraction
 from watertap.tools.parameter_sweep.tests.test_parameter_sweep import (
+    _build_model,
+    _analytic_optimization,
     _read_output_h5,
     _get_rank0_path,
     _assert_dictionary_correctness,
@@ -453,3 +456,80 @@ def test_recursive_parameter_sweep_function(model, tmp_path):
             f_contents = f.read()
             read_txt_dict = ast.literal_eval(f_contents)
         assert read_txt_dict == truth_txt_dict
+
+
+@pytest.mark.unit
+def test_knn_success_fraction():
+
+    values = np.array([[0.0, 0.0], [0.1, 0.0], [1.0, 10.0], [0.9, 10.0]])
+    solve_successful = [True, True, False, True]
+    candidates = np.array([[0.05, 0.0], [0.97, 10.0], [1.0, 9.0]])
+
+    # The parameters are compared relative to their range
+    frac = _knn_success_fraction(values, solve_successful, candidates, 2)
+    assert frac == pytest.approx([1.0, 0.5, 0.5])
+
+    frac = _knn_success_fraction(values, solve_successful, candidates, 1)
+    assert frac == pytest.approx([1.0, 0.0, 0.0])
+
+    # More neighbors than cases uses every case
+    frac = _knn_success_fraction(values, solve_successful, candidates, 10)
+    assert frac == pytest.approx([0.75, 0.75, 0.75])
+
+
+@pytest.mark.component
+def test_recursive_parameter_sweep_failure_screening():
+
+    # The cases with a > 0.5 are infeasible
+    solve_count = {}
+
+    def _counting_optimization(m, screening):
+        solve_count[screening] = solve_count.get(screening, 0) + 1
+        return _analytic_optimization(m)
+
+    data = {}
+    for screening in (False, True):
+        m = _build_model()
+        m.fs.input["b"].fix(0.1)
+
+        ps = RecursiveParameterSweep(
+            optimize_function=_counting_optimization,
+            optimize_kwargs={"screening": screening},
+            failure_screening=screening,
+        )
+
+        data[screening] = ps.parameter_sweep(
+            m,
+            {"fs.input[a]": UniformSample(m.fs.input["a"], 0.0, 1.0)},
+            outputs={"fs.output[c]": m.fs.output["c"]},
+            req_num_samples=20,
+            seed=1,
+        )
+
+    for screening in (False, True):
+        assert np.shape(data[screening]) == (20, 2)
+        assert np.all(data[screening][:, 0] <= 0.5)
+
+    # Fewer of the infeasible cases are attempted
+    assert solve_count[True] < solve_count[False]
+
+
+@pytest.mark.unit
+def test_recursive_parameter_sweep_unsupported_options(tmp_path):
+    m = _build_model()
+    sweep_params = {"fs.input[a]": UniformSample(m.fs.input["a"], 0.0, 1.0)}
+
+    ps = RecursiveParameterSweep(
+        optimize_function=_analytic_optimization,
+        checkpoint_dir=str(tmp_path),
+    )
+    with pytest.raises(ValueError, match="Checkpointing is not supported"):
+        ps.parameter_sweep(m, sweep_params, req_num_samples=10, seed=1)
+
+    ps = RecursiveParameterSweep(
+        optimize_function=_analytic_optimization,
+        h5_results_file_name=os.path.join(tmp_path, "recursive_results.h5"),
+        h5_streaming=True,
+    )
+    with pytest.raises(ValueError, match="Streaming the results is not supported"):
+        ps.parameter_sweep(m, sweep_params, req_num_samples=10, seed=1)